@@ -4,16 +4,43 @@ Demonstrates all the improvements based on the old API patterns
 """
 
 import asyncio
+import json
 import os
+import sys
+import time
+from collections import deque
 from datetime import datetime
 from loguru import logger
 
 from pocketoptionapi_async import AsyncPocketOptionClient
 
+# Complete SSID used by the demos, parsed once for every client
+SSID = r'42["auth",{"session":"n1p5ah5u8t9438rbunpgrq0hlq","isDemo":1,"uid":72645361,"platform":1,"isFastHistory":true}]'
+_AUTH_PAYLOAD = json.loads(SSID[SSID.index("{") : SSID.rindex("}") + 1])
+
+
+async def _stats_printer(client: AsyncPocketOptionClient, interval: float):
+    """Periodically print connection stats until cancelled"""
+    elapsed = 0
+    while True:
+        await asyncio.sleep(interval)
+        elapsed += interval
+        stats = client.get_connection_stats()
+        print(
+            f"   Data: [{elapsed}s] Connected: {client.is_connected}, "
+            f"Messages sent: {stats.get('messages_sent', 0)}, "
+            f"Reconnects: {stats.get('total_reconnects', 0)}"
+        )
+
 
 async def demo_enhanced_features():
     """Comprehensive demo of all enhanced features"""
 
+    # Warn about any callback that blocks the event loop for more than 50ms
+    loop = asyncio.get_running_loop()
+    loop.set_debug(True)
+    loop.slow_callback_duration = 0.05
+
     print("Starting PocketOption Enhanced API Demo")
     print("=" * 60)
     print("Demonstrating all enhancements based on old API patterns:")
@@ -29,9 +56,8 @@ async def demo_enhanced_features():
     print()
 
     # Complete SSID format (as requested)
-    ssid = r'42["auth",{"session":"n1p5ah5u8t9438rbunpgrq0hlq","isDemo":1,"uid":72645361,"platform":1,"isFastHistory":true}]'
     print("Authentication: Using complete SSID format:")
-    print(f"   {ssid[:80]}...")
+    print(f"   {SSID[:80]}...")
     print()
 
     # Demo 1: Basic Enhanced Client
@@ -40,7 +66,7 @@ async def demo_enhanced_features():
 
     try:
         # Create client with complete SSID (as user requested)
-        client = AsyncPocketOptionClient(ssid=ssid, is_demo=True)
+        client = AsyncPocketOptionClient.from_parsed(_AUTH_PAYLOAD, is_demo=True)
 
         print("Success: Client created with parsed components:")
         print(f"   Session ID: {getattr(client, 'session_id', 'N/A')[:20]}...")
@@ -78,37 +104,30 @@ async def demo_enhanced_features():
 
     try:
         # Create client with persistent connection enabled
-        persistent_client = AsyncPocketOptionClient(
-            ssid=ssid,
+        persistent_client = AsyncPocketOptionClient.from_parsed(
+            _AUTH_PAYLOAD,
             is_demo=True,
             persistent_connection=True,  # Enable keep-alive like old API
             auto_reconnect=True,
         )
 
         # Add event handlers to monitor connection events
-        events_log = []
+        # Events are stored raw and only formatted when the log is printed
+        events_log = deque(maxlen=1024)
+        t0_wall = time.time()
+        t0_ns = time.monotonic_ns()
 
         def on_connected(data):
-            events_log.append(
-                f"CONNECTED: {datetime.now().strftime('%H:%M:%S')} - {data}"
-            )
-            print(
-                f"Successfully: Event: Connected at {datetime.now().strftime('%H:%M:%S')}"
-            )
+            events_log.append((time.monotonic_ns(), "CONNECTED", data))
+            print("Successfully: Event: Connected")
 
         def on_reconnected(data):
-            events_log.append(
-                f"RECONNECTED: {datetime.now().strftime('%H:%M:%S')} - {data}"
-            )
-            print(
-                f"Reconnection: Event: Reconnected at {datetime.now().strftime('%H:%M:%S')}"
-            )
+            events_log.append((time.monotonic_ns(), "RECONNECTED", data))
+            print("Reconnection: Event: Reconnected")
 
         def on_authenticated(data):
-            events_log.append(f"AUTHENTICATED: {datetime.now().strftime('%H:%M:%S')}")
-            print(
-                f"Success: Event: Authenticated at {datetime.now().strftime('%H:%M:%S')}"
-            )
+            events_log.append((time.monotonic_ns(), "AUTHENTICATED", None))
+            print("Success: Event: Authenticated")
 
         persistent_client.add_event_callback("connected", on_connected)
         persistent_client.add_event_callback("reconnected", on_reconnected)
@@ -125,22 +144,24 @@ async def demo_enhanced_features():
                 print("Statistics: Monitoring persistent connection (30 seconds)...")
                 print("   Watch for automatic pings and reconnection attempts...")
 
-                for i in range(30):
-                    await asyncio.sleep(1)
-
-                    # Show stats every 10 seconds
-                    if i % 10 == 0 and i > 0:
-                        stats = persistent_client.get_connection_stats()
-                        print(
-                            f"   Data: [{i}s] Connected: {persistent_client.is_connected}, "
-                            f"Messages sent: {stats.get('messages_sent', 0)}, "
-                            f"Reconnects: {stats.get('total_reconnects', 0)}"
-                        )
+                # Show stats every 10 seconds from a dedicated task
+                printer = asyncio.create_task(
+                    _stats_printer(persistent_client, interval=10)
+                )
+                try:
+                    await asyncio.sleep(30)
+                finally:
+                    printer.cancel()
+                    await asyncio.gather(printer, return_exceptions=True)
 
                 # Show final event log
                 print(f"\nDemonstration: Connection Events ({len(events_log)} total):")
-                for event in events_log:
-                    print(f"   • {event}")
+                for ts_ns, event_type, data in events_log:
+                    event_time = datetime.fromtimestamp(
+                        t0_wall + (ts_ns - t0_ns) / 1e9
+                    ).strftime("%H:%M:%S")
+                    suffix = f" - {data}" if data is not None else ""
+                    print(f"   • {event_type}: {event_time}{suffix}")
 
             else:
                 print("Note: Persistent connection failed (expected with test SSID)")
@@ -211,129 +232,122 @@ async def demo_enhanced_features():
     print()
 
 
-def show_api_improvements():
-    """Show comparison with old API"""
-
-    print("Analysis: API Improvements Summary")
-    print("=" * 60)
-
-    print("Architecture: ARCHITECTURE IMPROVEMENTS:")
-    print("   Old API: Synchronous with threading")
-    print("   New API: Fully async/await with modern patterns")
-    print()
-
-    print("Connection: CONNECTION MANAGEMENT:")
-    print("   Old API: Manual daemon threads + run_forever()")
-    print("   New API: Persistent connections with asyncio tasks")
-    print("           Success: Automatic ping every 20 seconds")
-    print("           Success: Health monitoring and statistics")
-    print("           Success: Graceful reconnection handling")
-    print()
-
-    print("Message: MESSAGE HANDLING:")
-    print("   Old API: Basic message processing")
-    print("   New API: Optimized message routing with caching")
-    print("           Success: Message batching for performance")
-    print("           Success: Event-driven callbacks")
-    print("           Success: Type-safe message models")
-    print()
-
-    print("Error Handling: ERROR HANDLING:")
-    print("   Old API: Basic try/catch with global variables")
-    print("   New API: Comprehensive error monitoring")
-    print("           Success: Circuit breaker pattern")
-    print("           Success: Retry mechanisms with backoff")
-    print("           Success: Health checks and alerting")
-    print()
+_IMPROVEMENTS_TEXT = """\
+Analysis: API Improvements Summary
+============================================================
+Architecture: ARCHITECTURE IMPROVEMENTS:
+   Old API: Synchronous with threading
+   New API: Fully async/await with modern patterns
+
+Connection: CONNECTION MANAGEMENT:
+   Old API: Manual daemon threads + run_forever()
+   New API: Persistent connections with asyncio tasks
+           Success: Automatic ping every 20 seconds
+           Success: Health monitoring and statistics
+           Success: Graceful reconnection handling
+
+Message: MESSAGE HANDLING:
+   Old API: Basic message processing
+   New API: Optimized message routing with caching
+           Success: Message batching for performance
+           Success: Event-driven callbacks
+           Success: Type-safe message models
+
+Error Handling: ERROR HANDLING:
+   Old API: Basic try/catch with global variables
+   New API: Comprehensive error monitoring
+           Success: Circuit breaker pattern
+           Success: Retry mechanisms with backoff
+           Success: Health checks and alerting
+
+Statistics: DATA MANAGEMENT:
+   Old API: Basic data structures
+   New API: Modern data handling
+           Success: Pydantic models for type safety
+           Success: pandas DataFrame integration
+           Success: Automatic data validation
+
+Developer Experience: DEVELOPER EXPERIENCE:
+   Old API: Manual setup and configuration
+   New API: Enhanced developer tools
+           Success: Rich logging with loguru
+           Success: Context manager support
+           Success: Comprehensive testing
+           Success: Performance monitoring
+
+Usage Examples: USAGE EXAMPLES:
+
+   OLD API STYLE:
+   ```python
+   api = PocketOption(ssid, demo=True)
+   api.connect()
+   while api.check_connect():
+       balance = api.get_balance()
+       time.sleep(1)
+   ```
+
+   NEW API STYLE:
+   ```python
+   ssid = r'42["auth",{"session":"...","isDemo":1,"uid":123}]'
+   async with AsyncPocketOptionClient(ssid=ssid, persistent_connection=True) as client:
+       balance = await client.get_balance()
+       df = await client.get_candles_dataframe('EURUSD_otc', '1m', 100)
+       # Connection maintained automatically with keep-alive
+   ```
 
-    print("Statistics: DATA MANAGEMENT:")
-    print("   Old API: Basic data structures")
-    print("   New API: Modern data handling")
-    print("           Success: Pydantic models for type safety")
-    print("           Success: pandas DataFrame integration")
-    print("           Success: Automatic data validation")
-    print()
-
-    print("Developer Experience: DEVELOPER EXPERIENCE:")
-    print("   Old API: Manual setup and configuration")
-    print("   New API: Enhanced developer tools")
-    print("           Success: Rich logging with loguru")
-    print("           Success: Context manager support")
-    print("           Success: Comprehensive testing")
-    print("           Success: Performance monitoring")
-    print()
-
-    print("Usage Examples: USAGE EXAMPLES:")
-    print()
+"""
 
-    print("   OLD API STYLE:")
-    print("   ```python")
-    print("   api = PocketOption(ssid, demo=True)")
-    print("   api.connect()")
-    print("   while api.check_connect():")
-    print("       balance = api.get_balance()")
-    print("       time.sleep(1)")
-    print("   ```")
-    print()
 
-    print("   NEW API STYLE:")
-    print("   ```python")
-    print('   ssid = r\'42["auth",{"session":"...","isDemo":1,"uid":123}]\'')
-    print(
-        "   async with AsyncPocketOptionClient(ssid=ssid, persistent_connection=True) as client:"
-    )
-    print("       balance = await client.get_balance()")
-    print("       df = await client.get_candles_dataframe('EURUSD_otc', '1m', 100)")
-    print("       # Connection maintained automatically with keep-alive")
-    print("   ```")
-    print()
+def show_api_improvements():
+    """Show comparison with old API"""
+    sys.stdout.write(_IMPROVEMENTS_TEXT)
+
+
+_KEEPALIVE_TEXT = """\
+Persistent: Keep-Alive Features Based on Old API Analysis
+============================================================
+Demonstration: IMPLEMENTED FEATURES:
+Success: Continuous ping loop (20-second intervals)
+Success: Automatic reconnection on disconnection
+Success: Multiple region fallback
+Success: Background task management
+Success: Connection health monitoring
+Success: Message routing and processing
+Success: Event-driven callbacks
+Success: Connection statistics tracking
+Success: Graceful shutdown and cleanup
+Success: Complete SSID format support
+
+Technical Implementation: TECHNICAL IMPLEMENTATION:
+• AsyncWebSocketClient with persistent connections
+• ConnectionKeepAlive manager for advanced scenarios
+• Background asyncio tasks for ping/reconnect
+• Event handlers for connection state changes
+• Connection pooling with performance stats
+• Message batching and optimization
+• Health monitoring with alerts
+
+Statistics: MONITORING CAPABILITIES:
+• Connection uptime tracking
+• Message send/receive counters
+• Reconnection attempt statistics
+• Ping response time monitoring
+• Health check results
+• Performance metrics collection
+
+Configuration: CONFIGURATION OPTIONS:
+• persistent_connection: Enable advanced keep-alive
+• auto_reconnect: Automatic reconnection on failure
+• ping_interval: Customizable ping frequency
+• max_reconnect_attempts: Reconnection retry limit
+• connection_timeout: Connection establishment timeout
+• health_check_interval: Health monitoring frequency
+"""
 
 
 def show_keep_alive_features():
     """Show specific keep-alive features"""
-
-    print("Persistent: Keep-Alive Features Based on Old API Analysis")
-    print("=" * 60)
-
-    print("Demonstration: IMPLEMENTED FEATURES:")
-    print("Success: Continuous ping loop (20-second intervals)")
-    print("Success: Automatic reconnection on disconnection")
-    print("Success: Multiple region fallback")
-    print("Success: Background task management")
-    print("Success: Connection health monitoring")
-    print("Success: Message routing and processing")
-    print("Success: Event-driven callbacks")
-    print("Success: Connection statistics tracking")
-    print("Success: Graceful shutdown and cleanup")
-    print("Success: Complete SSID format support")
-    print()
-
-    print("Technical Implementation: TECHNICAL IMPLEMENTATION:")
-    print("• AsyncWebSocketClient with persistent connections")
-    print("• ConnectionKeepAlive manager for advanced scenarios")
-    print("• Background asyncio tasks for ping/reconnect")
-    print("• Event handlers for connection state changes")
-    print("• Connection pooling with performance stats")
-    print("• Message batching and optimization")
-    print("• Health monitoring with alerts")
-    print()
-
-    print("Statistics: MONITORING CAPABILITIES:")
-    print("• Connection uptime tracking")
-    print("• Message send/receive counters")
-    print("• Reconnection attempt statistics")
-    print("• Ping response time monitoring")
-    print("• Health check results")
-    print("• Performance metrics collection")
-    print()
-
-    print("Configuration: CONFIGURATION OPTIONS:")
-    print("• persistent_connection: Enable advanced keep-alive")
-    print("• auto_reconnect: Automatic reconnection on failure")
-    print("• ping_interval: Customizable ping frequency")
-    print("• max_reconnect_attempts: Reconnection retry limit")
-    print("• connection_timeout: Connection establishment timeout")
-    print("• health_check_interval: Health monitoring frequency")
+    sys.stdout.write(_KEEPALIVE_TEXT)
 
 
 async def main():
@@ -366,4 +380,12 @@ async def main():
 
 
 if __name__ == "__main__":
+    # Use the libuv based event loop when available
+    try:
+        import uvloop
+
+        uvloop.install()
+    except ImportError:
+        pass
+
     asyncio.run(main())
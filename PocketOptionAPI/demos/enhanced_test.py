@@ -3,9 +3,15 @@ Enhanced PocketOption API Testing with Monitoring and Performance Analysis
 """
 
 import asyncio
+import json
 import os
+import tempfile
 import time
+from dataclasses import dataclass
 from datetime import datetime
+from functools import partial
+from types import MappingProxyType
+from typing import List, Optional
 from loguru import logger
 
 from pocketoptionapi_async import (
@@ -16,6 +22,34 @@ from pocketoptionapi_async import (
     ErrorCategory,
 )
 
+# Shared by every record of the alert threshold spam; the monitor never mutates it
+_SPAM_CONTEXT = MappingProxyType({"spam_test": True})
+_SPAM_MESSAGE = "Spam test error"
+
+
+@dataclass
+class TestResult:
+    """Outcome of a single enhanced test"""
+
+    name: str
+    duration_ns: int
+    success: bool
+    error: Optional[str] = None
+
+
+async def _drain_errors(queue: asyncio.Queue, batch_size: int = 32):
+    """Feed queued error records to the error monitor in batches"""
+    while True:
+        batch = [await queue.get()]
+        while len(batch) < batch_size and not queue.empty():
+            batch.append(queue.get_nowait())
+
+        try:
+            await error_monitor.record_errors_bulk(batch)
+        finally:
+            for _ in batch:
+                queue.task_done()
+
 
 class EnhancedAPITester:
     """Enhanced API testing with monitoring capabilities"""
@@ -23,11 +57,20 @@ class EnhancedAPITester:
     def __init__(self, session_id: str, is_demo: bool = True):
         self.session_id = session_id
         self.is_demo = is_demo
-        self.test_results = {}
+        self._auth_payload = self._parse_auth_payload(session_id)
+        self.test_results: List[TestResult] = []
 
         # Setup monitoring callbacks
         error_monitor.add_alert_callback(self.handle_error_alert)
 
+    @staticmethod
+    def _parse_auth_payload(session_id: str) -> dict:
+        """Parse the SSID once so every test client can reuse it"""
+        if session_id.startswith('42["auth",'):
+            json_part = session_id[session_id.index("{") : session_id.rindex("}") + 1]
+            return json.loads(json_part)
+        return {"session": session_id}
+
     async def handle_error_alert(self, alert_data):
         """Handle error alerts from the monitoring system"""
         logger.warning(
@@ -77,33 +120,41 @@ class EnhancedAPITester:
         logger.info("Testing Monitored Operations")
 
         operations = [
-            ("balance_check", lambda: client.get_balance()),
-            ("candles_fetch", lambda: client.get_candles("EURUSD_otc", 60, 50)),
-            ("health_check", lambda: client.get_health_status()),
+            ("balance_check", client.get_balance),
+            ("candles_fetch", partial(client.get_candles, "EURUSD_otc", 60, 50)),
+            ("health_check", client.get_health_status),
         ]
 
-        for op_name, operation in operations:
+        async def timed(op_name, operation):
+            t0 = time.perf_counter_ns()
             try:
-                start_time = time.time()
-
                 await client.execute_with_monitoring(
                     operation_name=op_name, func=operation
                 )
+                return op_name, time.perf_counter_ns() - t0, None
+            except Exception as e:
+                return op_name, time.perf_counter_ns() - t0, e
 
-                duration = time.time() - start_time
-                logger.success(f" {op_name}: {duration:.3f}s")
+        # The operations are independent, so run them concurrently
+        results = await asyncio.gather(
+            *(timed(op_name, operation) for op_name, operation in operations)
+        )
 
-            except Exception as e:
-                logger.error(f"{op_name} failed: {e}")
-
-                # Record error in monitoring system
-                await error_monitor.record_error(
-                    error_type=f"{op_name}_failure",
-                    severity=ErrorSeverity.MEDIUM,
-                    category=ErrorCategory.TRADING,
-                    message=str(e),
-                    context={"operation": op_name},
-                )
+        for op_name, duration_ns, error in results:
+            if error is None:
+                logger.success(" {}: {:.3f}ms", op_name, duration_ns / 1e6)
+                continue
+
+            logger.error("{} failed: {}", op_name, error)
+
+            # Record error in monitoring system
+            await error_monitor.record_error(
+                error_type=f"{op_name}_failure",
+                severity=ErrorSeverity.MEDIUM,
+                category=ErrorCategory.TRADING,
+                message=str(error),
+                context={"operation": op_name},
+            )
 
     async def test_circuit_breaker(self):
         """Test circuit breaker functionality"""
@@ -130,7 +181,7 @@ class EnhancedAPITester:
                 await breaker.call(failing_operation)
             except Exception as e:
                 failures += 1
-                logger.warning(f"Attempt {i + 1}: {e} (State: {breaker.state})")
+                logger.warning(f"Attempt {i + 1}: {e} (State: {breaker.state.name})")
 
         logger.info(f"🔥 Circuit breaker opened after {failures} failures")
 
@@ -145,32 +196,44 @@ class EnhancedAPITester:
         except Exception as e:
             logger.error(f"Recovery failed: {e}")
 
-    async def test_concurrent_performance(self):
+    async def test_concurrent_performance(
+        self, concurrent_level: int = 3, max_parallel_connects: int = 3
+    ):
         """Test concurrent operations performance"""
         logger.info("Testing Concurrent Performance")
         print("=" * 60)
 
+        # Bound the number of simultaneous handshakes
+        connect_limit = asyncio.Semaphore(max_parallel_connects)
+
         async def create_and_test_client(client_id: int):
             """Create client and perform operations"""
-            client = AsyncPocketOptionClient(
-                session_id=self.session_id, is_demo=self.is_demo
+            client = AsyncPocketOptionClient.from_parsed(
+                self._auth_payload, is_demo=self.is_demo
             )
 
-            start_time = time.time()
+            t0 = time.perf_counter_ns()
 
             try:
-                await client.connect()
+                async with connect_limit:
+                    await client.connect()
 
                 if client.is_connected:
-                    # Perform some operations
-                    balance = await client.get_balance()
-                    health = await client.get_health_status()
-
-                    duration = time.time() - start_time
+                    # Both queries are read-only, so issue them together
+                    balance, health = await asyncio.gather(
+                        client.get_balance(),
+                        client.get_health_status(),
+                        return_exceptions=True,
+                    )
+                    for result in (balance, health):
+                        if isinstance(result, Exception):
+                            raise result
+
+                    duration_ms = (time.perf_counter_ns() - t0) / 1e6
                     return {
                         "client_id": client_id,
                         "success": True,
-                        "duration": duration,
+                        "duration_ms": duration_ms,
                         "balance": balance.balance if balance else None,
                         "health": health["overall_status"],
                     }
@@ -179,33 +242,34 @@ class EnhancedAPITester:
                 return {
                     "client_id": client_id,
                     "success": False,
-                    "duration": time.time() - start_time,
+                    "duration_ms": (time.perf_counter_ns() - t0) / 1e6,
                     "error": str(e),
                 }
             finally:
                 await client.disconnect()
 
         # Run concurrent clients
-        concurrent_level = 3
         logger.info(f"Running {concurrent_level} concurrent clients...")
 
-        start_time = time.time()
+        t0 = time.perf_counter_ns()
         tasks = [create_and_test_client(i) for i in range(concurrent_level)]
         results = await asyncio.gather(*tasks, return_exceptions=True)
-        total_time = time.time() - start_time
+        total_ms = (time.perf_counter_ns() - t0) / 1e6
 
         # Analyze results
         successful = [r for r in results if isinstance(r, dict) and r.get("success")]
         failed = [r for r in results if not (isinstance(r, dict) and r.get("success"))]
 
         logger.info("📊 Concurrent Test Results:")
-        logger.info(f"    Successful: {len(successful)}/{concurrent_level}")
-        logger.info(f"   Failed: {len(failed)}")
-        logger.info(f"   ⏱️  Total Time: {total_time:.3f}s")
+        logger.info("    Successful: {}/{}", len(successful), concurrent_level)
+        logger.info("   Failed: {}", len(failed))
+        logger.info("   ⏱️  Total Time: {:.3f}ms", total_ms)
 
         if successful:
-            avg_time = sum(r["duration"] for r in successful) / len(successful)
-            logger.info(f"   Avg Client Time: {avg_time:.3f}s")
+            logger.opt(lazy=True).info(
+                "   Avg Client Time: {:.3f}ms",
+                lambda: sum(r["duration_ms"] for r in successful) / len(successful),
+            )
 
     async def test_error_monitoring(self):
         """Test error monitoring capabilities"""
@@ -220,33 +284,50 @@ class EnhancedAPITester:
             ("data_parsing", ErrorSeverity.LOW, ErrorCategory.DATA),
         ]
 
-        for error_type, severity, category in test_errors:
-            await error_monitor.record_error(
-                error_type=error_type,
-                severity=severity,
-                category=category,
-                message=f"Test {error_type} error",
-                context={"test": True, "timestamp": datetime.now().isoformat()},
-            )
-
-        # Get error summary
-        summary = error_monitor.get_error_summary(hours=1)
+        # Errors are queued and handed to the monitor in batches
+        queue: asyncio.Queue = asyncio.Queue(maxsize=1024)
+        drainer = asyncio.create_task(_drain_errors(queue, batch_size=32))
 
-        logger.info("Error Summary:")
-        logger.info(f"   Total Errors: {summary['total_errors']}")
-        logger.info(f"   Error Rate: {summary['error_rate']:.2f}/hour")
-        logger.info(f"   Top Errors: {summary['top_errors'][:3]}")
+        # All records of this batch share one timestamp
+        batch_timestamp = datetime.now().isoformat()
 
-        # Test alert threshold
-        logger.info("🚨 Testing Alert Threshold...")
-        for i in range(15):  # Generate many errors to trigger alert
-            await error_monitor.record_error(
-                error_type="test_spam",
-                severity=ErrorSeverity.LOW,
-                category=ErrorCategory.SYSTEM,
-                message=f"Spam test error #{i + 1}",
-                context={"spam_test": True},
-            )
+        try:
+            for error_type, severity, category in test_errors:
+                queue.put_nowait(
+                    {
+                        "error_type": error_type,
+                        "severity": severity,
+                        "category": category,
+                        "message": f"Test {error_type} error",
+                        "context": {"test": True, "timestamp": batch_timestamp},
+                    }
+                )
+            await queue.join()
+
+            # Get error summary
+            summary = error_monitor.get_error_summary(hours=1)
+
+            logger.info("Error Summary:")
+            logger.info(f"   Total Errors: {summary['total_errors']}")
+            logger.info(f"   Error Rate: {summary['error_rate']:.2f}/hour")
+            logger.info(f"   Top Errors: {summary['top_errors'][:3]}")
+
+            # Test alert threshold
+            logger.info("🚨 Testing Alert Threshold...")
+            for _ in range(15):  # Generate many errors to trigger alert
+                queue.put_nowait(
+                    {
+                        "error_type": "test_spam",
+                        "severity": ErrorSeverity.LOW,
+                        "category": ErrorCategory.SYSTEM,
+                        "message": _SPAM_MESSAGE,
+                        "context": _SPAM_CONTEXT,
+                    }
+                )
+            await queue.join()
+        finally:
+            drainer.cancel()
+            await asyncio.gather(drainer, return_exceptions=True)
 
     async def generate_performance_report(self):
         """Generate comprehensive performance report"""
@@ -269,6 +350,17 @@ class EnhancedAPITester:
         report.append(f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
         report.append("")
 
+        # Test results section
+        report.append("🧪 TEST RESULTS")
+        report.append("-" * 40)
+        for result in self.test_results:
+            status = "PASS" if result.success else f"FAIL ({result.error})"
+            report.append(
+                f"{result.name}: {status} in {result.duration_ns / 1e6:.1f}ms"
+            )
+
+        report.append("")
+
         # Error monitoring section
         report.append("🔍 ERROR MONITORING")
         report.append("-" * 40)
@@ -314,9 +406,19 @@ class EnhancedAPITester:
         report_text = "\n".join(report)
         print(report_text)
 
-        # Save to file
-        with open("enhanced_performance_report.txt", "w") as f:
-            f.write(report_text)
+        # Save to file atomically so an interrupted run never leaves a partial report
+        fd, tmp_path = tempfile.mkstemp(dir=".", suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", buffering=1 << 20) as f:
+                f.write(report_text)
+            # mkstemp creates the file 0600; keep the report readable as before
+            umask = os.umask(0)
+            os.umask(umask)
+            os.chmod(tmp_path, 0o644 & ~umask)
+            os.replace(tmp_path, "enhanced_performance_report.txt")
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
 
         logger.success("📄 Report saved to enhanced_performance_report.txt")
 
@@ -333,12 +435,21 @@ class EnhancedAPITester:
         ]
 
         for test_name, test_func in tests:
+            start_ns = time.perf_counter_ns()
             try:
                 logger.info(f"Running {test_name}...")
                 await test_func()
+                self.test_results.append(
+                    TestResult(test_name, time.perf_counter_ns() - start_ns, True)
+                )
                 logger.success(f" {test_name} completed")
                 await asyncio.sleep(1)  # Brief pause between tests
             except Exception as e:
+                self.test_results.append(
+                    TestResult(
+                        test_name, time.perf_counter_ns() - start_ns, False, str(e)
+                    )
+                )
                 logger.error(f"{test_name} failed: {e}")
 
         # Generate final report
@@ -388,4 +499,12 @@ if __name__ == "__main__":
         level="INFO",
     )
 
+    # Use the libuv based event loop when available
+    try:
+        import uvloop
+
+        uvloop.install()
+    except ImportError:
+        pass
+
     asyncio.run(main())
@@ -12,10 +12,12 @@ from .exceptions import (
     TimeoutError,
     InvalidParameterError,
     WebSocketError,
+    CircuitBreakerOpenError,
 )
 from .models import (
     Balance,
     Candle,
+    CandleBatch,
     Order,
     OrderResult,
     OrderStatus,
@@ -32,6 +34,7 @@ from .monitoring import (
     ErrorSeverity,
     ErrorCategory,
     CircuitBreaker,
+    CircuitState,
     RetryPolicy,
     error_monitor,
     health_checker,
@@ -52,8 +55,10 @@ __all__ = [
     "TimeoutError",
     "InvalidParameterError",
     "WebSocketError",
+    "CircuitBreakerOpenError",
     "Balance",
     "Candle",
+    "CandleBatch",
     "Order",
     "OrderResult",
     "OrderStatus",
@@ -67,6 +72,7 @@ __all__ = [
     "ErrorSeverity",
     "ErrorCategory",
     "CircuitBreaker",
+    "CircuitState",
     "RetryPolicy",
     "error_monitor",
     "health_checker",
@@ -4,17 +4,46 @@ Real-time monitoring, diagnostics, and performance analysis
 """
 
 import asyncio
+import csv
+import multiprocessing as mp
+import os
+import random
+import sys
+from bisect import bisect_left, insort
 import time
 import json
 from datetime import datetime, timedelta
-from typing import Dict, List, Any, Optional, Callable
-from dataclasses import dataclass, asdict
+from typing import Dict, List, Any, Optional, Callable, Iterator
+from dataclasses import dataclass
 from collections import deque, defaultdict
-import statistics
+from collections.abc import Mapping
+from multiprocessing import shared_memory
+import numpy as np
 from loguru import logger
 
 from client import AsyncPocketOptionClient
 
+try:
+    import psutil
+except ImportError:  # pragma: no cover - psutil is optional
+    psutil = None
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is optional
+    orjson = None
+
+
+def _dump_report(report: Dict[str, Any]) -> bytes:
+    """Serialize a diagnostics report as indented JSON"""
+    if orjson is not None:
+        return orjson.dumps(
+            report,
+            option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY,
+            default=str,
+        )
+    return json.dumps(report, indent=2, default=str).encode()
+
 
 @dataclass
 class ConnectionMetrics:
@@ -42,6 +71,268 @@ class PerformanceSnapshot:
     avg_response_time: float
 
 
+# Monitoring ticks between get_balance health checks
+_HEALTH_CHECK_EVERY = 6
+
+# Alert thresholds, compared in one vectorized step each monitoring tick:
+# error rate, avg response time (s), disconnected flag, memory usage (MB)
+_ALERT_THRESHOLDS = np.array([0.1, 5.0, 0.0, 500.0])
+_ALERTS = (
+    ("high_error_rate", "High error rate detected: {:.1%}"),
+    ("slow_response", "Slow response time: {:.2f}s"),
+    ("connection_lost", "Connection lost"),
+    ("high_memory", "High memory usage: {:.1f}MB"),
+)
+
+
+class _RingF64:
+    """Fixed-capacity ring of floats backed by a preallocated float64 array"""
+
+    __slots__ = ("buf", "head", "n", "cap")
+
+    def __init__(self, cap: int):
+        self.buf = np.zeros(cap, dtype=np.float64)
+        self.head = 0
+        self.n = 0
+        self.cap = cap
+
+    def __len__(self) -> int:
+        return self.n
+
+    def push(self, x: float) -> Optional[float]:
+        """Store x, returning the value it overwrote once the ring is full"""
+        head = self.head
+        evicted = float(self.buf[head]) if self.n == self.cap else None
+        self.buf[head] = x
+        self.head = (head + 1) % self.cap
+        if evicted is None:
+            self.n += 1
+        return evicted
+
+    def last(self) -> float:
+        """Most recently pushed value"""
+        return float(self.buf[(self.head - 1) % self.cap])
+
+    def window(self) -> np.ndarray:
+        """View of the stored values in slot order (not chronological)"""
+        return self.buf[: self.n]
+
+
+class _MessageStats(Mapping):
+    """Per-type message counters with fixed attribute slots.
+
+    Reads like the former ``Dict[str, int]`` mapping: only types seen so far
+    are keys; counters are updated through their attributes.
+    """
+
+    __slots__ = (
+        "connected",
+        "disconnected",
+        "reconnected",
+        "auth_error",
+        "balance",
+        "candles",
+        "message",
+        "ping",
+    )
+
+    def __init__(self):
+        for name in self.__slots__:
+            setattr(self, name, 0)
+
+    def __getitem__(self, key: str) -> int:
+        if key in _MESSAGE_TYPES:
+            count = getattr(self, key)
+            if count:
+                return count
+        raise KeyError(key)
+
+    def __contains__(self, key: object) -> bool:
+        return key in _MESSAGE_TYPES and bool(getattr(self, key))  # type: ignore
+
+    def __iter__(self) -> Iterator[str]:
+        return (name for name in self.__slots__ if getattr(self, name))
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self)
+
+    def __bool__(self) -> bool:
+        return any(getattr(self, name) for name in self.__slots__)
+
+    def items(self) -> List[tuple]:
+        return [
+            (name, count) for name in self.__slots__ if (count := getattr(self, name))
+        ]
+
+    def as_dict(self) -> Dict[str, int]:
+        return dict(self.items())
+
+
+_MESSAGE_TYPES = frozenset(_MessageStats.__slots__)
+
+
+class _RealTimeStats(Mapping):
+    """Slotted result of ConnectionMonitor.get_real_time_stats.
+
+    A read-only mapping over the metrics that are set, like the former dict;
+    optional metrics are simply left unset until there is data for them.
+    Use ``to_dict`` for a JSON-ready copy.
+    """
+
+    __slots__ = (
+        "uptime",
+        "uptime_str",
+        "total_messages",
+        "total_errors",
+        "error_rate",
+        "messages_per_second",
+        "connection_attempts",
+        "successful_connections",
+        "connection_success_rate",
+        "is_connected",
+        "last_ping_time",
+        "message_types",
+        "avg_response_time",
+        "min_response_time",
+        "max_response_time",
+        "median_response_time",
+        "avg_ping_time",
+        "min_ping_time",
+        "max_ping_time",
+        "memory_usage_mb",
+        "cpu_percent",
+    )
+
+    def __init__(self, **values: Any):
+        for name, value in values.items():
+            setattr(self, name, value)
+
+    def __getitem__(self, key: str) -> Any:
+        if key in _REAL_TIME_STATS_FIELDS:
+            try:
+                return getattr(self, key)
+            except AttributeError:
+                pass
+        raise KeyError(key)
+
+    def __contains__(self, key: object) -> bool:
+        return key in _REAL_TIME_STATS_FIELDS and hasattr(self, key)  # type: ignore
+
+    def __iter__(self) -> Iterator[str]:
+        return (name for name in self.__slots__ if hasattr(self, name))
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self)
+
+    def get(self, key: str, default: Any = None) -> Any:
+        if key in _REAL_TIME_STATS_FIELDS:
+            return getattr(self, key, default)
+        return default
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Plain dict copy, e.g. for JSON reports"""
+        data = dict(self)
+        data["message_types"] = data["message_types"].as_dict()
+        return data
+
+
+_REAL_TIME_STATS_FIELDS = frozenset(_RealTimeStats.__slots__)
+
+
+class _MetricRing:
+    """Fixed-capacity ring buffer storing metric rows column by column.
+
+    Each field lives in its own preallocated NumPy array and timestamps are
+    kept as epoch nanoseconds, so appends are scalar stores and window
+    aggregates are vectorized. Row objects are only built on request.
+    """
+
+    def __init__(
+        self,
+        capacity: int,
+        row_type: type,
+        dtypes: Dict[str, str],
+        nullable: tuple = (),
+    ):
+        self.capacity = capacity
+        self.row_type = row_type
+        self.nullable = nullable
+        self.ts = np.empty(capacity, dtype="i8")
+        self.columns = {
+            name: np.empty(capacity, dtype=dt) for name, dt in dtypes.items()
+        }
+        self.idx = 0
+        self.n = 0
+
+    def __len__(self) -> int:
+        return self.n
+
+    def append_row(self, ts_ns: int, **values: Any) -> None:
+        """Write a row over the oldest slot"""
+        i = self.idx
+        self.ts[i] = ts_ns
+        for name, value in values.items():
+            if value is None and name in self.nullable:
+                value = np.nan
+            self.columns[name][i] = value
+        self.idx = (i + 1) % self.capacity
+        self.n = min(self.n + 1, self.capacity)
+
+    def _order(self) -> np.ndarray:
+        """Slot indices from oldest to newest"""
+        return (np.arange(self.n) + (self.idx - self.n)) % self.capacity
+
+    def column(self, name: str) -> np.ndarray:
+        """Chronological copy of a column"""
+        return self.columns[name][self._order()]
+
+    def latest(self, name: str) -> Any:
+        """Most recent value of a column"""
+        return self.columns[name][(self.idx - 1) % self.capacity].item()
+
+    def index_after(self, cutoff: datetime) -> int:
+        """Chronological position of the first row newer than cutoff"""
+        cutoff_ns = int(cutoff.timestamp() * 1_000_000_000)
+        return int(np.searchsorted(self.ts[self._order()], cutoff_ns, side="right"))
+
+    def field_names(self) -> List[str]:
+        """Row field names, timestamp first"""
+        return ["timestamp", *self.columns]
+
+    def records(self, start: int = 0) -> Iterator[tuple]:
+        """Chronological row tuples from position start onwards"""
+        order = self._order()[start:]
+        timestamps = [
+            datetime.fromtimestamp(ns / 1e9) for ns in self.ts[order].tolist()
+        ]
+        columns = []
+        for name, col in self.columns.items():
+            values = col[order].tolist()
+            if name in self.nullable:
+                values = [None if v != v else v for v in values]
+            columns.append(values)
+        return zip(timestamps, *columns)
+
+    def text_is_csv_safe(self) -> bool:
+        """True if no stored text value needs CSV quoting"""
+        for col in self.columns.values():
+            if col.dtype == object:
+                for value in set(col[: self.n].tolist()):
+                    if isinstance(value, str) and any(c in value for c in ',"\r\n'):
+                        return False
+        return True
+
+    def dicts(self, start: int = 0) -> List[Dict[str, Any]]:
+        """Rows from chronological position start onwards as plain dicts"""
+        names = self.field_names()
+        return [dict(zip(names, rec)) for rec in self.records(start)]
+
+    def rows(self, start: int = 0) -> List[Any]:
+        """Materialize rows from chronological position start onwards"""
+        names = self.field_names()
+        return [self.row_type(**dict(zip(names, rec))) for rec in self.records(start)]
+
+
 class ConnectionMonitor:
     """Advanced connection monitoring and diagnostics"""
 
@@ -55,26 +346,69 @@ class ConnectionMonitor:
         self.client: Optional[AsyncPocketOptionClient] = None
 
         # Metrics storage
-        self.connection_metrics: deque = deque(maxlen=1000)
-        self.performance_snapshots: deque = deque(maxlen=500)
+        self.connection_metrics = _MetricRing(
+            1000,
+            ConnectionMetrics,
+            {
+                "connection_time": "f8",
+                "ping_time": "f8",
+                "message_count": "i8",
+                "error_count": "i8",
+                "region": "O",
+                "status": "O",
+            },
+            nullable=("ping_time",),
+        )
+        self.performance_snapshots = _MetricRing(
+            500,
+            PerformanceSnapshot,
+            {
+                "memory_usage_mb": "f8",
+                "cpu_percent": "f8",
+                "active_connections": "i8",
+                "messages_per_second": "f8",
+                "error_rate": "f8",
+                "avg_response_time": "f8",
+            },
+        )
         self.error_log: deque = deque(maxlen=200)
-        self.message_stats: Dict[str, int] = defaultdict(int)
+        self.message_stats = _MessageStats()
 
         # Real-time stats
         self.start_time = datetime.now()
+        self._start_ns = time.time_ns()
         self.total_messages = 0
         self.total_errors = 0
-        self.last_ping_time = None
-        self.ping_times: deque = deque(maxlen=100)
+        self._last_ping_ns: Optional[int] = None
+        self.ping_times = _RingF64(100)
+        self._ping_sum = 0.0
 
         # Event handlers
-        self.event_handlers: Dict[str, List[Callable]] = defaultdict(list)
+        # event -> (sync handlers, coroutine handlers), split at registration
+        self.event_handlers: Dict[str, tuple] = defaultdict(lambda: ([], []))
 
         # Performance tracking
-        self.response_times: deque = deque(maxlen=100)
+        self.response_times = _RingF64(100)
+        # Running sum and sorted copy of response_times for O(1) mean and
+        # O(log n) median/min/max
+        self._resp_sum = 0.0
+        self._resp_sorted: List[float] = []
         self.connection_attempts = 0
         self.successful_connections = 0
 
+        # get_balance health checks run on the first of every
+        # _HEALTH_CHECK_EVERY ticks, or on the next tick after a failed ping
+        self._tick = 0
+        self._last_ping_failed = False
+
+        # Process handle reused by every snapshot (None without psutil)
+        self._proc = psutil.Process(os.getpid()) if psutil is not None else None
+        self._ncpu = 1
+        if self._proc is not None:
+            # The first cpu_percent() call only sets the baseline and returns 0.0
+            self._proc.cpu_percent(interval=None)
+            self._ncpu = psutil.cpu_count() or 1
+
     async def start_monitoring(self, persistent_connection: bool = True) -> bool:
         """Start real-time monitoring"""
         logger.info("Analysis: Starting connection monitoring...")
@@ -93,12 +427,13 @@ class ConnectionMonitor:
 
             # Connect
             self.connection_attempts += 1
-            start_time = time.time()
+            loop = asyncio.get_running_loop()
+            start_time = loop.time()
 
             success = await self.client.connect()
 
             if success:
-                connection_time = time.time() - start_time
+                connection_time = loop.time() - start_time
                 self.successful_connections += 1
 
                 # Record connection metrics
@@ -106,7 +441,9 @@ class ConnectionMonitor:
 
                 # Start monitoring tasks
                 self.is_monitoring = True
-                self.monitor_task = asyncio.create_task(self._monitoring_loop())
+                self.monitor_task = asyncio.create_task(
+                    self._monitoring_loop(), name="pocketoption.connection_monitor"
+                )
 
                 logger.success(
                     f"Success: Monitoring started (connection time: {connection_time:.3f}s)"
@@ -163,44 +500,59 @@ class ConnectionMonitor:
 
         while self.is_monitoring:
             try:
-                # Collect performance snapshot
-                await self._collect_performance_snapshot()
-
-                # Check connection health
-                await self._check_connection_health()
-
-                # Send ping and measure response
-                await self._measure_ping_response()
-
-                # Emit monitoring events
+                # One clock read timestamps everything recorded this tick
+                now_ns = time.time_ns()
+
+                # Snapshot, health check and ping are independent probes, so
+                # the tick takes as long as the slowest one
+                probes = [
+                    self._collect_performance_snapshot(now_ns),
+                    self._measure_ping_response(now_ns),
+                ]
+                # Check connection health (cheap when disconnected, so always run)
+                if (
+                    self._tick % _HEALTH_CHECK_EVERY == 0
+                    or self._last_ping_failed
+                    or not self.client.is_connected
+                ):
+                    probes.append(self._check_connection_health(now_ns))
+                self._tick += 1
+
+                results = await asyncio.gather(*probes, return_exceptions=True)
+                for result in results:
+                    if isinstance(result, Exception):
+                        self.total_errors += 1
+                        self._record_error("monitoring_probe", str(result))
+
+                # Emit monitoring events (last, so it sees this tick's results)
                 await self._emit_monitoring_events()
 
-                await asyncio.sleep(5)  # Monitor every 5 seconds
+                # Monitor every ~5 seconds, jittered so monitors don't align
+                await asyncio.sleep(5 * (0.9 + 0.2 * random.random()))
 
             except Exception as e:
                 self.total_errors += 1
                 self._record_error("monitoring_loop", str(e))
                 logger.error(f"Error: Monitoring loop error: {e}")
 
-    async def _collect_performance_snapshot(self):
+    async def _collect_performance_snapshot(self, now_ns: Optional[int] = None):
         """Collect performance metrics snapshot"""
+        if now_ns is None:
+            now_ns = time.time_ns()
         try:
             # Try to get system metrics
             memory_mb = 0
             cpu_percent = 0
 
-            try:
-                import psutil
-                import os
-
-                process = psutil.Process(os.getpid())
-                memory_mb = process.memory_info().rss / 1024 / 1024
-                cpu_percent = process.cpu_percent()
-            except ImportError:
-                pass
+            if self._proc is not None:
+                # Read memory and CPU from one cached /proc sample
+                with self._proc.oneshot():
+                    memory_mb = self._proc.memory_info().rss / (1 << 20)
+                    # Share of total machine capacity, so it can't exceed 100%
+                    cpu_percent = self._proc.cpu_percent(interval=None) / self._ncpu
 
             # Calculate messages per second
-            uptime = (datetime.now() - self.start_time).total_seconds()
+            uptime = (now_ns - self._start_ns) / 1e9
             messages_per_second = self.total_messages / uptime if uptime > 0 else 0
 
             # Calculate error rate
@@ -208,11 +560,11 @@ class ConnectionMonitor:
 
             # Calculate average response time
             avg_response_time = (
-                statistics.mean(self.response_times) if self.response_times else 0
+                self._resp_sum / len(self.response_times) if self.response_times else 0
             )
 
-            snapshot = PerformanceSnapshot(
-                timestamp=datetime.now(),
+            self.performance_snapshots.append_row(
+                now_ns,
                 memory_usage_mb=memory_mb,
                 cpu_percent=cpu_percent,
                 active_connections=1 if self.client and self.client.is_connected else 0,
@@ -221,12 +573,10 @@ class ConnectionMonitor:
                 avg_response_time=avg_response_time,
             )
 
-            self.performance_snapshots.append(snapshot)
-
         except Exception as e:
             logger.error(f"Error: Error collecting performance snapshot: {e}")
 
-    async def _check_connection_health(self):
+    async def _check_connection_health(self, now_ns: Optional[int] = None):
         """Check connection health status"""
         if not self.client:
             return
@@ -234,46 +584,45 @@ class ConnectionMonitor:
         try:
             # Check if still connected
             if not self.client.is_connected:
-                self._record_connection_metrics(0, "DISCONNECTED")
+                self._record_connection_metrics(0, "DISCONNECTED", now_ns)
                 return
 
             # Try to get balance as health check
-            start_time = time.time()
+            loop = asyncio.get_running_loop()
+            start_time = loop.time()
             balance = await self.client.get_balance()
-            response_time = time.time() - start_time
+            response_time = loop.time() - start_time
 
-            self.response_times.append(response_time)
+            self._push_response_time(response_time)
 
             if balance:
-                self._record_connection_metrics(response_time, "HEALTHY")
+                self._record_connection_metrics(response_time, "HEALTHY", now_ns)
             else:
-                self._record_connection_metrics(response_time, "UNHEALTHY")
+                self._record_connection_metrics(response_time, "UNHEALTHY", now_ns)
 
         except Exception as e:
             self.total_errors += 1
             self._record_error("health_check", str(e))
-            self._record_connection_metrics(0, "ERROR")
+            self._record_connection_metrics(0, "ERROR", now_ns)
 
-    async def _measure_ping_response(self):
+    async def _measure_ping_response(self, now_ns: Optional[int] = None):
         """Measure ping response time"""
         if not self.client or not self.client.is_connected:
             return
 
         try:
-            start_time = time.time()
-            await self.client.send_message('42["ps"]')
+            # Round trip of a WebSocket ping frame to the server's pong
+            ping_time = await self.client.measure_latency(timeout=5.0)
 
-            # Note: We can't easily measure the actual ping response time
-            # since it's handled internally. This measures send time.
-            ping_time = time.time() - start_time
-
-            self.ping_times.append(ping_time)
-            self.last_ping_time = datetime.now()
+            self._push_ping_time(ping_time)
+            self._last_ping_failed = False
+            self._last_ping_ns = now_ns if now_ns is not None else time.time_ns()
 
             self.total_messages += 1
-            self.message_stats["ping"] += 1
+            self.message_stats.ping += 1
 
         except Exception as e:
+            self._last_ping_failed = True
             self.total_errors += 1
             self._record_error("ping_measure", str(e))
 
@@ -290,69 +639,76 @@ class ConnectionMonitor:
         except Exception as e:
             logger.error(f"Error: Error emitting monitoring events: {e}")
 
-    async def _check_and_emit_alerts(self, stats: Dict[str, Any]):
+    async def _check_and_emit_alerts(self, stats: "_RealTimeStats"):
         """Check for alert conditions and emit alerts"""
+        values = np.array(
+            [
+                stats.error_rate,
+                stats.get("avg_response_time", 0.0),
+                0.0 if stats.is_connected else 1.0,
+                stats.get("memory_usage_mb", 0.0),
+            ]
+        )
+        # Compare all thresholds at once; the common no-alert case stops here
+        fired = np.flatnonzero(values > _ALERT_THRESHOLDS)
+        if not fired.size:
+            return
 
-        # High error rate alert
-        if stats["error_rate"] > 0.1:  # 10% error rate
-            await self._emit_event(
-                "alert",
-                {
-                    "type": "high_error_rate",
-                    "value": stats["error_rate"],
-                    "threshold": 0.1,
-                    "message": f"High error rate detected: {stats['error_rate']:.1%}",
-                },
-            )
-
-        # Slow response time alert
-        if stats["avg_response_time"] > 5.0:  # 5 seconds
-            await self._emit_event(
-                "alert",
-                {
-                    "type": "slow_response",
-                    "value": stats["avg_response_time"],
-                    "threshold": 5.0,
-                    "message": f"Slow response time: {stats['avg_response_time']:.2f}s",
-                },
-            )
-
-        # Connection issues alert
-        if not stats["is_connected"]:
-            await self._emit_event(
-                "alert", {"type": "connection_lost", "message": "Connection lost"}
-            )
-
-        # Memory usage alert (if available)
-        if "memory_usage_mb" in stats and stats["memory_usage_mb"] > 500:  # 500MB
-            await self._emit_event(
-                "alert",
-                {
-                    "type": "high_memory",
-                    "value": stats["memory_usage_mb"],
-                    "threshold": 500,
-                    "message": f"High memory usage: {stats['memory_usage_mb']:.1f}MB",
-                },
-            )
-
-    def _record_connection_metrics(self, connection_time: float, status: str):
+        for i in fired.tolist():
+            alert_type, message = _ALERTS[i]
+            if alert_type == "connection_lost":
+                alert = {"type": alert_type, "message": message}
+            else:
+                value = values[i].item()
+                alert = {
+                    "type": alert_type,
+                    "value": value,
+                    "threshold": _ALERT_THRESHOLDS[i].item(),
+                    "message": message.format(value),
+                }
+            await self._emit_event("alert", alert)
+
+    def _push_response_time(self, value: float) -> None:
+        """Append a response time, keeping the running sum and order"""
+        oldest = self.response_times.push(value)
+        if oldest is not None:
+            self._resp_sum -= oldest
+            del self._resp_sorted[bisect_left(self._resp_sorted, oldest)]
+        self._resp_sum += value
+        insort(self._resp_sorted, value)
+
+    def _push_ping_time(self, value: float) -> None:
+        """Append a ping time, keeping the running sum"""
+        oldest = self.ping_times.push(value)
+        if oldest is not None:
+            self._ping_sum -= oldest
+        self._ping_sum += value
+
+    @property
+    def last_ping_time(self) -> Optional[datetime]:
+        """Time of the last ping sent"""
+        if self._last_ping_ns is None:
+            return None
+        return datetime.fromtimestamp(self._last_ping_ns / 1e9)
+
+    def _record_connection_metrics(
+        self, connection_time: float, status: str, ts_ns: Optional[int] = None
+    ):
         """Record connection metrics"""
         region = "UNKNOWN"
         if self.client and self.client.connection_info:
             region = self.client.connection_info.region or "UNKNOWN"
 
-        metrics = ConnectionMetrics(
-            timestamp=datetime.now(),
+        self.connection_metrics.append_row(
+            ts_ns if ts_ns is not None else time.time_ns(),
             connection_time=connection_time,
-            ping_time=self.ping_times[-1] if self.ping_times else None,
+            ping_time=self.ping_times.last() if self.ping_times else None,
             message_count=self.total_messages,
             error_count=self.total_errors,
             region=region,
             status=status,
         )
 
-        self.connection_metrics.append(metrics)
-
     def _record_error(self, error_type: str, error_message: str):
         """Record error for analysis"""
         error_record = {
@@ -364,162 +720,181 @@ class ConnectionMonitor:
 
     async def _emit_event(self, event_type: str, data: Any):
         """Emit event to registered handlers"""
-        if event_type in self.event_handlers:
-            for handler in self.event_handlers[event_type]:
-                try:
-                    if asyncio.iscoroutinefunction(handler):
-                        await handler(data)
-                    else:
-                        handler(data)
-                except Exception as e:
-                    logger.error(f"Error: Error in event handler for {event_type}: {e}")
+        handlers = self.event_handlers.get(event_type)
+        if handlers is None:
+            return
+
+        sync_handlers, async_handlers = handlers
+        for handler in sync_handlers:
+            try:
+                handler(data)
+            except Exception as e:
+                logger.error(f"Error: Error in event handler for {event_type}: {e}")
+
+        if async_handlers:
+            results = await asyncio.gather(
+                *[handler(data) for handler in async_handlers],
+                return_exceptions=True,
+            )
+            for result in results:
+                if isinstance(result, Exception):
+                    logger.error(
+                        f"Error: Error in event handler for {event_type}: {result}"
+                    )
 
     # Event handler methods
     async def _on_connected(self, data):
         self.total_messages += 1
-        self.message_stats["connected"] += 1
+        self.message_stats.connected += 1
         logger.info("Connection established")
 
     async def _on_disconnected(self, data):
         self.total_messages += 1
-        self.message_stats["disconnected"] += 1
+        self.message_stats.disconnected += 1
         logger.warning("Connection lost")
 
     async def _on_reconnected(self, data):
         self.total_messages += 1
-        self.message_stats["reconnected"] += 1
+        self.message_stats.reconnected += 1
         logger.info("Connection restored")
 
     async def _on_auth_error(self, data):
         self.total_errors += 1
-        self.message_stats["auth_error"] += 1
+        self.message_stats.auth_error += 1
         self._record_error("auth_error", str(data))
         logger.error("Authentication error")
 
-    async def _on_balance_updated(self, data):
+    # Plain counters on the hottest events stay synchronous so dispatch
+    # calls them directly instead of creating a coroutine per message
+    def _on_balance_updated(self, data):
         self.total_messages += 1
-        self.message_stats["balance"] += 1
+        self.message_stats.balance += 1
 
-    async def _on_candles_received(self, data):
+    def _on_candles_received(self, data):
         self.total_messages += 1
-        self.message_stats["candles"] += 1
+        self.message_stats.candles += 1
 
-    async def _on_message_received(self, data):
+    def _on_message_received(self, data):
         self.total_messages += 1
-        self.message_stats["message"] += 1
+        self.message_stats.message += 1
 
     def add_event_handler(self, event_type: str, handler: Callable):
         """Add event handler for monitoring events"""
-        self.event_handlers[event_type].append(handler)
+        sync_handlers, async_handlers = self.event_handlers[event_type]
+        if asyncio.iscoroutinefunction(handler):
+            async_handlers.append(handler)
+        else:
+            sync_handlers.append(handler)
 
-    def get_real_time_stats(self) -> Dict[str, Any]:
+    def get_real_time_stats(self) -> "_RealTimeStats":
         """Get current real-time statistics"""
-        uptime = datetime.now() - self.start_time
-
-        stats = {
-            "uptime": uptime.total_seconds(),
-            "uptime_str": str(uptime).split(".")[0],
-            "total_messages": self.total_messages,
-            "total_errors": self.total_errors,
-            "error_rate": self.total_errors / max(self.total_messages, 1),
-            "messages_per_second": self.total_messages / uptime.total_seconds()
-            if uptime.total_seconds() > 0
-            else 0,
-            "connection_attempts": self.connection_attempts,
-            "successful_connections": self.successful_connections,
-            "connection_success_rate": self.successful_connections
+        uptime = (time.time_ns() - self._start_ns) / 1e9
+        last_ping_time = self.last_ping_time
+
+        stats = _RealTimeStats(
+            uptime=uptime,
+            uptime_str=str(timedelta(seconds=int(uptime))),
+            total_messages=self.total_messages,
+            total_errors=self.total_errors,
+            error_rate=self.total_errors / max(self.total_messages, 1),
+            messages_per_second=self.total_messages / uptime if uptime > 0 else 0,
+            connection_attempts=self.connection_attempts,
+            successful_connections=self.successful_connections,
+            connection_success_rate=self.successful_connections
             / max(self.connection_attempts, 1),
-            "is_connected": self.client.is_connected if self.client else False,
-            "last_ping_time": self.last_ping_time.isoformat()
-            if self.last_ping_time
-            else None,
-            "message_types": dict(self.message_stats),
-        }
+            is_connected=self.client.is_connected if self.client else False,
+            last_ping_time=last_ping_time.isoformat() if last_ping_time else None,
+            # Live counters rather than a per-tick copy
+            message_types=self.message_stats,
+        )
 
         # Add response time stats
         if self.response_times:
-            stats.update(
-                {
-                    "avg_response_time": statistics.mean(self.response_times),
-                    "min_response_time": min(self.response_times),
-                    "max_response_time": max(self.response_times),
-                    "median_response_time": statistics.median(self.response_times),
-                }
+            ordered = self._resp_sorted
+            n = len(ordered)
+            mid = n // 2
+            stats.avg_response_time = self._resp_sum / n
+            stats.min_response_time = ordered[0]
+            stats.max_response_time = ordered[-1]
+            stats.median_response_time = (
+                ordered[mid] if n % 2 else (ordered[mid - 1] + ordered[mid]) / 2
             )
 
         # Add ping stats
         if self.ping_times:
-            stats.update(
-                {
-                    "avg_ping_time": statistics.mean(self.ping_times),
-                    "min_ping_time": min(self.ping_times),
-                    "max_ping_time": max(self.ping_times),
-                }
-            )
+            ping_window = self.ping_times.window()
+            stats.avg_ping_time = self._ping_sum / ping_window.size
+            stats.min_ping_time = float(ping_window.min())
+            stats.max_ping_time = float(ping_window.max())
 
         # Add latest performance snapshot data
         if self.performance_snapshots:
-            latest = self.performance_snapshots[-1]
-            stats.update(
-                {
-                    "memory_usage_mb": latest.memory_usage_mb,
-                    "cpu_percent": latest.cpu_percent,
-                }
-            )
+            snapshots = self.performance_snapshots
+            stats.memory_usage_mb = snapshots.latest("memory_usage_mb")
+            stats.cpu_percent = snapshots.latest("cpu_percent")
 
         return stats
 
-    def get_historical_metrics(self, hours: int = 1) -> Dict[str, Any]:
-        """Get historical metrics for the specified time period"""
+    def get_historical_metrics(
+        self, hours: int = 1, detail: bool = False
+    ) -> Dict[str, Any]:
+        """Get historical metrics for the specified time period
+
+        Per-row ``metrics`` and ``snapshots`` lists are only built when
+        ``detail`` is True; counts and trends are always included.
+        """
         cutoff_time = datetime.now() - timedelta(hours=hours)
+        metrics = self.connection_metrics
+        snapshots = self.performance_snapshots
 
         # Filter metrics
-        recent_metrics = [
-            m for m in self.connection_metrics if m.timestamp > cutoff_time
-        ]
-        recent_snapshots = [
-            s for s in self.performance_snapshots if s.timestamp > cutoff_time
-        ]
+        metrics_start = metrics.index_after(cutoff_time)
+        snapshots_start = snapshots.index_after(cutoff_time)
+        snapshots_count = len(snapshots) - snapshots_start
         recent_errors = [e for e in self.error_log if e["timestamp"] > cutoff_time]
 
         historical = {
             "time_period_hours": hours,
-            "connection_metrics_count": len(recent_metrics),
-            "performance_snapshots_count": len(recent_snapshots),
+            "connection_metrics_count": len(metrics) - metrics_start,
+            "performance_snapshots_count": snapshots_count,
             "error_count": len(recent_errors),
-            "metrics": [asdict(m) for m in recent_metrics],
-            "snapshots": [asdict(s) for s in recent_snapshots],
             "errors": recent_errors,
         }
+        if detail:
+            historical["metrics"] = metrics.dicts(metrics_start)
+            historical["snapshots"] = snapshots.dicts(snapshots_start)
 
         # Calculate trends
-        if recent_snapshots:
-            memory_values = [
-                s.memory_usage_mb for s in recent_snapshots if s.memory_usage_mb > 0
-            ]
-            response_values = [
-                s.avg_response_time for s in recent_snapshots if s.avg_response_time > 0
-            ]
+        if snapshots_count:
+            memory_values = snapshots.column("memory_usage_mb")[snapshots_start:]
+            memory_values = memory_values[memory_values > 0]
+            response_values = snapshots.column("avg_response_time")[snapshots_start:]
+            response_values = response_values[response_values > 0]
 
-            if memory_values:
+            if memory_values.size:
                 historical["memory_trend"] = {
-                    "avg": statistics.mean(memory_values),
-                    "min": min(memory_values),
-                    "max": max(memory_values),
-                    "trend": "increasing"
-                    if len(memory_values) > 1 and memory_values[-1] > memory_values[0]
-                    else "stable",
+                    "avg": float(memory_values.mean()),
+                    "min": float(memory_values.min()),
+                    "max": float(memory_values.max()),
+                    "trend": (
+                        "increasing"
+                        if memory_values.size > 1
+                        and memory_values[-1] > memory_values[0]
+                        else "stable"
+                    ),
                 }
 
-            if response_values:
+            if response_values.size:
                 historical["response_time_trend"] = {
-                    "avg": statistics.mean(response_values),
-                    "min": min(response_values),
-                    "max": max(response_values),
-                    "trend": "improving"
-                    if len(response_values) > 1
-                    and response_values[-1] < response_values[0]
-                    else "stable",
+                    "avg": float(response_values.mean()),
+                    "min": float(response_values.min()),
+                    "max": float(response_values.max()),
+                    "trend": (
+                        "improving"
+                        if response_values.size > 1
+                        and response_values[-1] < response_values[0]
+                        else "stable"
+                    ),
                 }
 
         return historical
@@ -527,33 +902,10 @@ class ConnectionMonitor:
     def generate_diagnostics_report(self) -> Dict[str, Any]:
         """Generate comprehensive diagnostics report"""
         stats = self.get_real_time_stats()
-        historical = self.get_historical_metrics(hours=2)
+        historical = self.get_historical_metrics(hours=2, detail=True)
 
         # Health assessment
-        health_score = 100
-        health_issues = []
-
-        if stats["error_rate"] > 0.05:
-            health_score -= 20
-            health_issues.append(f"High error rate: {stats['error_rate']:.1%}")
-
-        if not stats["is_connected"]:
-            health_score -= 30
-            health_issues.append("Not connected")
-
-        if stats.get("avg_response_time", 0) > 3.0:
-            health_score -= 15
-            health_issues.append(
-                f"Slow response time: {stats.get('avg_response_time', 0):.2f}s"
-            )
-
-        if stats["connection_success_rate"] < 0.9:
-            health_score -= 10
-            health_issues.append(
-                f"Low connection success rate: {stats['connection_success_rate']:.1%}"
-            )
-
-        health_score = max(0, health_score)
+        health_score, health_issues = _score_health(stats)
 
         # Recommendations
         recommendations = []
@@ -579,23 +931,25 @@ class ConnectionMonitor:
         report = {
             "timestamp": datetime.now().isoformat(),
             "health_score": health_score,
-            "health_status": "EXCELLENT"
-            if health_score > 90
-            else "GOOD"
-            if health_score > 70
-            else "FAIR"
-            if health_score > 50
-            else "POOR",
+            "health_status": (
+                "EXCELLENT"
+                if health_score > 90
+                else (
+                    "GOOD"
+                    if health_score > 70
+                    else "FAIR" if health_score > 50 else "POOR"
+                )
+            ),
             "health_issues": health_issues,
             "recommendations": recommendations,
-            "real_time_stats": stats,
+            "real_time_stats": stats.to_dict(),
             "historical_metrics": historical,
             "connection_summary": {
                 "total_attempts": stats["connection_attempts"],
                 "successful_connections": stats["successful_connections"],
-                "current_status": "CONNECTED"
-                if stats["is_connected"]
-                else "DISCONNECTED",
+                "current_status": (
+                    "CONNECTED" if stats["is_connected"] else "DISCONNECTED"
+                ),
                 "uptime": stats["uptime_str"],
             },
         }
@@ -607,38 +961,121 @@ class ConnectionMonitor:
         if not filename:
             filename = f"metrics_export_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv"
 
-        try:
-            import pandas as pd
-
-            # Convert metrics to DataFrame
-            metrics_data = []
-            for metric in self.connection_metrics:
-                metrics_data.append(asdict(metric))
-
-            if metrics_data:
-                df = pd.DataFrame(metrics_data)
-                df.to_csv(filename, index=False)
-                logger.info(f"Statistics: Metrics exported to {filename}")
+        metrics = self.connection_metrics
+        fields = metrics.field_names()
+        with open(filename, "w", newline="") as csvfile:
+            if metrics.text_is_csv_safe():
+                # Nothing needs quoting: format whole rows with one template
+                row_format = ",".join(["{}"] * len(fields)) + "\r\n"
+                csvfile.write(",".join(fields) + "\r\n")
+                csvfile.writelines(
+                    row_format.format(*("" if v is None else v for v in record))
+                    for record in metrics.records()
+                )
             else:
-                logger.warning("No metrics data to export")
-
-            return filename
-
-        except ImportError:
-            logger.error("pandas not available for CSV export")
+                writer = csv.writer(csvfile)
+                writer.writerow(fields)
+                writer.writerows(metrics.records())
 
-            # Fallback: basic CSV export
-            import csv
+        if metrics:
+            logger.info(f"Statistics: Metrics exported to {filename}")
+        else:
+            logger.warning("No metrics data to export")
+
+        return filename
+
+
+# Health rules: (stat, comparison, threshold, penalty, issue message format);
+# a missing optional stat counts as 0
+_SCORE_RULES = (
+    ("error_rate", ">", 0.05, 20, "High error rate: {:.1%}"),
+    ("is_connected", "==", False, 30, "Not connected"),
+    ("avg_response_time", ">", 3.0, 15, "Slow response time: {:.2f}s"),
+    ("connection_success_rate", "<", 0.9, 10, "Low connection success rate: {:.1%}"),
+)
+
+
+def _compile_score_rules(rules) -> Callable[[Any], tuple]:
+    """Generate a straight-line scoring function for the given rules"""
+    lines = [
+        "def _score_health(s):",
+        "    get = s.get",
+        "    score = 100",
+        "    issues = []",
+    ]
+    for key, op, threshold, penalty, message in rules:
+        lines += [
+            f"    v = get({key!r}, 0)",
+            f"    if v {op} {threshold!r}:",
+            f"        score -= {penalty}",
+            f"        issues.append({message!r}.format(v))",
+        ]
+    lines.append("    return max(0, score), issues")
+    namespace: Dict[str, Any] = {}
+    exec("\n".join(lines), namespace)
+    return namespace["_score_health"]
+
+
+_score_health = _compile_score_rules(_SCORE_RULES)
+
+_DISPLAY_HEADER = "Analysis: PocketOption API Connection Monitor\n" + "=" * 60 + "\n"
+
+# Scalar stats a worker-process monitor publishes to shared memory, in slot
+# order; NaN marks a metric with no data yet
+_SHARED_STATS_FIELDS = (
+    "uptime",
+    "total_messages",
+    "total_errors",
+    "error_rate",
+    "messages_per_second",
+    "is_connected",
+    "avg_response_time",
+    "min_response_time",
+    "max_response_time",
+    "memory_usage_mb",
+    "cpu_percent",
+)
+_SHARED_STATS_SIZE = len(_SHARED_STATS_FIELDS) * np.dtype(np.float64).itemsize
+
+
+def _publish_stats(stats: "_RealTimeStats", slots: np.ndarray) -> None:
+    """Write the scalar stats into a shared float64 block"""
+    for i, name in enumerate(_SHARED_STATS_FIELDS):
+        value = stats.get(name)
+        slots[i] = np.nan if value is None else float(value)
+
+
+class SharedStatsView:
+    """Read-only monitor stand-in backed by a worker's shared-memory block.
+
+    Exposes ``get_real_time_stats`` so RealTimeDisplay can render stats
+    published by a ConnectionMonitor running in another process.
+    """
+
+    def __init__(self, shm: shared_memory.SharedMemory):
+        self._slots = np.ndarray(
+            (len(_SHARED_STATS_FIELDS),), dtype=np.float64, buffer=shm.buf
+        )
 
-            with open(filename, "w", newline="") as csvfile:
-                if self.connection_metrics:
-                    fieldnames = asdict(self.connection_metrics[0]).keys()
-                    writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-                    writer.writeheader()
-                    for metric in self.connection_metrics:
-                        writer.writerow(asdict(metric))
+    def get_real_time_stats(self) -> "_RealTimeStats":
+        """Snapshot the latest published stats"""
+        values = self._slots.tolist()
+        stats = _RealTimeStats(message_types=_MessageStats())
+        for name, value in zip(_SHARED_STATS_FIELDS, values):
+            if value == value:  # skip NaN
+                setattr(stats, name, value)
+        stats.uptime = uptime = getattr(stats, "uptime", 0.0)
+        stats.uptime_str = str(timedelta(seconds=int(uptime)))
+        stats.is_connected = bool(getattr(stats, "is_connected", 0.0))
+        for name in ("total_messages", "total_errors"):
+            setattr(stats, name, int(getattr(stats, name, 0)))
+        stats.error_rate = getattr(stats, "error_rate", 0.0)
+        stats.messages_per_second = getattr(stats, "messages_per_second", 0.0)
+        return stats
 
-            return filename
+    def release(self) -> None:
+        """Drop the view of the block so the segment can be closed"""
+        self._slots = np.full(len(_SHARED_STATS_FIELDS), np.nan)
 
 
 class RealTimeDisplay:
@@ -652,7 +1089,11 @@ class RealTimeDisplay:
     async def start_display(self):
         """Start real-time display"""
         self.is_displaying = True
-        self.display_task = asyncio.create_task(self._display_loop())
+        # Clear once; frames then redraw in place
+        sys.stdout.write("\033[2J")
+        self.display_task = asyncio.create_task(
+            self._display_loop(), name="pocketoption.connection_monitor.display"
+        )
 
     async def stop_display(self):
         """Stop real-time display"""
@@ -668,53 +1109,54 @@ class RealTimeDisplay:
         """Display loop"""
         while self.is_displaying:
             try:
-                # Clear screen (ANSI escape sequence)
-                print("\033[2J\033[H", end="")
-
-                # Display header
-                print("Analysis: PocketOption API Connection Monitor")
-                print("=" * 60)
-
                 # Get stats
                 stats = self.monitor.get_real_time_stats()
 
-                # Display connection status
+                # Redraw in place from cursor home: ESC[K clears the rest of each
+                # line and ESC[J anything left below the frame
                 status = "Connected" if stats["is_connected"] else "Disconnected"
-                print(f"Status: {status}")
-                print(f"Uptime: {stats['uptime_str']}")
-                print()
-
-                # Display metrics
-                print("Statistics: Metrics:")
-                print(f"  Messages: {stats['total_messages']}")
-                print(f"  Errors: {stats['total_errors']}")
-                print(f"  Error Rate: {stats['error_rate']:.1%}")
-                print(f"  Messages/sec: {stats['messages_per_second']:.2f}")
-                print()
+                parts = [
+                    "\033[H",
+                    _DISPLAY_HEADER,
+                    f"Status: {status}\n",
+                    f"Uptime: {stats['uptime_str']}\n\n",
+                    "Statistics: Metrics:\n",
+                    f"  Messages: {stats['total_messages']}\n",
+                    f"  Errors: {stats['total_errors']}\n",
+                    f"  Error Rate: {stats['error_rate']:.1%}\n",
+                    f"  Messages/sec: {stats['messages_per_second']:.2f}\n\n",
+                ]
 
                 # Display performance
                 if "avg_response_time" in stats:
-                    print("Performance:")
-                    print(f"  Avg Response: {stats['avg_response_time']:.3f}s")
-                    print(f"  Min Response: {stats['min_response_time']:.3f}s")
-                    print(f"  Max Response: {stats['max_response_time']:.3f}s")
-                    print()
+                    parts.append(
+                        "Performance:\n"
+                        f"  Avg Response: {stats['avg_response_time']:.3f}s\n"
+                        f"  Min Response: {stats['min_response_time']:.3f}s\n"
+                        f"  Max Response: {stats['max_response_time']:.3f}s\n\n"
+                    )
 
                 # Display memory if available
                 if "memory_usage_mb" in stats:
-                    print("Resources:")
-                    print(f"  Memory: {stats['memory_usage_mb']:.1f} MB")
-                    print(f"  CPU: {stats['cpu_percent']:.1f}%")
-                    print()
+                    parts.append(
+                        "Resources:\n"
+                        f"  Memory: {stats['memory_usage_mb']:.1f} MB\n"
+                        f"  CPU: {stats['cpu_percent']:.1f}%\n\n"
+                    )
 
                 # Display message types
                 if stats["message_types"]:
-                    print("Message: Message Types:")
-                    for msg_type, count in stats["message_types"].items():
-                        print(f"  {msg_type}: {count}")
-                    print()
-
-                print("Press Ctrl+C to stop monitoring...")
+                    parts.append("Message: Message Types:\n")
+                    parts.extend(
+                        f"  {msg_type}: {count}\n"
+                        for msg_type, count in stats["message_types"].items()
+                    )
+                    parts.append("\n")
+
+                parts.append("Press Ctrl+C to stop monitoring...\n")
+                frame = "".join(parts).replace("\n", "\033[K\n")
+                sys.stdout.write(frame + "\033[J")
+                sys.stdout.flush()
 
                 await asyncio.sleep(2)  # Update every 2 seconds
 
@@ -723,8 +1165,107 @@ class RealTimeDisplay:
                 await asyncio.sleep(1)
 
 
-async def run_monitoring_demo(ssid: Optional[str] = None):
-    """Run monitoring demonstration"""
+def _report_monitoring_results(monitor: ConnectionMonitor) -> None:
+    """Log the final diagnostics report and save report and metrics files"""
+    report = monitor.generate_diagnostics_report()
+
+    logger.info("\nCompleted: FINAL DIAGNOSTICS REPORT")
+    logger.info("=" * 50)
+    logger.info(
+        f"Health Score: {report['health_score']}/100 ({report['health_status']})"
+    )
+
+    if report["health_issues"]:
+        logger.warning("Issues found:")
+        for issue in report["health_issues"]:
+            logger.warning(f"  - {issue}")
+
+    logger.info("Recommendations:")
+    for rec in report["recommendations"]:
+        logger.info(f"  - {rec}")
+
+    # Save detailed report
+    report_file = f"monitoring_report_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
+    with open(report_file, "wb") as f:
+        f.write(_dump_report(report))
+
+    logger.info(f"Report: Detailed report saved to: {report_file}")
+
+    # Export metrics
+    metrics_file = monitor.export_metrics_csv()
+    logger.info(f"Statistics: Metrics exported to: {metrics_file}")
+
+
+async def _run_worker_monitor(ssid: str, shm_name: str, duration: float):
+    """Monitor in the worker process, publishing stats to shared memory"""
+    shm = shared_memory.SharedMemory(name=shm_name)
+    slots = np.ndarray((len(_SHARED_STATS_FIELDS),), dtype=np.float64, buffer=shm.buf)
+    monitor = ConnectionMonitor(ssid, is_demo=True)
+
+    def on_alert(alert_data):
+        logger.warning(f"Alert: ALERT: {alert_data['message']}")
+
+    monitor.add_event_handler("alert", on_alert)
+    monitor.add_event_handler(
+        "stats_update", lambda stats: _publish_stats(stats, slots)
+    )
+
+    try:
+        if await monitor.start_monitoring(persistent_connection=True):
+            _publish_stats(monitor.get_real_time_stats(), slots)
+            await asyncio.sleep(duration)
+        else:
+            logger.error("Error: Failed to start monitoring")
+    finally:
+        await monitor.stop_monitoring()
+        _report_monitoring_results(monitor)
+        del slots
+        shm.close()
+
+
+def _monitor_entry(ssid: str, shm_name: str, duration: float = 120) -> None:
+    """Worker-process entry point running its own event loop"""
+    try:
+        asyncio.run(_run_worker_monitor(ssid, shm_name, duration))
+    except KeyboardInterrupt:
+        pass
+
+
+async def _run_monitoring_in_worker(ssid: str, duration: float):
+    """Run the monitor in a spawned process and display its shared stats"""
+    shm = shared_memory.SharedMemory(create=True, size=_SHARED_STATS_SIZE)
+    slots = np.ndarray((len(_SHARED_STATS_FIELDS),), dtype=np.float64, buffer=shm.buf)
+    slots[:] = np.nan
+    del slots
+    ctx = mp.get_context("spawn")
+    process = ctx.Process(
+        target=_monitor_entry,
+        args=(ssid, shm.name, duration),
+        name="pocketoption-connection-monitor",
+    )
+    view = SharedStatsView(shm)
+    display = RealTimeDisplay(view)
+
+    try:
+        process.start()
+        await display.start_display()
+        await asyncio.to_thread(process.join)
+    finally:
+        await display.stop_display()
+        if process.is_alive():
+            process.terminate()
+            await asyncio.to_thread(process.join)
+        view.release()
+        shm.close()
+        shm.unlink()
+
+
+async def run_monitoring_demo(ssid: Optional[str] = None, use_worker: bool = False):
+    """Run monitoring demonstration
+
+    With ``use_worker`` the monitor runs in a separate process (outside this
+    interpreter's GIL) and the display reads its stats from shared memory.
+    """
 
     if not ssid:
         ssid = r'42["auth",{"session":"demo_session_for_monitoring","isDemo":1,"uid":0,"platform":1}]'
@@ -732,6 +1273,10 @@ async def run_monitoring_demo(ssid: Optional[str] = None):
 
     logger.info("Analysis: Starting Advanced Connection Monitor Demo")
 
+    if use_worker:
+        await _run_monitoring_in_worker(ssid, duration=120)
+        return
+
     # Create monitor
     monitor = ConnectionMonitor(ssid, is_demo=True)
 
@@ -771,45 +1316,17 @@ async def run_monitoring_demo(ssid: Optional[str] = None):
         await display.stop_display()
         await monitor.stop_monitoring()
 
-        # Generate final report
-        report = monitor.generate_diagnostics_report()
-
-        logger.info("\nCompleted: FINAL DIAGNOSTICS REPORT")
-        logger.info("=" * 50)
-        logger.info(
-            f"Health Score: {report['health_score']}/100 ({report['health_status']})"
-        )
-
-        if report["health_issues"]:
-            logger.warning("Issues found:")
-            for issue in report["health_issues"]:
-                logger.warning(f"  - {issue}")
-
-        logger.info("Recommendations:")
-        for rec in report["recommendations"]:
-            logger.info(f"  - {rec}")
-
-        # Save detailed report
-        report_file = (
-            f"monitoring_report_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
-        )
-        with open(report_file, "w") as f:
-            json.dump(report, f, indent=2, default=str)
-
-        logger.info(f"Report: Detailed report saved to: {report_file}")
-
-        # Export metrics
-        metrics_file = monitor.export_metrics_csv()
-        logger.info(f"Statistics: Metrics exported to: {metrics_file}")
+        _report_monitoring_results(monitor)
 
 
 if __name__ == "__main__":
-    import sys
-
     # Allow passing SSID as command line argument
+    args = sys.argv[1:]
+    use_worker = "--worker" in args
+    args = [arg for arg in args if arg != "--worker"]
     ssid = None
-    if len(sys.argv) > 1:
-        ssid = sys.argv[1]
+    if args:
+        ssid = args[0]
         logger.info(f"Using provided SSID: {ssid[:50]}...")
 
-    asyncio.run(run_monitoring_demo(ssid))
+    asyncio.run(run_monitoring_demo(ssid, use_worker=use_worker))
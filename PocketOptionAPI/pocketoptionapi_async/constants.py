@@ -190,6 +190,19 @@ class Regions:
         """Get demo region URLs"""
         return [url for name, url in cls._REGIONS.items() if "DEMO" in name]
 
+    @staticmethod
+    def get_ping_message(url: str) -> str:
+        """
+        Get the keep-alive ping frame to send on a connection to url
+
+        Engine.io v3 servers accept the 1-byte client ping "2". From v4 on only
+        the server pings (the client answers "3"), so those connections keep
+        using the socket.io event 42["ps"].
+        """
+        if "EIO=3" in url:
+            return "2"
+        return '42["ps"]'
+
 
 # Global constants
 REGIONS = Regions()
@@ -214,6 +227,8 @@ CONNECTION_SETTINGS = {
     "max_reconnect_attempts": 5,
     "reconnect_delay": 5,  # seconds
     "message_timeout": 30,  # seconds
+    "max_message_size": 4 * 1024 * 1024,  # bytes, large candle histories
+    "parallel_connects": 3,  # regions raced at once when connecting
 }
 
 # API Limits
@@ -224,6 +239,7 @@ API_LIMITS = {
     "max_duration": 43200,  # 12 hours in seconds
     "max_concurrent_orders": 10,
     "rate_limit": 100,  # requests per minute
+    "candles_cache_size": 64,  # asset/timeframe pairs kept in memory
 }
 
 # Default headers
@@ -2,12 +2,15 @@
 Pydantic models for type safety and validation
 """
 
-from typing import Optional
+from typing import Any, Dict, Iterable, List, NamedTuple, Optional
 from pydantic import BaseModel, Field, validator
 from datetime import datetime
-from enum import Enum
+from enum import Enum, IntEnum
 import uuid
 
+import numpy as np
+import pandas as pd
+
 
 class OrderDirection(str, Enum):
     """
@@ -54,7 +57,7 @@ class ConnectionStatus(str, Enum):
     RECONNECTING = "reconnecting"
 
 
-class TimeFrame(int, Enum):
+class TimeFrame(IntEnum):
     """
     Represents standard timeframes for candlestick data in seconds.
     These values are commonly used in financial charting to aggregate price data
@@ -125,21 +128,13 @@ class Candle(BaseModel):
     asset: str
     timeframe: int  # in seconds, representing the duration of the candle
 
-    @validator("high")
-    def high_must_be_valid(cls, v, values):
-        """
-        Validator to ensure that the 'high' price is never less than the 'low' price.
-        This maintains the logical integrity of candlestick data.
-        """
-        if "low" in values and v < values["low"]:
-            raise ValueError("High must be greater than or equal to low")
-        return v
-
     @validator("low")
     def low_must_be_valid(cls, v, values):
         """
         Validator to ensure that the 'low' price is never greater than the 'high' price.
         This maintains the logical integrity of candlestick data.
+        Fields validate in declaration order, so this single check on 'low'
+        (declared after 'high') covers the pair.
         """
         if "high" in values and v > values["high"]:
             raise ValueError("Low must be less than or equal to high")
@@ -149,6 +144,188 @@ class Candle(BaseModel):
         frozen = True
 
 
+class CandleRow(NamedTuple):
+    """Lightweight read-only view of a single candle in a CandleBatch"""
+
+    timestamp: datetime
+    open: float
+    high: float
+    low: float
+    close: float
+    volume: float
+
+
+class CandleBatch:
+    """
+    Columnar (structure-of-arrays) container for candles of one asset and timeframe.
+    Keeps timestamps (epoch seconds) and OHLCV values in parallel NumPy arrays,
+    so indicator math can run vectorized instead of over Candle objects.
+    """
+
+    __slots__ = ("asset", "timeframe", "_size", "_ts", "_ohlcv")
+
+    def __init__(self, asset: str, timeframe: int, capacity: int = 16):
+        self.asset = asset
+        self.timeframe = timeframe
+        self._size = 0
+        self._ts = np.empty(capacity, dtype=np.int64)
+        self._ohlcv = np.empty((capacity, 5), dtype=np.float64)
+
+    @classmethod
+    def from_rows(
+        cls, rows: Iterable[Any], asset: str, timeframe: int
+    ) -> "CandleBatch":
+        """
+        Build a batch from raw server rows
+        ``[timestamp, open, low, high, close, (volume)]``.
+        Rows shorter than five fields are dropped and a missing volume becomes 0.0;
+        high/low are normalized since the server may send them swapped.
+        """
+        data = [
+            (row[0], row[1], row[2], row[3], row[4], row[5] if len(row) > 5 else 0.0)
+            for row in rows
+            if isinstance(row, (list, tuple)) and len(row) >= 5
+        ]
+        a = np.array(data, dtype=np.float64).reshape(-1, 6)
+        batch = cls(asset, timeframe, capacity=len(a))
+        batch._size = len(a)
+        batch._ts[:] = a[:, 0]
+        ohlcv = batch._ohlcv
+        ohlcv[:, 0] = a[:, 1]
+        ohlcv[:, 1] = np.maximum(a[:, 2], a[:, 3])
+        ohlcv[:, 2] = np.minimum(a[:, 2], a[:, 3])
+        ohlcv[:, 3] = a[:, 4]
+        ohlcv[:, 4] = a[:, 5]
+        return batch
+
+    @classmethod
+    def from_messages(
+        cls, messages: List[Dict[str, Any]], asset: str, timeframe: int
+    ) -> "CandleBatch":
+        """Build a batch from candle dicts (``time``, ``open``, ... keys) in one pass"""
+        batch = cls(asset, timeframe, capacity=len(messages))
+        ts, ohlcv = batch._ts, batch._ohlcv
+        for i, message in enumerate(messages):
+            get = message.get
+            ts[i] = get("time", 0)
+            ohlcv[i] = (
+                get("open", 0),
+                get("high", 0),
+                get("low", 0),
+                get("close", 0),
+                get("volume", 0),
+            )
+        batch._size = len(messages)
+        return batch
+
+    @classmethod
+    def from_candles(
+        cls, candles: List["Candle"], asset: str, timeframe: int
+    ) -> "CandleBatch":
+        """Build a batch from Candle models"""
+        batch = cls(asset, timeframe, capacity=len(candles))
+        for candle in candles:
+            batch.append(
+                candle.timestamp.timestamp(),
+                candle.open,
+                candle.high,
+                candle.low,
+                candle.close,
+                candle.volume or 0.0,
+            )
+        return batch
+
+    def append(
+        self,
+        timestamp: float,
+        open: float,
+        high: float,
+        low: float,
+        close: float,
+        volume: float = 0.0,
+    ) -> None:
+        """Append one candle, doubling the buffers when full"""
+        size = self._size
+        if size == len(self._ts):
+            capacity = max(16, size * 2)
+            self._ts = np.resize(self._ts, capacity)
+            self._ohlcv = np.resize(self._ohlcv, (capacity, 5))
+        self._ts[size] = timestamp
+        self._ohlcv[size] = (open, high, low, close, volume)
+        self._size = size + 1
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __getitem__(self, index: int) -> CandleRow:
+        if index < 0:
+            index += self._size
+        if not 0 <= index < self._size:
+            raise IndexError("candle index out of range")
+        return CandleRow(
+            datetime.fromtimestamp(int(self._ts[index])),
+            *self._ohlcv[index].tolist(),
+        )
+
+    @property
+    def timestamps(self) -> np.ndarray:
+        """Candle open times as epoch seconds"""
+        return self._ts[: self._size]
+
+    @property
+    def open(self) -> np.ndarray:
+        return self._ohlcv[: self._size, 0]
+
+    @property
+    def high(self) -> np.ndarray:
+        return self._ohlcv[: self._size, 1]
+
+    @property
+    def low(self) -> np.ndarray:
+        return self._ohlcv[: self._size, 2]
+
+    @property
+    def close(self) -> np.ndarray:
+        return self._ohlcv[: self._size, 3]
+
+    @property
+    def volume(self) -> np.ndarray:
+        return self._ohlcv[: self._size, 4]
+
+    def to_candles(self) -> List["Candle"]:
+        """Materialize Candle models (values are already typed, so unvalidated)"""
+        fromtimestamp = datetime.fromtimestamp
+        construct = Candle.model_construct
+        asset, timeframe = self.asset, self.timeframe
+        return [
+            construct(
+                timestamp=fromtimestamp(ts),
+                open=o,
+                high=h,
+                low=lo,
+                close=c,
+                volume=v,
+                asset=asset,
+                timeframe=timeframe,
+            )
+            for ts, (o, h, lo, c, v) in zip(
+                self.timestamps.tolist(), self._ohlcv[: self._size].tolist()
+            )
+        ]
+
+    def to_dataframe(self) -> pd.DataFrame:
+        """Return the batch as a DataFrame indexed by (local) timestamp"""
+        df = pd.DataFrame(
+            self._ohlcv[: self._size],
+            columns=["open", "high", "low", "close", "volume"],
+            index=pd.DatetimeIndex(
+                list(map(datetime.fromtimestamp, self.timestamps.tolist()))
+            ),
+        )
+        df.index.name = "timestamp"
+        return df
+
+
 class Order(BaseModel):
     """
     Order request model.
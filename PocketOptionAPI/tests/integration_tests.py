@@ -170,18 +170,22 @@ class IntegrationTester:
                         results[f"format_{i + 1}"] = {
                             "connected": True,
                             "authenticated": balance is not None,
-                            "format": ssid_format[:50] + "..."
-                            if len(ssid_format) > 50
-                            else ssid_format,
+                            "format": (
+                                ssid_format[:50] + "..."
+                                if len(ssid_format) > 50
+                                else ssid_format
+                            ),
                         }
                         await client.disconnect()
                     else:
                         results[f"format_{i + 1}"] = {
                             "connected": False,
                             "authenticated": False,
-                            "format": ssid_format[:50] + "..."
-                            if len(ssid_format) > 50
-                            else ssid_format,
+                            "format": (
+                                ssid_format[:50] + "..."
+                                if len(ssid_format) > 50
+                                else ssid_format
+                            ),
                         }
 
                 except Exception as e:
@@ -189,9 +193,11 @@ class IntegrationTester:
                         "connected": False,
                         "authenticated": False,
                         "error": str(e),
-                        "format": ssid_format[:50] + "..."
-                        if len(ssid_format) > 50
-                        else ssid_format,
+                        "format": (
+                            ssid_format[:50] + "..."
+                            if len(ssid_format) > 50
+                            else ssid_format
+                        ),
                     }
 
             # At least one format should work
@@ -365,7 +371,7 @@ class IntegrationTester:
             return {
                 "success": stats["is_connected"] and stats["total_messages"] > 0,
                 "details": {
-                    "real_time_stats": stats,
+                    "real_time_stats": stats.to_dict(),
                     "historical_metrics_count": historical["connection_metrics_count"],
                     "health_score": report["health_score"],
                     "health_status": report["health_status"],
@@ -792,11 +798,11 @@ class IntegrationTester:
                 "health_status": (
                     "EXCELLENT"
                     if health_score >= 90
-                    else "GOOD"
-                    if health_score >= 80
-                    else "FAIR"
-                    if health_score >= 60
-                    else "POOR"
+                    else (
+                        "GOOD"
+                        if health_score >= 80
+                        else "FAIR" if health_score >= 60 else "POOR"
+                    )
                 ),
             },
             "detailed_results": self.test_results,
@@ -826,9 +832,9 @@ class IntegrationTester:
 
         return {
             "score": (passed / len(connectivity_tests)) * 100,
-            "status": "GOOD"
-            if passed >= len(connectivity_tests) * 0.8
-            else "NEEDS_ATTENTION",
+            "status": (
+                "GOOD" if passed >= len(connectivity_tests) * 0.8 else "NEEDS_ATTENTION"
+            ),
             "details": f"{passed}/{len(connectivity_tests)} connectivity tests passed",
         }
 
@@ -847,9 +853,9 @@ class IntegrationTester:
 
         return {
             "score": (passed / len(performance_tests)) * 100,
-            "status": "GOOD"
-            if passed >= len(performance_tests) * 0.8
-            else "NEEDS_ATTENTION",
+            "status": (
+                "GOOD" if passed >= len(performance_tests) * 0.8 else "NEEDS_ATTENTION"
+            ),
             "details": f"{passed}/{len(performance_tests)} performance tests passed",
         }
 
@@ -868,9 +874,9 @@ class IntegrationTester:
 
         return {
             "score": (passed / len(reliability_tests)) * 100,
-            "status": "GOOD"
-            if passed >= len(reliability_tests) * 0.8
-            else "NEEDS_ATTENTION",
+            "status": (
+                "GOOD" if passed >= len(reliability_tests) * 0.8 else "NEEDS_ATTENTION"
+            ),
             "details": f"{passed}/{len(reliability_tests)} reliability tests passed",
         }
 
@@ -884,12 +890,14 @@ class IntegrationTester:
         )
 
         return {
-            "score": (passed / len(monitoring_tests)) * 100
-            if len(monitoring_tests) > 0
-            else 100,
-            "status": "GOOD"
-            if passed >= len(monitoring_tests) * 0.8
-            else "NEEDS_ATTENTION",
+            "score": (
+                (passed / len(monitoring_tests)) * 100
+                if len(monitoring_tests) > 0
+                else 100
+            ),
+            "status": (
+                "GOOD" if passed >= len(monitoring_tests) * 0.8 else "NEEDS_ATTENTION"
+            ),
             "details": f"{passed}/{len(monitoring_tests)} monitoring tests passed",
         }
 
@@ -2,6 +2,7 @@
 Professional test suite for the Async PocketOption API
 """
 
+import asyncio
 import pytest
 from unittest.mock import AsyncMock, MagicMock, patch
 from datetime import datetime, timedelta
@@ -11,6 +12,7 @@ from pocketoptionapi_async import (
     OrderDirection,
     OrderStatus,
     Balance,
+    CandleBatch,
     Order,
     OrderResult,
     ConnectionError,
@@ -89,6 +91,24 @@ class TestAsyncPocketOptionClient:
         assert balance.currency == "USD"
         assert balance.is_demo is True
 
+    @pytest.mark.asyncio
+    async def test_get_balance_waits_for_update(self, client, mock_websocket):
+        """Test a balance request returns as soon as the update arrives"""
+        with patch.object(client, "_websocket", mock_websocket):
+
+            async def reply(message):
+                asyncio.get_running_loop().call_soon(
+                    asyncio.ensure_future,
+                    client._on_balance_updated({"balance": 250.0}),
+                )
+
+            mock_websocket.send_message.side_effect = reply
+
+            balance = await asyncio.wait_for(client.get_balance(), 1.0)
+
+        assert balance.balance == 250.0
+        mock_websocket.send_message.assert_awaited_once_with('42["getBalance"]')
+
     @pytest.mark.asyncio
     async def test_get_balance_not_connected(self, client):
         """Test getting balance when not connected"""
@@ -171,6 +191,233 @@ class TestAsyncPocketOptionClient:
                 assert result.status == OrderStatus.ACTIVE
                 assert result.asset == "EURUSD_otc"
 
+    @pytest.mark.asyncio
+    async def test_wait_for_order_result_woken_by_json_data(self, client):
+        """Test the order waiter resolves as soon as the server tracks the order"""
+        order = Order(
+            asset="EURUSD_otc",
+            amount=10.0,
+            direction=OrderDirection.CALL,
+            duration=120,
+            request_id="req_1",
+        )
+        waiter = asyncio.create_task(client._wait_for_order_result("req_1", order))
+        await asyncio.sleep(0)
+
+        await client._on_json_data(
+            {"requestId": "req_1", "asset": "EURUSD_otc", "amount": 10, "time": 120}
+        )
+        result = await asyncio.wait_for(waiter, 1.0)
+
+        assert result.order_id == "req_1"
+        assert result.status == OrderStatus.ACTIVE
+        assert client._pending_order_futures == {}
+
+    @pytest.mark.asyncio
+    async def test_reconnect_sees_drop_during_setup(self, client, mock_websocket):
+        """Test a drop while a reconnection is being set up triggers another"""
+        mock_websocket.is_connected = False
+        attempts = []
+
+        async def reconnect():
+            attempts.append(len(attempts))
+            if len(attempts) == 1:
+                # The new connection drops before its setup finishes
+                await client._on_disconnected({})
+            return True
+
+        with patch.object(client, "_websocket", mock_websocket), patch.object(
+            client, "_start_regular_connection", side_effect=reconnect
+        ):
+            client.auto_reconnect = True
+            client._disconnected_event.set()
+            monitor = asyncio.create_task(client._reconnection_monitor())
+            for _ in range(10):
+                await asyncio.sleep(0)
+            monitor.cancel()
+
+        assert attempts == [0, 1]
+
+    @pytest.mark.asyncio
+    async def test_check_win_woken_by_deal(self, client):
+        """Test check_win returns as soon as the deal result arrives"""
+        await client._on_json_data(
+            {"requestId": "req_2", "asset": "EURUSD_otc", "amount": 10, "time": 60}
+        )
+        waiter = asyncio.create_task(client.check_win("req_2", max_wait_time=5))
+        await asyncio.sleep(0)
+
+        await client._on_json_data(
+            {"deals": [{"id": "req_2", "profit": 8.5, "payout": "92"}]}
+        )
+        result = await asyncio.wait_for(waiter, 1.0)
+
+        assert result["result"] == "win"
+        assert result["profit"] == 8.5
+        assert client._order_results["req_2"].payout == 92.0
+        assert client._order_events == {}
+
+        # An order that never gets a deal must not leave its event behind
+        result = await client.check_win("req_3", max_wait_time=0.01)
+
+        assert result["result"] == "timeout"
+        assert client._order_events == {}
+
+    @pytest.mark.asyncio
+    async def test_check_win_timeout_keeps_other_waiters(self, client):
+        """Test a check_win timing out doesn't strand another waiter"""
+        await client._on_json_data(
+            {"requestId": "req_4", "asset": "EURUSD_otc", "amount": 10, "time": 60}
+        )
+        short = asyncio.create_task(client.check_win("req_4", max_wait_time=0.05))
+        long = asyncio.create_task(client.check_win("req_4", max_wait_time=5))
+
+        assert (await short)["result"] == "timeout"
+        await client._on_json_data({"deals": [{"id": "req_4", "profit": 8.5}]})
+        result = await asyncio.wait_for(long, 1.0)
+
+        assert result["result"] == "win"
+        assert client._order_events == {}
+        assert client._order_waiters == {}
+
+    @pytest.mark.asyncio
+    async def test_connect_skips_region_failing_handshake(self, client):
+        """Test a region that opens first but fails the handshake loses the race"""
+        ws_client = client._websocket
+        bad_ws = AsyncMock()
+        bad_ws.recv.side_effect = Exception("handshake rejected")
+        good_ws = AsyncMock()
+        good_ws.recv.side_effect = ['0{"sid":"a"}', '40{"sid":"a"}']
+
+        async def fake_open(url):
+            if url == "wss://good.example/ws":
+                await asyncio.sleep(0.01)
+                return url, good_ws
+            return url, bad_ws
+
+        with patch.object(ws_client, "_open", side_effect=fake_open), patch.object(
+            ws_client, "_start_background_tasks", AsyncMock()
+        ):
+            connected = await ws_client.connect(
+                ["wss://bad.example/ws", "wss://good.example/ws"], "test_ssid"
+            )
+
+        assert connected is True
+        assert ws_client.websocket is good_ws
+        assert ws_client.connection_info.url == "wss://good.example/ws"
+        good_ws.send.assert_any_await("test_ssid")
+
+    @pytest.mark.asyncio
+    async def test_connect_sends_ssid_to_winner_only(self, client):
+        """Test raced regions that lose never receive the session credentials"""
+        ws_client = client._websocket
+        sockets = {}
+
+        async def fake_open(url):
+            # Both endpoints complete the handshake in the same round
+            ws = sockets[url] = AsyncMock()
+            ws.recv.side_effect = ['0{"sid":"a"}', '40{"sid":"a"}']
+            return url, ws
+
+        with patch.object(ws_client, "_open", side_effect=fake_open), patch.object(
+            ws_client, "_start_background_tasks", AsyncMock()
+        ):
+            connected = await ws_client.connect(
+                ["wss://a.example/ws", "wss://b.example/ws"], "test_ssid"
+            )
+
+        assert connected is True
+        authenticated = [
+            ws
+            for ws in sockets.values()
+            if any(call.args == ("test_ssid",) for call in ws.send.await_args_list)
+        ]
+        assert authenticated == [ws_client.websocket]
+
+    @pytest.mark.asyncio
+    async def test_queued_messages_fail_waiters_when_unsent(self, client):
+        """Test unsent queued messages fail their futures and are not replayed"""
+        from websockets.exceptions import ConnectionClosed
+        from pocketoptionapi_async.exceptions import WebSocketError
+
+        ws_client = client._websocket
+        ws_client.websocket = AsyncMock(closed=False)
+        ws_client.websocket.send.side_effect = ConnectionClosed(None, None)
+        ws_client._running = True
+        loop = asyncio.get_running_loop()
+        first, second, stale = (loop.create_future() for _ in range(3))
+
+        ws_client.queue_message("first", first)
+        ws_client.queue_message("second", second)
+        await asyncio.wait_for(ws_client._writer_loop(), 1.0)
+
+        for future in (first, second):
+            with pytest.raises(WebSocketError, match="WebSocket is not connected"):
+                future.result()
+
+        ws_client.queue_message("stale", stale)
+        await ws_client._stop_background_tasks()
+
+        assert ws_client._send_queue.empty()
+        with pytest.raises(WebSocketError, match="WebSocket is not connected"):
+            stale.result()
+
+    @pytest.mark.asyncio
+    async def test_heartbeat_exits_on_close_and_drops_idle_socket(self, client):
+        """Test the heartbeat stops on a closed socket and drops a silent one"""
+        ws_client = client._websocket
+        ws_client._running = True
+
+        ws_client.websocket = AsyncMock(closed=True)
+        await asyncio.wait_for(ws_client._pong_loop(0.01), 1.0)
+        ws_client.websocket.pong.assert_not_awaited()
+
+        ws_client.websocket = AsyncMock(closed=False)
+        ws_client.last_recv_ts = 0.0
+        with patch.object(ws_client, "_handle_disconnect", AsyncMock()) as dropped:
+            await asyncio.wait_for(ws_client._pong_loop(0.01), 1.0)
+
+        dropped.assert_awaited_once()
+        ws_client.websocket.close.assert_awaited_once()
+        ws_client.websocket.pong.assert_not_awaited()
+
+    def test_parse_candles_data(self, client):
+        """Test candle rows are parsed with high/low normalized"""
+        candles = client._parse_candles_data(
+            [[1700000000, 1.0, 1.2, 1.1, 1.05], [1700000060, 1.0, 0.9, 1.3, 1.2, 5]],
+            "EURUSD_otc",
+            60,
+        )
+
+        assert len(candles) == 2
+        assert (candles[0].high, candles[0].low) == (1.2, 1.1)
+        assert (candles[1].high, candles[1].low) == (1.3, 0.9)
+        assert candles[0].volume == 0.0
+        assert candles[1].volume == 5.0
+
+    @pytest.mark.asyncio
+    async def test_measure_latency(self, client):
+        """Test latency is measured from ping to pong"""
+        loop = asyncio.get_running_loop()
+        ws = AsyncMock()
+        pong = loop.create_future()
+        ws.ping.return_value = pong
+        loop.call_later(0.01, pong.set_result, None)
+        client._websocket.websocket = ws
+
+        latency = await client.measure_latency(timeout=1.0)
+
+        assert latency >= 0.01
+        ws.ping.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_measure_latency_not_connected(self, client):
+        """Test latency measurement requires a connection"""
+        client._websocket.websocket = None
+
+        with pytest.raises(ConnectionError):
+            await client.measure_latency()
+
     @pytest.mark.asyncio
     async def test_place_order_not_connected(self, client):
         """Test order placement when not connected"""
@@ -262,6 +509,46 @@ class TestAsyncPocketOptionClient:
 
         assert test_callback not in client._event_callbacks.get("test_event", [])
 
+    @pytest.mark.asyncio
+    async def test_emit_event_dedup_and_self_removal(self, client):
+        """Test duplicate callbacks fire once and may unregister during dispatch"""
+        calls = []
+
+        def once(data):
+            calls.append(("once", data))
+            client.remove_event_callback("test_event", once)
+
+        async def async_callback(data):
+            calls.append(("async", data))
+
+        client.add_event_callback("test_event", once)
+        client.add_event_callback("test_event", once)
+        client.add_event_callback("test_event", async_callback)
+
+        await client._emit_event("test_event", 1)
+        await client._emit_event("test_event", 2)
+
+        assert calls == [("once", 1), ("async", 1), ("async", 2)]
+
+    @pytest.mark.asyncio
+    async def test_emit_event_keeps_registration_order(self, client):
+        """Test sync and coroutine callbacks run in registration order"""
+        calls = []
+
+        async def first(data):
+            await asyncio.sleep(0)
+            calls.append("first")
+
+        def second(data):
+            calls.append("second")
+
+        client.add_event_callback("test_event", first)
+        client.add_event_callback("test_event", second)
+
+        await client._emit_event("test_event", None)
+
+        assert calls == ["first", "second"]
+
     @pytest.mark.asyncio
     async def test_context_manager(self, client, mock_websocket):
         """Test async context manager"""
@@ -336,6 +623,30 @@ class TestModels:
         assert result.status == OrderStatus.WIN
         assert result.profit == 8.0
 
+    def test_candle_batch(self):
+        """Test CandleBatch columns, growth and row views"""
+        batch = CandleBatch.from_messages(
+            [{"time": 1700000000, "open": 1.0, "high": 1.2, "low": 0.9, "close": 1.1}],
+            "EURUSD_otc",
+            60,
+        )
+        for i in range(1, 40):
+            batch.append(1700000000 + 60 * i, 1.0, 1.5, 0.5, 1.2, 3.0)
+
+        assert len(batch) == 40
+        assert batch.high.tolist() == [1.2] + [1.5] * 39
+        assert batch.close.mean() == pytest.approx((1.1 + 1.2 * 39) / 40)
+        assert batch[-1].volume == 3.0
+        assert batch[0].timestamp == datetime.fromtimestamp(1700000000)
+        assert batch.to_candles()[0].low == 0.9
+        assert list(batch.to_dataframe().columns) == [
+            "open",
+            "high",
+            "low",
+            "close",
+            "volume",
+        ]
+
 
 class TestUtilities:
     """Test utility functions"""
@@ -365,6 +676,120 @@ class TestUtilities:
         assert payout == -1.0
 
 
+class TestMonitoring:
+    """Test monitoring components"""
+
+    @pytest.mark.asyncio
+    async def test_record_errors_bulk(self):
+        """Test bulk error recording with a single alert per error type"""
+        from pocketoptionapi_async.monitoring import (
+            ErrorMonitor,
+            ErrorSeverity,
+            ErrorCategory,
+        )
+
+        monitor = ErrorMonitor(alert_threshold=3)
+        alerts = []
+
+        async def on_alert(alert_data):
+            alerts.append(alert_data)
+
+        monitor.add_alert_callback(on_alert)
+
+        events = await monitor.record_errors_bulk(
+            [
+                {
+                    "error_type": "bulk",
+                    "severity": ErrorSeverity.LOW,
+                    "category": ErrorCategory.SYSTEM,
+                    "message": f"error {i}",
+                }
+                for i in range(5)
+            ]
+        )
+
+        assert len(events) == 5
+        assert monitor.get_error_summary(hours=1)["total_errors"] == 5
+        assert len(alerts) == 1
+        assert alerts[0]["error_count"] == 5
+
+    def test_error_event_accepts_datetime_timestamp(self):
+        """Test ErrorEvent still accepts a datetime timestamp"""
+        from pocketoptionapi_async.monitoring import (
+            ErrorEvent,
+            ErrorSeverity,
+            ErrorCategory,
+        )
+
+        when = datetime(2024, 1, 2, 3, 4, 5, 123456)
+        args = ("test", ErrorSeverity.LOW, ErrorCategory.DATA, "message", {})
+
+        positional = ErrorEvent(when, *args)
+        by_keyword = ErrorEvent(
+            timestamp=when,
+            error_type="test",
+            severity=ErrorSeverity.LOW,
+            category=ErrorCategory.DATA,
+            message="message",
+            context={},
+        )
+
+        assert positional.timestamp == when
+        assert by_keyword == positional
+        assert ErrorEvent(positional.timestamp_ns, *args) == positional
+
+    @pytest.mark.asyncio
+    async def test_circuit_breaker(self):
+        """Test circuit breaker opens, rejects calls and recovers"""
+        from pocketoptionapi_async import CircuitBreakerOpenError
+        from pocketoptionapi_async.monitoring import CircuitBreaker, CircuitState
+
+        breaker = CircuitBreaker(failure_threshold=2, recovery_timeout=60)
+
+        async def fail():
+            raise ValueError("boom")
+
+        async def succeed():
+            return "ok"
+
+        for _ in range(2):
+            with pytest.raises(ValueError):
+                await breaker.call(fail)
+        assert breaker.state == CircuitState.OPEN
+
+        with pytest.raises(CircuitBreakerOpenError):
+            await breaker.call(succeed)
+
+        breaker.recovery_timeout = 0
+        assert await breaker.call(succeed) == "ok"
+        assert breaker.state == CircuitState.CLOSED
+
+    @pytest.mark.asyncio
+    async def test_task_profiler(self):
+        """Test the task profiler records steps and propagates results"""
+        from pocketoptionapi_async.monitoring import TaskProfiler
+
+        profiler = TaskProfiler()
+
+        async def work():
+            await asyncio.sleep(0)
+            await asyncio.sleep(0)
+            return "done"
+
+        assert await asyncio.create_task(profiler.wrap(work(), "test.work")) == "done"
+
+        stats = profiler.get_stats()["test.work"]
+        assert stats["runs"] == 1
+        assert stats["steps"] == 3
+        assert stats["wall_time"] >= stats["busy_time"] >= 0
+
+        blocked = asyncio.create_task(profiler.wrap(asyncio.sleep(10), "test.blocked"))
+        await asyncio.sleep(0)
+        blocked.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await blocked
+
+
 if __name__ == "__main__":
     # Run tests with: python -m pytest tests/test_async_api.py -v
     pytest.main([__file__, "-v"])
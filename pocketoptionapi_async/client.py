@@ -3,27 +3,40 @@ Professional Async PocketOption API Client
 """
 
 import asyncio
+import functools
+import itertools
 import json
+import random
+import re
 import time
 import uuid
-from typing import Optional, List, Dict, Any, Union, Callable
+from typing import Optional, List, Dict, Any, Union, Callable, Deque
 from datetime import datetime, timedelta
-from collections import defaultdict
+from collections import OrderedDict, defaultdict, deque
+from operator import attrgetter
+import numpy as np
 import pandas as pd
 from loguru import logger
 
-from .monitoring import error_monitor, health_checker, ErrorCategory, ErrorSeverity
+from .monitoring import (
+    error_monitor,
+    health_checker,
+    ErrorCategory,
+    ErrorSeverity,
+    TaskProfiler,
+)
 from .websocket_client import AsyncWebSocketClient
 from .models import (
     Balance,
     Candle,
+    CandleBatch,
     Order,
     OrderResult,
     OrderStatus,
     OrderDirection,
     ServerTime,
 )
-from .constants import ASSETS, REGIONS, TIMEFRAMES, API_LIMITS
+from .constants import ASSETS, REGIONS, TIMEFRAMES, API_LIMITS, CONNECTION_SETTINGS
 from .exceptions import (
     PocketOptionError,
     ConnectionError,
@@ -32,6 +45,37 @@ from .exceptions import (
     InvalidParameterError,
 )
 
+# Columns of get_candles_dataframe, read from each Candle in a single call
+_CANDLE_COLUMNS = ["timestamp", "open", "high", "low", "close", "volume"]
+_candle_row = attrgetter(*_CANDLE_COLUMNS)
+_candle_timestamp = attrgetter("timestamp")
+
+# Complete SSID auth message, e.g. 42["auth",{"session":"...","uid":123}]
+_SSID_RE = re.compile(r'^\d+\["auth",(\{.*\})\]\s*$', re.DOTALL)
+
+# Region names used by default for demo and live connections
+_DEMO_REGION_NAMES = tuple(
+    name
+    for name, url in REGIONS.get_all_regions().items()
+    if url in REGIONS.get_demo_regions()
+)
+_LIVE_REGION_NAMES = tuple(
+    name for name in REGIONS.get_all_regions() if "DEMO" not in name.upper()
+)
+
+# Region of the most recent successful connection in this process, tried first
+# by later clients so they skip regions that already failed
+_last_good_region: Optional[str] = None
+
+
+@functools.lru_cache(maxsize=512)
+def _encode_change_symbol(asset: str, timeframe: int) -> str:
+    """Encode the changeSymbol candle subscription for an asset/timeframe"""
+    return "42" + json.dumps(
+        ["changeSymbol", {"asset": asset, "period": timeframe}],
+        separators=(",", ":"),
+    )
+
 
 class AsyncPocketOptionClient:
     """
@@ -49,6 +93,10 @@ class AsyncPocketOptionClient:
         persistent_connection: bool = False,
         auto_reconnect: bool = True,
         enable_logging: bool = True,
+        max_reconnect_attempts: int = 10,
+        reconnect_base_delay: float = 5.0,
+        use_uvloop: bool = False,
+        enable_profiling: bool = False,
     ):
         """
         Initialize async PocketOption client with enhanced monitoring
@@ -63,6 +111,13 @@ class AsyncPocketOptionClient:
             persistent_connection: Enable persistent connection with keep-alive (like old API)
             auto_reconnect: Enable automatic reconnection on disconnection
             enable_logging: Enable detailed logging (default: True)
+            max_reconnect_attempts: Reconnection retry limit
+            reconnect_base_delay: Base delay in seconds for reconnect backoff
+            use_uvloop: Install uvloop's event loop policy (recommended for
+                persistent connections in production); only affects event
+                loops created afterwards, so create the client before
+                calling asyncio.run()
+            enable_profiling: Record per-task timings, see get_task_stats()
         """
         self.raw_ssid = ssid
         self.is_demo = is_demo
@@ -73,11 +128,23 @@ class AsyncPocketOptionClient:
         self.persistent_connection = persistent_connection
         self.auto_reconnect = auto_reconnect
         self.enable_logging = enable_logging
+        self.max_reconnect_attempts = max_reconnect_attempts
+        self.reconnect_base_delay = reconnect_base_delay
+
+        if use_uvloop:
+            try:
+                import uvloop
+
+                asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+            except ImportError:
+                logger.warning("uvloop is not installed, using the default event loop")
 
         # Configure logging based on preference
         if not enable_logging:
             logger.remove()
             logger.add(lambda msg: None, level="CRITICAL")  # Disable most logging
+        self._auth_message: Optional[str] = None
+        self._auth_message_key: Optional[tuple] = None
         # Parse SSID if it's a complete auth message
         self._original_demo = None  # Store original demo value from SSID
         if ssid.startswith('42["auth",'):
@@ -89,13 +156,48 @@ class AsyncPocketOptionClient:
 
         # Core components
         self._websocket = AsyncWebSocketClient()
-        self._balance: Optional[Balance] = None
+        self._balance_value: Optional[Balance] = None
+        self._balance_updated_monotonic = 0.0
+        # Resolved by _on_balance_updated after a getBalance request
+        self._balance_future: Optional[asyncio.Future] = None
         self._orders: Dict[str, OrderResult] = {}
         self._active_orders: Dict[str, OrderResult] = {}
         self._order_results: Dict[str, OrderResult] = {}
-        self._candles_cache: Dict[str, List[Candle]] = {}
+        # Latest known state of every tracked order, active or completed
+        self._orders_index: Dict[str, OrderResult] = {}
+        # Request ids only need to be unique within this client
+        self._instance_id = uuid.uuid4().hex[:8]
+        self._order_seq = itertools.count()
+        # Pending candle requests keyed by "<asset>_<period>"
+        self._candle_requests: Dict[str, asyncio.Future] = {}
+        # Events set when an order completes, awaited by check_win
+        self._order_events: Dict[str, asyncio.Event] = {}
+        # Number of check_win calls currently waiting on each order's event
+        self._order_waiters: Dict[str, int] = {}
+        # Futures resolved by _on_json_data when the server acknowledges an order
+        self._pending_order_futures: Dict[str, asyncio.Future] = {}
+        # Set by _on_authenticated; recreated before every connection attempt
+        self._auth_event = asyncio.Event()
+        # Set by _on_disconnected, cleared before every reconnection attempt
+        self._disconnected_event = asyncio.Event()
+        # Least recently used asset/timeframe entries are evicted first
+        self._candles_cache: "OrderedDict[str, List[Candle]]" = OrderedDict()
         self._server_time: Optional[ServerTime] = None
-        self._event_callbacks: Dict[str, List[Callable]] = defaultdict(list)
+        # Callbacks are kept as insertion-ordered sets (dict keys) per event
+        self._event_callbacks: Dict[str, Dict[Callable, None]] = {}
+        # Immutable per-event (is_coroutine, callback) snapshots rebuilt on
+        # add/remove, read on dispatch
+        self._event_callbacks_snapshot: Dict[str, tuple] = {}
+        # Keep-alive event name -> handler, looked up once per message
+        self._keep_alive_dispatch: Dict[str, Callable] = {
+            "authenticated": self._on_authenticated,
+            # balance_data is the same payload in a different message format
+            "balance_data": self._on_balance_updated,
+            "balance_updated": self._on_balance_updated,
+            "order_opened": self._on_order_opened,
+            "order_closed": self._on_order_closed,
+            "stream_update": self._on_stream_update,
+        }
         # Setup event handlers for websocket messages
         self._setup_event_handlers()
 
@@ -107,12 +209,15 @@ class AsyncPocketOptionClient:
         self._health_checker = health_checker
 
         # Performance tracking
-        self._operation_metrics: Dict[str, List[float]] = defaultdict(list)
+        self._task_profiler = TaskProfiler() if enable_profiling else None
+        # Latest operation durations in seconds, bounded per operation
+        self._operation_metrics: Dict[str, Deque[float]] = defaultdict(
+            lambda: deque(maxlen=1024)
+        )
         self._last_health_check = time.time()
 
         # Keep-alive functionality (based on old API patterns)
         self._keep_alive_manager = None
-        self._ping_task: Optional[asyncio.Task] = None
         self._reconnect_task: Optional[asyncio.Task] = None
         self._is_persistent = False
 
@@ -133,16 +238,39 @@ class AsyncPocketOptionClient:
             else ""
         )
 
+    @classmethod
+    def from_parsed(
+        cls, payload: Dict[str, Any], is_demo: bool = True, **kwargs: Any
+    ) -> "AsyncPocketOptionClient":
+        """
+        Create a client from an already parsed SSID auth payload
+
+        Useful when many clients share the same SSID, so the auth message
+        only has to be parsed once.
+
+        Args:
+            payload: Auth payload dict (the JSON object inside 42["auth",{...}])
+            is_demo: Whether to use demo account
+            **kwargs: Any other constructor argument
+
+        Returns:
+            AsyncPocketOptionClient: New client instance
+        """
+        client = cls(
+            ssid=payload.get("session", ""),
+            is_demo=is_demo,
+            uid=payload.get("uid", 0),
+            platform=payload.get("platform", 1),
+            is_fast_history=bool(payload.get("isFastHistory", True)),
+            **kwargs,
+        )
+        client._original_demo = bool(payload.get("isDemo", 1))
+        return client
+
     def _setup_event_handlers(self):
         """Setup WebSocket event handlers"""
-        self._websocket.add_event_handler("authenticated", self._on_authenticated)
-        self._websocket.add_event_handler("balance_updated", self._on_balance_updated)
-        self._websocket.add_event_handler(
-            "balance_data", self._on_balance_data
-        )  # Add balance_data handler
-        self._websocket.add_event_handler("order_opened", self._on_order_opened)
-        self._websocket.add_event_handler("order_closed", self._on_order_closed)
-        self._websocket.add_event_handler("stream_update", self._on_stream_update)
+        for event, handler in self._keep_alive_dispatch.items():
+            self._websocket.add_event_handler(event, handler)
         self._websocket.add_event_handler("candles_received", self._on_candles_received)
         self._websocket.add_event_handler("disconnected", self._on_disconnected)
 
@@ -184,45 +312,51 @@ class AsyncPocketOptionClient:
         self, regions: Optional[List[str]] = None
     ) -> bool:
         """Start regular connection (existing behavior)"""
+        global _last_good_region
         logger.info("Starting regular connection...")
         # Use appropriate regions based on demo mode
         if not regions:
             if self.is_demo:
                 # For demo mode, only use demo regions
-                demo_urls = REGIONS.get_demo_regions()
-                regions = []
-                all_regions = REGIONS.get_all_regions()
-                for name, url in all_regions.items():
-                    if url in demo_urls:
-                        regions.append(name)
+                regions = list(_DEMO_REGION_NAMES)
                 logger.info(f"Demo mode: Using demo regions: {regions}")
             else:
                 # For live mode, use all regions except demo
-                all_regions = REGIONS.get_all_regions()
-                regions = [
-                    name
-                    for name, url in all_regions.items()
-                    if "DEMO" not in name.upper()
-                ]
+                regions = list(_LIVE_REGION_NAMES)
                 logger.info(f"Live mode: Using non-demo regions: {regions}")
+        if _last_good_region in regions:
+            regions = [_last_good_region] + [
+                region for region in regions if region != _last_good_region
+            ]
         # Update connection stats
         self._connection_stats["total_connections"] += 1
         self._connection_stats["connection_start_time"] = time.time()
 
+        # Regions are raced in batches of parallel_connects; the websocket
+        # client keeps the first endpoint of a batch that completes the
+        # handshake, and the next batch is only tried if that one fails
+        urls_by_region = {}
         for region in regions:
+            region_url = REGIONS.get_region(region)
+            if region_url:
+                urls_by_region[region_url] = region
+        candidates = list(urls_by_region)
+        batch_size = CONNECTION_SETTINGS["parallel_connects"]
+
+        for start in range(0, len(candidates), batch_size):
+            urls = candidates[start : start + batch_size]
+            region = ", ".join(urls_by_region[url] for url in urls)
             try:
-                region_url = REGIONS.get_region(region)
-                if not region_url:
-                    continue
-
-                urls = [region_url]  # Convert single URL to list
-                logger.info(f"Trying region: {region} with URL: {region_url}")
+                logger.info(f"Trying regions: {region}")
 
                 # Try to connect
+                self._auth_event = asyncio.Event()
                 ssid_message = self._format_session_message()
                 success = await self._websocket.connect(urls, ssid_message)
 
                 if success:
+                    region = urls_by_region[self._websocket.connection_info.url]
+                    _last_good_region = region
                     logger.info(f" Connected to region: {region}")
 
                     # Wait for authentication
@@ -240,6 +374,9 @@ class AsyncPocketOptionClient:
 
             except Exception as e:
                 logger.warning(f"Failed to connect to region {region}: {e}")
+                # Don't leave a half-open socket behind before the next batch
+                if self._websocket.websocket is not None:
+                    await self._websocket.disconnect()
                 continue
 
         return False
@@ -254,8 +391,13 @@ class AsyncPocketOptionClient:
         from .connection_keep_alive import ConnectionKeepAlive
 
         # Create keep-alive manager
-        complete_ssid = self.raw_ssid
-        self._keep_alive_manager = ConnectionKeepAlive(complete_ssid, self.is_demo)
+        complete_ssid = self._format_session_message()
+        self._keep_alive_manager = ConnectionKeepAlive(
+            complete_ssid,
+            self.is_demo,
+            max_reconnect_attempts=self.max_reconnect_attempts,
+            reconnect_base_delay=self.reconnect_base_delay,
+        )
 
         # Add event handlers
         self._keep_alive_manager.add_event_handler(
@@ -269,24 +411,8 @@ class AsyncPocketOptionClient:
         )
 
         # Add handlers for forwarded WebSocket events
-        self._keep_alive_manager.add_event_handler(
-            "balance_data", self._on_balance_data
-        )
-        self._keep_alive_manager.add_event_handler(
-            "balance_updated", self._on_balance_updated
-        )
-        self._keep_alive_manager.add_event_handler(
-            "authenticated", self._on_authenticated
-        )
-        self._keep_alive_manager.add_event_handler(
-            "order_opened", self._on_order_opened
-        )
-        self._keep_alive_manager.add_event_handler(
-            "order_closed", self._on_order_closed
-        )
-        self._keep_alive_manager.add_event_handler(
-            "stream_update", self._on_stream_update
-        )
+        for event, handler in self._keep_alive_dispatch.items():
+            self._keep_alive_manager.add_event_handler(event, handler)
         self._keep_alive_manager.add_event_handler("json_data", self._on_json_data)
 
         # Connect with keep-alive
@@ -304,51 +430,64 @@ class AsyncPocketOptionClient:
         """Start keep-alive tasks for regular connection"""
         logger.info("Starting keep-alive tasks for regular connection...")
 
-        # Start ping task (like old API)
-        self._ping_task = asyncio.create_task(self._ping_loop())
+        # Pings are sent by the websocket client while the connection is idle
 
-        # Start reconnection monitor if auto_reconnect is enabled
-        if self.auto_reconnect:
-            self._reconnect_task = asyncio.create_task(self._reconnection_monitor())
+        # Start reconnection monitor if auto_reconnect is enabled; a monitor
+        # that is itself reconnecting keeps running
+        if self.auto_reconnect and (
+            self._reconnect_task is None or self._reconnect_task.done()
+        ):
+            self._reconnect_task = self._create_task(
+                self._reconnection_monitor(), "pocketoption.reconnect_monitor"
+            )
 
-    async def _ping_loop(self):
-        """Ping loop for regular connections (like old API)"""
-        while self.is_connected and not self._is_persistent:
-            try:
-                await self._websocket.send_message('42["ps"]')
-                self._connection_stats["last_ping_time"] = time.time()
-                await asyncio.sleep(20)  # Ping every 20 seconds
-            except Exception as e:
-                logger.warning(f"Ping failed: {e}")
-                break
+    def _create_task(self, coro, name: str) -> asyncio.Task:
+        """Create a named background task, profiled when enabled"""
+        if self._task_profiler is not None:
+            coro = self._task_profiler.wrap(coro, name)
+        return asyncio.create_task(coro, name=name)
 
     async def _reconnection_monitor(self):
-        """Monitor and handle reconnections for regular connections"""
+        """Reconnect regular connections as soon as a disconnect is reported"""
+        attempt = 0
         while self.auto_reconnect and not self._is_persistent:
-            await asyncio.sleep(30)  # Check every 30 seconds
+            await self._disconnected_event.wait()
 
-            if not self.is_connected:
-                logger.info("Connection lost, attempting reconnection...")
-                self._connection_stats["total_reconnects"] += 1
+            if self.is_connected:
+                self._disconnected_event.clear()
+                continue
 
-                try:
-                    success = await self._start_regular_connection()
-                    if success:
-                        logger.info(" Reconnection successful")
-                    else:
-                        logger.error("Reconnection failed")
-                        await asyncio.sleep(10)  # Wait before next attempt
-                except Exception as e:
-                    logger.error(f"Reconnection error: {e}")
-                    await asyncio.sleep(10)
+            logger.info("Connection lost, attempting reconnection...")
+            self._connection_stats["total_reconnects"] += 1
+
+            # Cleared before the attempt, so a drop while the new connection
+            # is being set up is picked up on the next pass
+            self._disconnected_event.clear()
+            try:
+                success = await self._start_regular_connection()
+            except Exception as e:
+                logger.error(f"Reconnection error: {e}")
+                success = False
+
+            if success:
+                logger.info(" Reconnection successful")
+                attempt = 0
+            else:
+                logger.error("Reconnection failed")
+                # Exponential backoff with jitter, as in the other reconnect paths
+                delay = min(
+                    30.0, self.reconnect_base_delay * 2 ** min(attempt, 6)
+                ) * random.uniform(0.5, 1.5)
+                attempt += 1
+                await asyncio.sleep(delay)
+                # Still disconnected, so retry without waiting for a new drop
+                self._disconnected_event.set()
 
     async def disconnect(self) -> None:
         """Disconnect from PocketOption and cleanup all resources"""
         logger.info("Disconnecting from PocketOption...")
 
         # Cancel tasks
-        if self._ping_task:
-            self._ping_task.cancel()
         if self._reconnect_task:
             self._reconnect_task.cancel()
 
@@ -376,14 +515,14 @@ class AsyncPocketOptionClient:
             raise ConnectionError("Not connected to PocketOption")
 
         # Request balance update if needed
-        if (
-            not self._balance
-            or (datetime.now() - self._balance.last_updated).seconds > 60
-        ):
+        if not self._balance or time.monotonic() - self._balance_updated_monotonic > 60:
             await self._request_balance_update()
 
-            # Wait a bit for balance to be received
-            await asyncio.sleep(1)
+            # Wait for the balance to be received
+            try:
+                await asyncio.wait_for(asyncio.shield(self._balance_future), 5.0)
+            except asyncio.TimeoutError:
+                pass
 
         if not self._balance:
             raise PocketOptionError("Balance data not available")
@@ -412,7 +551,7 @@ class AsyncPocketOptionClient:
 
         try:
             # Create order
-            order_id = str(uuid.uuid4())
+            order_id = f"{self._instance_id}-{next(self._order_seq)}"
             order = Order(
                 asset=asset,
                 amount=amount,
@@ -420,13 +559,16 @@ class AsyncPocketOptionClient:
                 duration=duration,
                 request_id=order_id,  # Use request_id, not order_id
             )  # Send order
+            start = time.perf_counter()
             await self._send_order(order)
 
             # Wait for result (this will either get the real server response or create a fallback)
             result = await self._wait_for_order_result(order_id, order)
+            self._operation_metrics["place_order"].append(time.perf_counter() - start)
 
             # Don't store again - _wait_for_order_result already handles storage
-            logger.info(f"Order placed: {result.order_id} - {result.status}")
+            if self.enable_logging:
+                logger.info(f"Order placed: {result.order_id} - {result.status}")
             return result
 
         except Exception as e:
@@ -455,9 +597,10 @@ class AsyncPocketOptionClient:
         # Check connection and attempt reconnection if needed
         if not self.is_connected:
             if self.auto_reconnect:
-                logger.info(
-                    f"Connection lost, attempting reconnection for {asset} candles..."
-                )
+                if self.enable_logging:
+                    logger.info(
+                        f"Connection lost, attempting reconnection for {asset} candles..."
+                    )
                 reconnected = await self._attempt_reconnection()
                 if not reconnected:
                     raise ConnectionError(
@@ -484,28 +627,38 @@ class AsyncPocketOptionClient:
         for attempt in range(max_retries):
             try:
                 # Request candle data
+                start = time.perf_counter()
                 candles = await self._request_candles(
                     asset, timeframe_seconds, count, end_time
                 )
+                self._operation_metrics["get_candles"].append(
+                    time.perf_counter() - start
+                )
 
                 # Cache results
                 cache_key = f"{asset}_{timeframe_seconds}"
                 self._candles_cache[cache_key] = candles
+                self._candles_cache.move_to_end(cache_key)
+                if len(self._candles_cache) > API_LIMITS["candles_cache_size"]:
+                    self._candles_cache.popitem(last=False)
 
-                logger.info(f"Retrieved {len(candles)} candles for {asset}")
+                if self.enable_logging:
+                    logger.info(f"Retrieved {len(candles)} candles for {asset}")
                 return candles
 
             except Exception as e:
                 if "WebSocket is not connected" in str(e) and attempt < max_retries - 1:
-                    logger.warning(
-                        f"Connection lost during candle request for {asset}, attempting reconnection..."
-                    )
+                    if self.enable_logging:
+                        logger.warning(
+                            f"Connection lost during candle request for {asset}, attempting reconnection..."
+                        )
                     if self.auto_reconnect:
                         reconnected = await self._attempt_reconnection()
                         if reconnected:
-                            logger.info(
-                                f" Reconnected, retrying candle request for {asset}"
-                            )
+                            if self.enable_logging:
+                                logger.info(
+                                    f" Reconnected, retrying candle request for {asset}"
+                                )
                             continue
 
                 logger.error(f"Failed to get candles for {asset}: {e}")
@@ -534,27 +687,41 @@ class AsyncPocketOptionClient:
         """
         candles = await self.get_candles(asset, timeframe, count, end_time)
 
-        # Convert to DataFrame
-        data = []
-        for candle in candles:
-            data.append(
-                {
-                    "timestamp": candle.timestamp,
-                    "open": candle.open,
-                    "high": candle.high,
-                    "low": candle.low,
-                    "close": candle.close,
-                    "volume": candle.volume,
-                }
-            )
-        df = pd.DataFrame(data)
+        # Convert to DataFrame from plain row tuples
+        df = pd.DataFrame(list(map(_candle_row, candles)), columns=_CANDLE_COLUMNS)
 
         if not df.empty:
             df.set_index("timestamp", inplace=True)
-            df.sort_index(inplace=True)
+            # Candle feeds are normally already in time order
+            if not df.index.is_monotonic_increasing:
+                df.sort_index(inplace=True)
 
         return df
 
+    async def get_candles_batch(
+        self,
+        asset: str,
+        timeframe: Union[str, int],
+        count: int = 100,
+        end_time: Optional[datetime] = None,
+    ) -> CandleBatch:
+        """
+        Get historical candle data as a columnar CandleBatch
+
+        Args:
+            asset: Asset symbol
+            timeframe: Timeframe (e.g., "1m", "5m", 60)
+            count: Number of candles to retrieve
+            end_time: End time for data (defaults to now)
+
+        Returns:
+            CandleBatch: Historical candle data as NumPy arrays
+        """
+        candles = await self.get_candles(asset, timeframe, count, end_time)
+        if isinstance(timeframe, str):
+            timeframe = TIMEFRAMES.get(timeframe, 60)
+        return CandleBatch.from_candles(candles, asset, timeframe)
+
     async def check_order_result(self, order_id: str) -> Optional[OrderResult]:
         """
         Check the result of a specific order
@@ -565,16 +732,7 @@ class AsyncPocketOptionClient:
         Returns:
             OrderResult: Order result or None if not found
         """
-        # First check active orders
-        if order_id in self._active_orders:
-            return self._active_orders[order_id]
-
-        # Then check completed orders
-        if order_id in self._order_results:
-            return self._order_results[order_id]
-
-        # Not found
-        return None
+        return self._orders_index.get(order_id)
 
     async def get_active_orders(self) -> List[OrderResult]:
         """
@@ -593,9 +751,9 @@ class AsyncPocketOptionClient:
             event: Event name (e.g., 'order_closed', 'balance_updated')
             callback: Callback function
         """
-        if event not in self._event_callbacks:
-            self._event_callbacks[event] = []
-        self._event_callbacks[event].append(callback)
+        callbacks = self._event_callbacks.setdefault(event, {})
+        callbacks[callback] = None
+        self._event_callbacks_snapshot[event] = self._snapshot_callbacks(callbacks)
 
     def remove_event_callback(self, event: str, callback: Callable) -> None:
         """
@@ -605,11 +763,32 @@ class AsyncPocketOptionClient:
             event: Event name
             callback: Callback function to remove
         """
-        if event in self._event_callbacks:
-            try:
-                self._event_callbacks[event].remove(callback)
-            except ValueError:
-                pass
+        callbacks = self._event_callbacks.get(event)
+        if callbacks is not None:
+            callbacks.pop(callback, None)
+            if callbacks:
+                self._event_callbacks_snapshot[event] = self._snapshot_callbacks(
+                    callbacks
+                )
+            else:
+                del self._event_callbacks[event]
+                del self._event_callbacks_snapshot[event]
+
+    @staticmethod
+    def _snapshot_callbacks(callbacks: Dict[Callable, None]) -> tuple:
+        """Classify callbacks once so dispatch doesn't re-inspect them"""
+        return tuple((asyncio.iscoroutinefunction(cb), cb) for cb in callbacks)
+
+    @property
+    def _balance(self) -> Optional[Balance]:
+        """Latest known balance"""
+        return self._balance_value
+
+    @_balance.setter
+    def _balance(self, balance: Optional[Balance]) -> None:
+        # Age is tracked on the monotonic clock, immune to wall clock jumps
+        self._balance_value = balance
+        self._balance_updated_monotonic = time.monotonic()
 
     @property
     def is_connected(self) -> bool:
@@ -639,6 +818,28 @@ class AsyncPocketOptionClient:
             logger.error(f"Failed to send message: {e}")
             return False
 
+    async def measure_latency(self, timeout: float = 5.0) -> float:
+        """
+        Measure round-trip time to the server with a WebSocket ping frame
+
+        Args:
+            timeout: Seconds to wait for the matching pong
+
+        Returns:
+            float: Round-trip time in seconds
+        """
+        if self._is_persistent and self._keep_alive_manager:
+            ws = self._keep_alive_manager.websocket
+        else:
+            ws = self._websocket.websocket
+        if ws is None:
+            raise ConnectionError("Not connected to PocketOption")
+
+        start = time.perf_counter()
+        pong_waiter = await ws.ping()
+        await asyncio.wait_for(pong_waiter, timeout)
+        return time.perf_counter() - start
+
     def get_connection_stats(self) -> Dict[str, Any]:
         """Get comprehensive connection statistics"""
         stats = self._connection_stats.copy()
@@ -646,17 +847,68 @@ class AsyncPocketOptionClient:
         if self._is_persistent and self._keep_alive_manager:
             stats.update(self._keep_alive_manager.get_stats())
         else:
+            info = self._websocket.connection_info
+            if info and info.last_ping:
+                stats["last_ping_time"] = info.last_ping.timestamp()
             stats.update(
                 {
                     "websocket_connected": self._websocket.is_connected,
-                    "connection_info": self._websocket.connection_info,
+                    "connection_info": info,
                 }
             )
 
         return stats  # Private methods
 
+    def get_operation_metrics(self) -> Dict[str, Dict[str, float]]:
+        """
+        Get latency statistics for recent operations
+
+        Returns:
+            Dict mapping operation names to count, mean, p50, p95 and p99
+            durations in seconds over the last 1024 calls
+        """
+        metrics = {}
+        for operation, durations in self._operation_metrics.items():
+            if not durations:
+                continue
+            values = np.fromiter(durations, dtype=float, count=len(durations))
+            p50, p95, p99 = np.percentile(values, (50, 95, 99))
+            metrics[operation] = {
+                "count": len(values),
+                "mean": float(values.mean()),
+                "p50": float(p50),
+                "p95": float(p95),
+                "p99": float(p99),
+            }
+        return metrics
+
+    def get_task_stats(self) -> Dict[str, Dict[str, float]]:
+        """
+        Get per-task timing statistics
+
+        Returns:
+            Dict mapping task names to runs, steps, busy_time and wall_time
+            (seconds); empty unless the client was created with
+            enable_profiling=True
+        """
+        if self._task_profiler is None:
+            return {}
+        return self._task_profiler.get_stats()
+
     def _format_session_message(self) -> str:
         """Format session authentication message"""
+        # The message only changes if one of its components does, so it is
+        # serialized once and reused for every connect and region attempt
+        key = (
+            self.session_id,
+            self.is_demo,
+            self.uid,
+            self.platform,
+            self.is_fast_history,
+        )
+        if self._auth_message_key == key:
+            return self._auth_message
+
         # Always create auth message from components using constructor parameters
         # This ensures is_demo parameter is respected regardless of SSID format
         auth_data = {
@@ -669,16 +921,24 @@ class AsyncPocketOptionClient:
         if self.is_fast_history:
             auth_data["isFastHistory"] = True
 
-        return f'42["auth",{json.dumps(auth_data)}]'
+        self._auth_message = f'42["auth",{json.dumps(auth_data)}]'
+        self._auth_message_key = key
+        return self._auth_message
 
     def _parse_complete_ssid(self, ssid: str) -> None:
         """Parse complete SSID auth message to extract components"""
         try:
             # Extract JSON part
-            json_start = ssid.find("{")
-            json_end = ssid.rfind("}") + 1
-            if json_start != -1 and json_end > json_start:
-                json_part = ssid[json_start:json_end]
+            match = _SSID_RE.match(ssid)
+            if match:
+                json_part = match.group(1)
+            else:
+                json_start = ssid.find("{")
+                json_end = ssid.rfind("}") + 1
+                json_part = ""
+                if json_start != -1 and json_end > json_start:
+                    json_part = ssid[json_start:json_end]
+            if json_part:
                 data = json.loads(json_part)
 
                 self.session_id = data.get("session", "")
@@ -696,27 +956,10 @@ class AsyncPocketOptionClient:
 
     async def _wait_for_authentication(self, timeout: float = 10.0) -> None:
         """Wait for authentication to complete (like old API)"""
-        auth_received = False
-
-        def on_auth(data):
-            nonlocal auth_received
-            auth_received = True
-
-        # Add temporary handler
-        self._websocket.add_event_handler("authenticated", on_auth)
-
         try:
-            # Wait for authentication
-            start_time = time.time()
-            while not auth_received and (time.time() - start_time) < timeout:
-                await asyncio.sleep(0.1)
-
-            if not auth_received:
-                raise AuthenticationError("Authentication timeout")
-
-        finally:
-            # Remove temporary handler
-            self._websocket.remove_event_handler("authenticated", on_auth)
+            await asyncio.wait_for(self._auth_event.wait(), timeout)
+        except asyncio.TimeoutError:
+            raise AuthenticationError("Authentication timeout")
 
     async def _initialize_data(self) -> None:
         """Initialize client data after connection"""
@@ -728,6 +971,8 @@ class AsyncPocketOptionClient:
 
     async def _request_balance_update(self) -> None:
         """Request balance update from server"""
+        if self._balance_future is None or self._balance_future.done():
+            self._balance_future = asyncio.get_running_loop().create_future()
         message = '42["getBalance"]'
 
         # Use appropriate connection method
@@ -770,11 +1015,21 @@ class AsyncPocketOptionClient:
 
     async def _send_order(self, order: Order) -> None:
         """Send order to server"""
-        # Format asset name with # prefix if not already present
-        asset_name = order.asset
-
-        # Create the message in the correct PocketOption format
-        message = f'42["openOrder",{{"asset":"{asset_name}","amount":{order.amount},"action":"{order.direction.value}","isDemo":{1 if self.is_demo else 0},"requestId":"{order.request_id}","optionType":100,"time":{order.duration}}}]'
+        # Create the message in the correct PocketOption format; json.dumps
+        # takes care of escaping the asset and request id
+        payload = json.dumps(
+            {
+                "asset": order.asset,
+                "amount": order.amount,
+                "action": order.direction.value,
+                "isDemo": 1 if self.is_demo else 0,
+                "requestId": order.request_id,
+                "optionType": 100,
+                "time": order.duration,
+            },
+            separators=(",", ":"),
+        )
+        message = f'42["openOrder",{payload}]'
 
         # Send using appropriate connection
         if self._is_persistent and self._keep_alive_manager:
@@ -783,50 +1038,41 @@ class AsyncPocketOptionClient:
             await self._websocket.send_message(message)
 
         if self.enable_logging:
-            logger.debug(f"Sent order: {message}")
+            logger.debug("Sent order: {}", message)
 
     async def _wait_for_order_result(
         self, request_id: str, order: Order, timeout: float = 30.0
     ) -> OrderResult:
         """Wait for order execution result"""
-        start_time = time.time()
-
-        # Wait for order to appear in tracking system
-        while time.time() - start_time < timeout:
-            # Check if order was added to active orders (by _on_order_opened or _on_json_data)
-            if request_id in self._active_orders:
-                if self.enable_logging:
-                    logger.success(f" Order {request_id} found in active tracking")
-                return self._active_orders[request_id]
-
-            # Check if order went directly to results (failed or completed)
-            if request_id in self._order_results:
-                if self.enable_logging:
-                    logger.info(f"📋 Order {request_id} found in completed results")
-                return self._order_results[request_id]
-
-            await asyncio.sleep(0.2)  # Check every 200ms
-
-        # Check one more time before creating fallback
+        # The order may already have been tracked while it was being sent
         if request_id in self._active_orders:
             if self.enable_logging:
-                logger.success(
-                    f" Order {request_id} found in active tracking (final check)"
-                )
+                logger.success(f" Order {request_id} found in active tracking")
             return self._active_orders[request_id]
 
         if request_id in self._order_results:
             if self.enable_logging:
-                logger.info(
-                    f"📋 Order {request_id} found in completed results (final check)"
-                )
+                logger.info(f"📋 Order {request_id} found in completed results")
             return self._order_results[request_id]
 
+        future = asyncio.get_running_loop().create_future()
+        self._pending_order_futures[request_id] = future
+        try:
+            result = await asyncio.wait_for(future, timeout)
+            if self.enable_logging:
+                logger.success(f" Order {request_id} confirmed by server")
+            return result
+        except asyncio.TimeoutError:
+            pass
+        finally:
+            self._pending_order_futures.pop(request_id, None)
+
         # If timeout, create a fallback result with the original order data
         if self.enable_logging:
             logger.warning(
                 f"⏰ Order {request_id} timed out waiting for server response, creating fallback result"
             )
+        now = datetime.now()
         fallback_result = OrderResult(
             order_id=request_id,
             asset=order.asset,
@@ -834,11 +1080,11 @@ class AsyncPocketOptionClient:
             direction=order.direction,
             duration=order.duration,
             status=OrderStatus.ACTIVE,  # Assume it's active since it was placed
-            placed_at=datetime.now(),
-            expires_at=datetime.now() + timedelta(seconds=order.duration),
+            placed_at=now,
+            expires_at=now + timedelta(seconds=order.duration),
             error_message="Timeout waiting for server confirmation",
         )  # Store it in active orders in case server responds later
-        self._active_orders[request_id] = fallback_result
+        self._track_active_order(request_id, fallback_result)
         if self.enable_logging:
             logger.info(f"📝 Created fallback order result for {request_id}")
         return fallback_result
@@ -856,55 +1102,64 @@ class AsyncPocketOptionClient:
         Returns:
             Dictionary with trade result or None if timeout/error
         """
-        start_time = time.time()
-
         if self.enable_logging:
             logger.info(
                 f"🔍 Starting check_win for order {order_id}, max wait: {max_wait_time}s"
             )
 
-        while time.time() - start_time < max_wait_time:
-            # Check if order is in completed results
-            if order_id in self._order_results:
-                result = self._order_results[order_id]
+        if order_id not in self._order_results:
+            if self.enable_logging and order_id in self._active_orders:
+                expires_at = self._active_orders[order_id].expires_at
+                logger.opt(lazy=True).debug(
+                    "⌛ Order {} still active, expires in {:.0f}s",
+                    lambda: order_id,
+                    lambda: (expires_at - datetime.now()).total_seconds(),
+                )
+
+            # Woken by _complete_order when the deal result arrives
+            event = self._order_events.get(order_id)
+            if event is None:
+                event = self._order_events[order_id] = asyncio.Event()
+            self._order_waiters[order_id] = self._order_waiters.get(order_id, 0) + 1
+            loop = asyncio.get_running_loop()
+            start = loop.time()
+            try:
+                await asyncio.wait_for(event.wait(), max_wait_time)
+            except asyncio.TimeoutError:
                 if self.enable_logging:
-                    logger.success(
-                        f" Order {order_id} completed - Status: {result.status.value}, Profit: ${result.profit:.2f}"
+                    logger.debug(
+                        f"Waited {loop.time() - start:.1f}s for order {order_id}"
                     )
-
-                return {
-                    "result": "win"
-                    if result.status == OrderStatus.WIN
-                    else "loss"
-                    if result.status == OrderStatus.LOSE
-                    else "draw",
-                    "profit": result.profit if result.profit is not None else 0,
-                    "order_id": order_id,
-                    "completed": True,
-                    "status": result.status.value,
-                }
-
-            # Check if order is still active (not expired yet)
-            if order_id in self._active_orders:
-                active_order = self._active_orders[order_id]
-                time_remaining = (
-                    active_order.expires_at - datetime.now()
-                ).total_seconds()
-
-                if time_remaining <= 0:
-                    if self.enable_logging:
-                        logger.info(
-                            f"⏰ Order {order_id} expired but no result yet, continuing to wait..."
-                        )
+            finally:
+                waiters = self._order_waiters[order_id] - 1
+                if waiters:
+                    self._order_waiters[order_id] = waiters
                 else:
-                    if (
-                        self.enable_logging and int(time.time() - start_time) % 10 == 0
-                    ):  # Log every 10 seconds
-                        logger.debug(
-                            f"⌛ Order {order_id} still active, expires in {time_remaining:.0f}s"
-                        )
+                    del self._order_waiters[order_id]
+                    # The last waiter drops the event of an order that never
+                    # got a deal, so it isn't left behind
+                    if self._order_events.get(order_id) is event:
+                        del self._order_events[order_id]
+
+        # Check if order is in completed results
+        if order_id in self._order_results:
+            result = self._order_results[order_id]
+            if self.enable_logging:
+                logger.success(
+                    f" Order {order_id} completed - Status: {result.status.value}, Profit: ${result.profit:.2f}"
+                )
 
-            await asyncio.sleep(1.0)  # Check every second
+            return {
+                "result": (
+                    "win"
+                    if result.status == OrderStatus.WIN
+                    else "loss" if result.status == OrderStatus.LOSE else "draw"
+                ),
+                "profit": result.profit if result.profit is not None else 0,
+                "order_id": order_id,
+                "completed": True,
+                "status": result.status.value,
+            }
 
         # Timeout reached
         if self.enable_logging:
@@ -924,33 +1179,24 @@ class AsyncPocketOptionClient:
     ):
         """Request candle data from server using the correct changeSymbol format"""
 
-        # Create message data in the format expected by PocketOption for real-time candles
-        data = {
-            "asset": str(asset),
-            "period": timeframe,  # timeframe in seconds
-        }
-
-        # Create the full message using changeSymbol
-        message_data = ["changeSymbol", data]
-        message = f"42{json.dumps(message_data)}"
+        # Create the full message using changeSymbol (timeframe in seconds)
+        message = _encode_change_symbol(str(asset), timeframe)
 
         if self.enable_logging:
-            logger.debug(f"Requesting candles with changeSymbol: {message}")
+            logger.debug("Requesting candles with changeSymbol: {}", message)
 
         # Create a future to wait for the response
         candle_future = asyncio.Future()
         request_id = f"{asset}_{timeframe}"
 
         # Store the future for this request
-        if not hasattr(self, "_candle_requests"):
-            self._candle_requests = {}
         self._candle_requests[request_id] = candle_future
 
         # Send the request using appropriate connection
         if self._is_persistent and self._keep_alive_manager:
             await self._keep_alive_manager.send_message(message)
         else:
-            await self._websocket.send_message(message)
+            self._websocket.queue_message(message, candle_future)
 
         try:
             # Wait for the response (with timeout)
@@ -971,30 +1217,8 @@ class AsyncPocketOptionClient:
 
         try:
             if isinstance(candles_data, list):
-                for candle_data in candles_data:
-                    if isinstance(candle_data, (list, tuple)) and len(candle_data) >= 5:
-                        # Server format: [timestamp, open, low, high, close]
-                        # Note: Server sends low/high swapped compared to standard OHLC format
-                        raw_high = float(candle_data[2])
-                        raw_low = float(candle_data[3])
-
-                        # Ensure high >= low by swapping if necessary
-                        actual_high = max(raw_high, raw_low)
-                        actual_low = min(raw_high, raw_low)
-
-                        candle = Candle(
-                            timestamp=datetime.fromtimestamp(candle_data[0]),
-                            open=float(candle_data[1]),
-                            high=actual_high,
-                            low=actual_low,
-                            close=float(candle_data[4]),
-                            volume=float(candle_data[5])
-                            if len(candle_data) > 5
-                            else 0.0,
-                            asset=asset,
-                            timeframe=timeframe,
-                        )
-                        candles.append(candle)
+                batch = CandleBatch.from_rows(candles_data, asset, timeframe)
+                candles = batch.to_candles()
 
         except Exception as e:
             if self.enable_logging:
@@ -1008,56 +1232,49 @@ class AsyncPocketOptionClient:
             return
         # Check if this is candles data response
         if "candles" in data and isinstance(data["candles"], list):
-            # Find the corresponding candle request
-            if hasattr(self, "_candle_requests"):
-                # Try to match the request based on asset and period
-                asset = data.get("asset")
-                period = data.get("period")
-                if asset and period:
-                    request_id = f"{asset}_{period}"
-                    if (
-                        request_id in self._candle_requests
-                        and not self._candle_requests[request_id].done()
-                    ):
-                        candles = self._parse_candles_data(
-                            data["candles"], asset, period
+            # Find the corresponding candle request by asset and period
+            asset = data.get("asset")
+            period = data.get("period")
+            if asset and period:
+                future = self._candle_requests.pop(f"{asset}_{period}", None)
+                if future is not None and not future.done():
+                    candles = self._parse_candles_data(data["candles"], asset, period)
+                    future.set_result(candles)
+                    if self.enable_logging:
+                        logger.success(
+                            f" Candles data received: {len(candles)} candles for {asset}"
                         )
-                        self._candle_requests[request_id].set_result(candles)
-                        if self.enable_logging:
-                            logger.success(
-                                f" Candles data received: {len(candles)} candles for {asset}"
-                            )
-                        del self._candle_requests[request_id]
-                        return
             return
 
         # Check if this is detailed order data with requestId
         if "requestId" in data and "asset" in data and "amount" in data:
             request_id = str(data["requestId"])
 
-            # If this is a new order, add it to tracking
-            if (
-                request_id not in self._active_orders
-                and request_id not in self._order_results
-            ):
+            # If this is a new order, add it to tracking (the index holds both
+            # active and completed orders)
+            if request_id not in self._orders_index:
+                now = datetime.now()
+                duration = int(data.get("time", 60))
                 order_result = OrderResult(
                     order_id=request_id,
                     asset=data.get("asset", "UNKNOWN"),
                     amount=float(data.get("amount", 0)),
-                    direction=OrderDirection.CALL
-                    if data.get("command", 0) == 0
-                    else OrderDirection.PUT,
-                    duration=int(data.get("time", 60)),
+                    direction=(
+                        OrderDirection.CALL
+                        if data.get("command", 0) == 0
+                        else OrderDirection.PUT
+                    ),
+                    duration=duration,
                     status=OrderStatus.ACTIVE,
-                    placed_at=datetime.now(),
-                    expires_at=datetime.now()
-                    + timedelta(seconds=int(data.get("time", 60))),
+                    placed_at=now,
+                    expires_at=now + timedelta(seconds=duration),
                     profit=float(data.get("profit", 0)) if "profit" in data else None,
                     payout=data.get("payout"),
                 )
 
                 # Add to active orders
-                self._active_orders[request_id] = order_result
+                self._track_active_order(request_id, order_result)
+                self._resolve_order_future(request_id, order_result)
                 if self.enable_logging:
                     logger.success(
                         f" Order {request_id} added to tracking from JSON data"
@@ -1067,12 +1284,13 @@ class AsyncPocketOptionClient:
 
         # Check if this is order result data with deals
         elif "deals" in data and isinstance(data["deals"], list):
+            active_get = self._active_orders.get
             for deal in data["deals"]:
                 if isinstance(deal, dict) and "id" in deal:
                     order_id = str(deal["id"])
 
-                    if order_id in self._active_orders:
-                        active_order = self._active_orders[order_id]
+                    active_order = active_get(order_id)
+                    if active_order is not None:
                         profit = float(deal.get("profit", 0))
 
                         # Determine status
@@ -1083,22 +1301,21 @@ class AsyncPocketOptionClient:
                         else:
                             status = OrderStatus.LOSE  # Default for zero profit
 
-                        result = OrderResult(
-                            order_id=active_order.order_id,
-                            asset=active_order.asset,
-                            amount=active_order.amount,
-                            direction=active_order.direction,
-                            duration=active_order.duration,
-                            status=status,
-                            placed_at=active_order.placed_at,
-                            expires_at=active_order.expires_at,
-                            profit=profit,
-                            payout=deal.get("payout"),
+                        # model_copy skips validation, so coerce payout as
+                        # the OrderResult field would
+                        payout = deal.get("payout")
+                        result = active_order.model_copy(
+                            update={
+                                "status": status,
+                                "profit": profit,
+                                "payout": float(payout) if payout is not None else None,
+                                "error_message": None,
+                            }
                         )
 
                         # Move from active to completed
-                        self._order_results[order_id] = result
-                        del self._active_orders[order_id]
+                        self._complete_order(order_id, result)
+                        self._resolve_order_future(order_id, result)
 
                         if self.enable_logging:
                             logger.success(
@@ -1106,22 +1323,49 @@ class AsyncPocketOptionClient:
                             )
                             await self._emit_event("order_closed", result)
 
+    def _track_active_order(self, order_id: str, result: OrderResult) -> None:
+        """Record an order as active"""
+        self._active_orders[order_id] = result
+        self._orders_index[order_id] = result
+
+    def _complete_order(self, order_id: str, result: OrderResult) -> None:
+        """Move an order from active to completed"""
+        self._order_results[order_id] = result
+        self._active_orders.pop(order_id, None)
+        self._orders_index[order_id] = result
+
+        event = self._order_events.pop(order_id, None)
+        if event is not None:
+            event.set()
+
+    def _resolve_order_future(self, order_id: str, result: OrderResult) -> None:
+        """Wake up a place_order call waiting for this order, if any"""
+        future = self._pending_order_futures.get(order_id)
+        if future is not None and not future.done():
+            future.set_result(result)
+
     async def _emit_event(self, event: str, data: Any) -> None:
         """Emit event to registered callbacks"""
-        if event in self._event_callbacks:
-            for callback in self._event_callbacks[event]:
-                try:
-                    if asyncio.iscoroutinefunction(callback):
-                        await callback(data)
-                    else:
-                        callback(data)
-                except Exception as e:
-                    if self.enable_logging:
-                        logger.error(f"Error in event callback for {event}: {e}")
+        # Snapshots are immutable, so callbacks may add/remove callbacks
+        callbacks = self._event_callbacks_snapshot.get(event)
+        if not callbacks:
+            return
+
+        # Callbacks run one at a time in registration order
+        for is_coro, callback in callbacks:
+            try:
+                if is_coro:
+                    await callback(data)
+                else:
+                    callback(data)
+            except Exception as e:
+                if self.enable_logging:
+                    logger.error(f"Error in event callback for {event}: {e}")
 
     # Event handlers
     async def _on_authenticated(self, data: Dict[str, Any]) -> None:
         """Handle authentication success"""
+        self._auth_event.set()
         if self.enable_logging:
             logger.success(" Successfully authenticated with PocketOption")
         self._connection_stats["successful_connections"] += 1
@@ -1136,6 +1380,8 @@ class AsyncPocketOptionClient:
                 is_demo=self.is_demo,
             )
             self._balance = balance
+            if self._balance_future is not None and not self._balance_future.done():
+                self._balance_future.set_result(balance)
             if self.enable_logging:
                 logger.info(f"Balance updated: ${balance.balance:.2f}")
             await self._emit_event("balance_updated", balance)
@@ -1143,11 +1389,6 @@ class AsyncPocketOptionClient:
             if self.enable_logging:
                 logger.error(f"Failed to parse balance data: {e}")
 
-    async def _on_balance_data(self, data: Dict[str, Any]) -> None:
-        """Handle balance data message"""
-        # This is similar to balance_updated but for different message format
-        await self._on_balance_updated(data)
-
     async def _on_order_opened(self, data: Dict[str, Any]) -> None:
         """Handle order opened event"""
         if self.enable_logging:
@@ -1163,7 +1404,7 @@ class AsyncPocketOptionClient:
     async def _on_stream_update(self, data: Dict[str, Any]) -> None:
         """Handle stream update event - includes real-time candle data"""
         if self.enable_logging:
-            logger.debug(f"📡 Stream update: {data}")
+            logger.opt(lazy=True).debug("📡 Stream update: {}", lambda: data)
 
         # Check if this is candle data from changeSymbol subscription
         if (
@@ -1180,38 +1421,37 @@ class AsyncPocketOptionClient:
         if self.enable_logging:
             logger.info(f"🕯️ Candles received with data: {type(data)}")
         # Check if we have pending candle requests
-        if hasattr(self, "_candle_requests") and self._candle_requests:
-            try:
-                for request_id, future in list(self._candle_requests.items()):
-                    if not future.done():
-                        parts = request_id.split("_")
-                        if len(parts) >= 2:
-                            asset = "_".join(parts[:-1])
-                            timeframe = int(parts[-1])
-                            candles = self._parse_candles_data(
-                                data.get("candles", []), asset, timeframe
-                            )
-                            if self.enable_logging:
-                                logger.info(
-                                    f"🕯️ Parsed {len(candles)} candles from response"
-                                )
-                            future.set_result(candles)
-                            if self.enable_logging:
-                                logger.debug(f"Resolved candle request: {request_id}")
-                            break
-            except Exception as e:
+        if self._candle_requests:
+            asset = data.get("asset")
+            period = data.get("period")
+            if asset and period:
+                request_id = f"{asset}_{period}"
+            else:
+                # No routing keys in the payload: resolve the oldest request
+                request_id = next(iter(self._candle_requests))
+                asset, _, period = request_id.rpartition("_")
+            future = self._candle_requests.pop(request_id, None)
+            if future is not None and not future.done():
+                try:
+                    candles = self._parse_candles_data(
+                        data.get("candles", []), asset, int(period)
+                    )
+                except Exception as e:
+                    if self.enable_logging:
+                        logger.error(f"Error processing candles data: {e}")
+                    candles = []
+                if self.enable_logging:
+                    logger.info(f"🕯️ Parsed {len(candles)} candles from response")
+                future.set_result(candles)
                 if self.enable_logging:
-                    logger.error(f"Error processing candles data: {e}")
-                for request_id, future in list(self._candle_requests.items()):
-                    if not future.done():
-                        future.set_result([])
-                        break
+                    logger.debug("Resolved candle request: {}", request_id)
         await self._emit_event("candles_received", data)
 
     async def _on_disconnected(self, data: Dict[str, Any]) -> None:
         """Handle disconnection event"""
         if self.enable_logging:
             logger.warning("Disconnected from PocketOption")
+        self._disconnected_event.set()
         await self._emit_event("disconnected", data)
 
     async def _handle_candles_stream(self, data: Dict[str, Any]) -> None:
@@ -1224,10 +1464,7 @@ class AsyncPocketOptionClient:
             request_id = f"{asset}_{period}"
             if self.enable_logging:
                 logger.info(f"🕯️ Processing candle stream for {asset} ({period}s)")
-            if (
-                hasattr(self, "_candle_requests")
-                and request_id in self._candle_requests
-            ):
+            if request_id in self._candle_requests:
                 future = self._candle_requests[request_id]
                 if not future.done():
                     candles = self._parse_stream_candles(data, asset, period)
@@ -1250,32 +1487,36 @@ class AsyncPocketOptionClient:
         try:
             candle_data = stream_data.get("data") or stream_data.get("candles") or []
             if isinstance(candle_data, list):
+                # Fields are coerced here, so skip per-field validation and
+                # only enforce the high/low invariant Candle validates
+                construct = Candle.model_construct
                 for item in candle_data:
                     if isinstance(item, dict):
-                        candle = Candle(
-                            timestamp=datetime.fromtimestamp(item.get("time", 0)),
-                            open=float(item.get("open", 0)),
-                            high=float(item.get("high", 0)),
-                            low=float(item.get("low", 0)),
-                            close=float(item.get("close", 0)),
-                            volume=float(item.get("volume", 0)),
-                            asset=asset,
-                            timeframe=timeframe,
-                        )
-                        candles.append(candle)
+                        get = item.get
+                        ts, open_ = get("time", 0), get("open", 0)
+                        close = get("close", 0)
+                        high, low = get("high", 0), get("low", 0)
+                        volume = get("volume", 0)
                     elif isinstance(item, (list, tuple)) and len(item) >= 6:
-                        candle = Candle(
-                            timestamp=datetime.fromtimestamp(item[0]),
-                            open=float(item[1]),
-                            high=float(item[3]),
-                            low=float(item[4]),
-                            close=float(item[2]),
-                            volume=float(item[5]) if len(item) > 5 else 0.0,
+                        ts, open_, close, high, low, volume = item[:6]
+                    else:
+                        continue
+                    high, low = float(high), float(low)
+                    if high < low:
+                        raise ValueError("High must be greater than or equal to low")
+                    candles.append(
+                        construct(
+                            timestamp=datetime.fromtimestamp(ts),
+                            open=float(open_),
+                            high=high,
+                            low=low,
+                            close=float(close),
+                            volume=float(volume),
                             asset=asset,
                             timeframe=timeframe,
                         )
-                        candles.append(candle)
-            candles.sort(key=lambda x: x.timestamp)
+                    )
+            candles.sort(key=_candle_timestamp)
         except Exception as e:
             if self.enable_logging:
                 logger.error(f"Error parsing stream candles: {e}")
@@ -1283,15 +1524,16 @@ class AsyncPocketOptionClient:
 
     async def _on_keep_alive_connected(self):
         """Handle event when keep-alive connection is established"""
-        logger.info("Keep-alive connection established")
+        if self.enable_logging:
+            logger.info("Keep-alive connection established")
 
         # Initialize data after connection
         await self._initialize_data()
 
         # Emit event
-        for callback in self._event_callbacks.get("connected", []):
+        for is_coro, callback in self._event_callbacks_snapshot.get("connected", ()):
             try:
-                if asyncio.iscoroutinefunction(callback):
+                if is_coro:
                     await callback()
                 else:
                     callback()
@@ -1300,15 +1542,16 @@ class AsyncPocketOptionClient:
 
     async def _on_keep_alive_reconnected(self):
         """Handle event when keep-alive connection is re-established"""
-        logger.info("Keep-alive connection re-established")
+        if self.enable_logging:
+            logger.info("Keep-alive connection re-established")
 
         # Re-initialize data
         await self._initialize_data()
 
         # Emit event
-        for callback in self._event_callbacks.get("reconnected", []):
+        for is_coro, callback in self._event_callbacks_snapshot.get("reconnected", ()):
             try:
-                if asyncio.iscoroutinefunction(callback):
+                if is_coro:
                     await callback()
                 else:
                     callback()
@@ -1318,36 +1561,22 @@ class AsyncPocketOptionClient:
     async def _on_keep_alive_message(self, message):
         """Handle messages received via keep-alive connection"""
         # Process the message
-        if message.startswith("42"):
+        if message[:2] in ("42", b"42"):
             try:
                 # Parse the message (remove the 42 prefix and parse JSON)
-                data_str = message[2:]
-                data = json.loads(data_str)
+                data = json.loads(message[2:])
 
                 if isinstance(data, list) and len(data) >= 2:
-                    event_type = data[0]
-                    event_data = data[1]
-
-                    # Process different event types
-                    if event_type == "authenticated":
-                        await self._on_authenticated(event_data)
-                    elif event_type == "balance_data":
-                        await self._on_balance_data(event_data)
-                    elif event_type == "balance_updated":
-                        await self._on_balance_updated(event_data)
-                    elif event_type == "order_opened":
-                        await self._on_order_opened(event_data)
-                    elif event_type == "order_closed":
-                        await self._on_order_closed(event_data)
-                    elif event_type == "stream_update":
-                        await self._on_stream_update(event_data)
+                    handler = self._keep_alive_dispatch.get(data[0])
+                    if handler is not None:
+                        await handler(data[1])
             except Exception as e:
                 logger.error(f"Error processing keep-alive message: {e}")
 
         # Emit raw message event
-        for callback in self._event_callbacks.get("message", []):
+        for is_coro, callback in self._event_callbacks_snapshot.get("message", ()):
             try:
-                if asyncio.iscoroutinefunction(callback):
+                if is_coro:
                     await callback(message)
                 else:
                     callback(message)
@@ -1376,8 +1605,10 @@ class AsyncPocketOptionClient:
                 else:
                     await self._websocket.disconnect()
 
-                # Wait a bit before reconnecting
-                await asyncio.sleep(2 + attempt)  # Progressive delay
+                # Exponential backoff with jitter so clients don't reconnect in step
+                await asyncio.sleep(
+                    min(30.0, 2.0 * (2**attempt)) * random.uniform(0.5, 1.5)
+                )
 
                 # Attempt to reconnect
                 if self.persistent_connection:
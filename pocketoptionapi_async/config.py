@@ -3,11 +3,11 @@ Configuration file for the async PocketOption API
 """
 
 import os
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 from typing import Dict, Any
 
 
-@dataclass
+@dataclass(frozen=True)
 class ConnectionConfig:
     """WebSocket connection configuration"""
 
@@ -19,7 +19,7 @@ class ConnectionConfig:
     message_timeout: int = 30
 
 
-@dataclass
+@dataclass(frozen=True)
 class TradingConfig:
     """Trading configuration"""
 
@@ -31,7 +31,7 @@ class TradingConfig:
     default_timeout: float = 30.0
 
 
-@dataclass
+@dataclass(frozen=True)
 class LoggingConfig:
     """Logging configuration"""
 
@@ -59,30 +59,39 @@ class Config:
         """Load configuration from environment variables"""
 
         # Connection settings
-        self.connection.ping_interval = int(
-            os.getenv("PING_INTERVAL", self.connection.ping_interval)
-        )
-        self.connection.ping_timeout = int(
-            os.getenv("PING_TIMEOUT", self.connection.ping_timeout)
-        )
-        self.connection.max_reconnect_attempts = int(
-            os.getenv("MAX_RECONNECT_ATTEMPTS", self.connection.max_reconnect_attempts)
+        self.connection = replace(
+            self.connection,
+            ping_interval=int(
+                os.getenv("PING_INTERVAL", self.connection.ping_interval)
+            ),
+            ping_timeout=int(os.getenv("PING_TIMEOUT", self.connection.ping_timeout)),
+            max_reconnect_attempts=int(
+                os.getenv(
+                    "MAX_RECONNECT_ATTEMPTS", self.connection.max_reconnect_attempts
+                )
+            ),
         )
 
         # Trading settings
-        self.trading.min_order_amount = float(
-            os.getenv("MIN_ORDER_AMOUNT", self.trading.min_order_amount)
-        )
-        self.trading.max_order_amount = float(
-            os.getenv("MAX_ORDER_AMOUNT", self.trading.max_order_amount)
-        )
-        self.trading.default_timeout = float(
-            os.getenv("DEFAULT_TIMEOUT", self.trading.default_timeout)
+        self.trading = replace(
+            self.trading,
+            min_order_amount=float(
+                os.getenv("MIN_ORDER_AMOUNT", self.trading.min_order_amount)
+            ),
+            max_order_amount=float(
+                os.getenv("MAX_ORDER_AMOUNT", self.trading.max_order_amount)
+            ),
+            default_timeout=float(
+                os.getenv("DEFAULT_TIMEOUT", self.trading.default_timeout)
+            ),
         )
 
         # Logging settings
-        self.logging.level = os.getenv("LOG_LEVEL", self.logging.level)
-        self.logging.log_file = os.getenv("LOG_FILE", self.logging.log_file)
+        self.logging = replace(
+            self.logging,
+            level=os.getenv("LOG_LEVEL", self.logging.level),
+            log_file=os.getenv("LOG_FILE", self.logging.log_file),
+        )
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert configuration to dictionary"""
@@ -3,6 +3,7 @@ Enhanced Keep-Alive Connection Manager for PocketOption Async API
 """
 
 import asyncio
+import random
 from typing import Optional, List, Callable, Dict, Any
 from datetime import datetime, timedelta
 from loguru import logger
@@ -10,7 +11,7 @@ from websockets.exceptions import ConnectionClosed
 from websockets.legacy.client import connect, WebSocketClientProtocol
 
 from models import ConnectionInfo, ConnectionStatus
-from constants import REGIONS
+from constants import REGIONS, CONNECTION_SETTINGS
 
 
 class ConnectionKeepAlive:
@@ -18,7 +19,13 @@ class ConnectionKeepAlive:
     Advanced connection keep-alive manager based on old API patterns
     """
 
-    def __init__(self, ssid: str, is_demo: bool = True):
+    def __init__(
+        self,
+        ssid: str,
+        is_demo: bool = True,
+        max_reconnect_attempts: int = 10,
+        reconnect_base_delay: float = 5.0,
+    ):
         self.ssid = ssid
         self.is_demo = is_demo
 
@@ -36,8 +43,9 @@ class ConnectionKeepAlive:
 
         # Keep-alive settings
         self.ping_interval = 20  # seconds (same as old API)
-        self.reconnect_delay = 5  # seconds
-        self.max_reconnect_attempts = 10
+        self.reconnect_base_delay = reconnect_base_delay  # seconds
+        self.max_reconnect_delay = 30.0  # seconds
+        self.max_reconnect_attempts = max_reconnect_attempts
         self.current_reconnect_attempts = 0
 
         # Event handlers
@@ -149,6 +157,7 @@ class ConnectionKeepAlive:
                         ping_interval=None,  # We handle pings manually
                         ping_timeout=None,
                         close_timeout=10,
+                        max_size=CONNECTION_SETTINGS["max_message_size"],
                     ),
                     timeout=15.0,
                 )
@@ -204,7 +213,7 @@ class ConnectionKeepAlive:
             initial_message = await asyncio.wait_for(
                 self.websocket.recv(), timeout=10.0
             )
-            logger.debug(f"Received initial: {initial_message}")
+            logger.debug("Received initial: {}", initial_message)
 
             # Send handshake sequence (like old API)
             await self.websocket.send("40")
@@ -212,7 +221,7 @@ class ConnectionKeepAlive:
 
             # Wait for connection establishment
             conn_message = await asyncio.wait_for(self.websocket.recv(), timeout=10.0)
-            logger.debug(f"Received connection: {conn_message}")
+            logger.debug("Received connection: {}", conn_message)
 
             # Send SSID authentication
             await self.websocket.send(self.ssid)
@@ -229,23 +238,31 @@ class ConnectionKeepAlive:
         logger.info("Persistent: Starting background keep-alive tasks...")
 
         # Ping task (every 20 seconds like old API)
-        self._ping_task = asyncio.create_task(self._ping_loop())
+        self._ping_task = asyncio.create_task(
+            self._ping_loop(), name="pocketoption.keep_alive.ping"
+        )
 
         # Message receiving task
-        self._message_task = asyncio.create_task(self._message_loop())
+        self._message_task = asyncio.create_task(
+            self._message_loop(), name="pocketoption.keep_alive.messages"
+        )
 
         # Health monitoring task
-        self._health_task = asyncio.create_task(self._health_monitor_loop())
+        self._health_task = asyncio.create_task(
+            self._health_monitor_loop(), name="pocketoption.keep_alive.health"
+        )
 
         # Reconnection monitoring task
-        self._reconnect_task = asyncio.create_task(self._reconnection_monitor())
+        self._reconnect_task = asyncio.create_task(
+            self._reconnection_monitor(), name="pocketoption.keep_alive.reconnect"
+        )
 
         logger.success("Success: All background tasks started")
 
     async def _ping_loop(self):
         """
         Continuous ping loop (like old API's send_ping function)
-        Sends '42["ps"]' every 20 seconds
+        Sends '42["ps"]' (or an engine.io ping where supported) every 20 seconds
         """
         logger.info("Ping: Starting ping loop...")
 
@@ -253,7 +270,11 @@ class ConnectionKeepAlive:
             try:
                 if self.is_connected and self.websocket:
                     # Send ping message (exact format from old API)
-                    await self.websocket.send('42["ps"]')
+                    await self.websocket.send(
+                        REGIONS.get_ping_message(self.connection_info.url)
+                        if self.connection_info
+                        else '42["ps"]'
+                    )
                     self.connection_stats["last_ping_time"] = datetime.now()
                     self.connection_stats["total_messages_sent"] += 1
 
@@ -376,16 +397,18 @@ class ConnectionKeepAlive:
                                 "reconnected",
                                 {
                                     "attempt": self.current_reconnect_attempts,
-                                    "url": self.connection_info.url
-                                    if self.connection_info
-                                    else None,
+                                    "url": (
+                                        self.connection_info.url
+                                        if self.connection_info
+                                        else None
+                                    ),
                                 },
                             )
                         else:
                             logger.error(
                                 f"Error: Reconnection attempt {self.current_reconnect_attempts} failed"
                             )
-                            await asyncio.sleep(self.reconnect_delay)
+                            await asyncio.sleep(self._reconnect_backoff_delay())
                     else:
                         logger.error(
                             f"Error: Max reconnection attempts ({self.max_reconnect_attempts}) reached"
@@ -399,6 +422,12 @@ class ConnectionKeepAlive:
             except Exception as e:
                 logger.error(f"Error: Reconnection monitor error: {e}")
 
+    def _reconnect_backoff_delay(self) -> float:
+        """Exponential backoff with jitter for the current reconnect attempt"""
+        exponent = min(max(self.current_reconnect_attempts - 1, 0), 6)
+        delay = min(self.max_reconnect_delay, self.reconnect_base_delay * 2**exponent)
+        return delay * random.uniform(0.5, 1.5)
+
     async def _process_message(self, message):
         """Process incoming messages (like old API's on_message)"""
         try:
@@ -406,7 +435,9 @@ class ConnectionKeepAlive:
             if isinstance(message, bytes):
                 message = message.decode("utf-8")
 
-            logger.debug(f"Message: Received: {message[:100]}...")
+            logger.opt(lazy=True).debug(
+                "Message: Received: {}...", lambda: message[:100]
+            )
 
             # Handle ping-pong (like old API)
             if message == "2":
@@ -434,7 +465,9 @@ class ConnectionKeepAlive:
             if self.is_connected and self.websocket:
                 await self.websocket.send(message)
                 self.connection_stats["total_messages_sent"] += 1
-                logger.debug(f"Message: Sent: {message[:50]}...")
+                logger.opt(lazy=True).debug(
+                    "Message: Sent: {}...", lambda: message[:50]
+                )
                 return True
             else:
                 logger.warning("Caution: Cannot send message: not connected")
@@ -481,9 +514,9 @@ class ConnectionKeepAlive:
             **self.connection_stats,
             "is_connected": self.is_connected,
             "current_url": self.connection_info.url if self.connection_info else None,
-            "current_region": self.connection_info.region
-            if self.connection_info
-            else None,
+            "current_region": (
+                self.connection_info.region if self.connection_info else None
+            ),
             "reconnect_attempts": self.current_reconnect_attempts,
             "uptime": (
                 datetime.now() - self.connection_info.connected_at
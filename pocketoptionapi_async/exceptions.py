@@ -48,3 +48,9 @@ class WebSocketError(PocketOptionError):
     """Raised when WebSocket operations fail"""
 
     pass
+
+
+class CircuitBreakerOpenError(PocketOptionError):
+    """Raised when a call is rejected by an open circuit breaker"""
+
+    pass
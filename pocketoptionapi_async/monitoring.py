@@ -3,14 +3,19 @@ Enhanced Error Handling and Monitoring for PocketOption API
 """
 
 import asyncio
+import heapq
 import time
-from typing import Dict, Any, List, Optional, Callable
-from datetime import datetime, timedelta
+from bisect import bisect_left
+from operator import itemgetter
+from typing import Dict, Any, List, Optional, Callable, Coroutine, Tuple, Union
+from datetime import datetime
 from dataclasses import dataclass
-from enum import Enum
-from collections import defaultdict, deque
+from enum import Enum, IntEnum
+from collections import Counter, defaultdict, deque
 from loguru import logger
 
+from .exceptions import CircuitBreakerOpenError
+
 
 class ErrorSeverity(Enum):
     """Error severity levels"""
@@ -20,6 +25,10 @@ class ErrorSeverity(Enum):
     HIGH = "high"
     CRITICAL = "critical"
 
+    def __init__(self, label: str):
+        # Plain attribute: cheaper to read than the ``value`` descriptor
+        self.label = label
+
 
 class ErrorCategory(Enum):
     """Error categories"""
@@ -31,12 +40,15 @@ class ErrorCategory(Enum):
     SYSTEM = "system"
     RATE_LIMIT = "rate_limit"
 
+    def __init__(self, label: str):
+        self.label = label
+
 
-@dataclass
+@dataclass(init=False)
 class ErrorEvent:
     """Error event data structure"""
 
-    timestamp: datetime
+    timestamp_ns: int  # epoch nanoseconds
     error_type: str
     severity: ErrorSeverity
     category: ErrorCategory
@@ -46,8 +58,39 @@ class ErrorEvent:
     resolved: bool = False
     resolution_time: Optional[datetime] = None
 
-
-@dataclass
+    def __init__(
+        self,
+        timestamp: Union[datetime, int],
+        error_type: str,
+        severity: ErrorSeverity,
+        category: ErrorCategory,
+        message: str,
+        context: Dict[str, Any],
+        stack_trace: Optional[str] = None,
+        resolved: bool = False,
+        resolution_time: Optional[datetime] = None,
+    ):
+        # timestamp still accepts the datetime events were built with before
+        # they stored epoch nanoseconds; an int is taken as nanoseconds
+        if isinstance(timestamp, datetime):
+            timestamp = round(timestamp.timestamp() * 1_000_000) * 1000
+        self.timestamp_ns = timestamp
+        self.error_type = error_type
+        self.severity = severity
+        self.category = category
+        self.message = message
+        self.context = context
+        self.stack_trace = stack_trace
+        self.resolved = resolved
+        self.resolution_time = resolution_time
+
+    @property
+    def timestamp(self) -> datetime:
+        """Time the error was recorded"""
+        return datetime.fromtimestamp(self.timestamp_ns / 1e9)
+
+
+@dataclass(frozen=True)
 class PerformanceMetrics:
     """Performance monitoring metrics"""
 
@@ -60,6 +103,14 @@ class PerformanceMetrics:
     active_connections: int = 0
 
 
+class CircuitState(IntEnum):
+    """Circuit breaker states"""
+
+    CLOSED = 0
+    OPEN = 1
+    HALF_OPEN = 2
+
+
 class CircuitBreaker:
     """Circuit breaker pattern implementation"""
 
@@ -76,18 +127,15 @@ class CircuitBreaker:
         self.expected_exception = expected_exception
         self.failure_count = 0
         self.last_failure_time = None
-        self.state = "CLOSED"  # CLOSED, OPEN, HALF_OPEN
+        self.state = CircuitState.CLOSED
 
     async def call(self, func: Callable, *args, **kwargs):
         """Execute function with circuit breaker protection"""
-        if self.state == "OPEN":
-            if (
-                self.last_failure_time is not None
-                and time.time() - self.last_failure_time < self.recovery_timeout
-            ):
-                raise Exception("Circuit breaker is OPEN")
-            else:
-                self.state = "HALF_OPEN"
+        # OPEN is only entered from on_failure, so last_failure_time is set
+        if self.state == CircuitState.OPEN:
+            if time.monotonic() - self.last_failure_time < self.recovery_timeout:
+                raise CircuitBreakerOpenError("Circuit breaker is OPEN")
+            self.state = CircuitState.HALF_OPEN
 
         try:
             result = await func(*args, **kwargs)
@@ -100,15 +148,15 @@ class CircuitBreaker:
     def on_success(self):
         """Handle successful operation"""
         self.failure_count = 0
-        self.state = "CLOSED"
+        self.state = CircuitState.CLOSED
 
     def on_failure(self):
         """Handle failed operation"""
         self.failure_count += 1
-        self.last_failure_time = time.time()
+        self.last_failure_time = time.monotonic()
 
         if self.failure_count >= self.failure_threshold:
-            self.state = "OPEN"
+            self.state = CircuitState.OPEN
             logger.warning(
                 f"Circuit breaker opened after {self.failure_count} failures"
             )
@@ -166,6 +214,75 @@ class RetryPolicy:
             raise Exception("RetryPolicy failed but no exception was captured.")
 
 
+class _ProfiledCoroutine:
+    """Drives a coroutine step by step, timing each step"""
+
+    def __init__(self, coro: Coroutine, stats: Dict[str, float]):
+        self._coro = coro
+        self._stats = stats
+
+    def __await__(self):
+        coro = self._coro
+        stats = self._stats
+        send_value = None
+        error = None
+        while True:
+            start = time.perf_counter()
+            try:
+                if error is not None:
+                    yielded = coro.throw(error)
+                else:
+                    yielded = coro.send(send_value)
+            except StopIteration as e:
+                return e.value
+            finally:
+                stats["busy_time"] += time.perf_counter() - start
+                stats["steps"] += 1
+
+            try:
+                send_value = yield yielded
+                error = None
+            except GeneratorExit:
+                coro.close()
+                raise
+            except BaseException as e:
+                send_value = None
+                error = e
+
+
+class TaskProfiler:
+    """
+    Lightweight per-task profiler
+
+    Records, per task name, how long the task's coroutine spent running on the
+    event loop (busy time, excluding time suspended in awaits), how many steps
+    it took, and its total wall time once finished.
+    """
+
+    def __init__(self):
+        self._stats: Dict[str, Dict[str, float]] = {}
+
+    def wrap(self, coro: Coroutine, name: str) -> Coroutine:
+        """Wrap a coroutine so its execution is recorded under name"""
+        stats = self._stats.setdefault(
+            name, {"runs": 0, "steps": 0, "busy_time": 0.0, "wall_time": 0.0}
+        )
+
+        async def profiled():
+            stats["runs"] += 1
+            start = time.perf_counter()
+            try:
+                return await _ProfiledCoroutine(coro, stats)
+            finally:
+                stats["wall_time"] += time.perf_counter() - start
+
+        return profiled()
+
+    def get_stats(self) -> Dict[str, Dict[str, float]]:
+        """Get cumulative statistics per task name"""
+        return {name: dict(stats) for name, stats in self._stats.items()}
+
+
 class ErrorMonitor:
     """Comprehensive error monitoring and handling system"""
 
@@ -178,7 +295,10 @@ class ErrorMonitor:
 
         self.errors: deque = deque(maxlen=max_errors)
         self.error_counts: Dict[str, int] = defaultdict(int)
-        self.error_patterns: Dict[str, List[datetime]] = defaultdict(list)
+        # Monotonic timestamps per error type (append-only, so sorted) and
+        # the index of the first one still inside the alert window
+        self.error_patterns: Dict[str, List[float]] = defaultdict(list)
+        self._pattern_starts: Dict[str, int] = defaultdict(int)
         self.alert_callbacks: List[Callable] = []
 
         # Circuit breakers for different operations
@@ -209,8 +329,48 @@ class ErrorMonitor:
         stack_trace: Optional[str] = None,
     ):
         """Record an error event"""
+        error_event = self._store_error(
+            error_type, severity, category, message, context, stack_trace
+        )
+
+        # Check for alert conditions
+        await self._check_alert_conditions(error_event)
+
+        return error_event
+
+    async def record_errors_bulk(
+        self, records: List[Dict[str, Any]]
+    ) -> List[ErrorEvent]:
+        """
+        Record several error events at once
+
+        Args:
+            records: One dict of record_error keyword arguments per error
+
+        Returns:
+            List[ErrorEvent]: The recorded error events
+        """
+        events = [self._store_error(**record) for record in records]
+
+        # Check alert conditions once per error type, using its latest event
+        latest = {event.error_type: event for event in events}
+        for error_event in latest.values():
+            await self._check_alert_conditions(error_event)
+
+        return events
+
+    def _store_error(
+        self,
+        error_type: str,
+        severity: ErrorSeverity,
+        category: ErrorCategory,
+        message: str,
+        context: Optional[Dict[str, Any]] = None,
+        stack_trace: Optional[str] = None,
+    ) -> ErrorEvent:
+        """Create and store an error event"""
         error_event = ErrorEvent(
-            timestamp=datetime.now(),
+            timestamp=time.time_ns(),
             error_type=error_type,
             severity=severity,
             category=category,
@@ -221,29 +381,31 @@ class ErrorMonitor:
 
         self.errors.append(error_event)
         self.error_counts[error_type] += 1
-        self.error_patterns[error_type].append(error_event.timestamp)
-
-        # Check for alert conditions
-        await self._check_alert_conditions(error_event)
+        self.error_patterns[error_type].append(time.monotonic())
 
-        logger.error(f"[{severity.value.upper()}] {category.value}: {message}")
+        logger.error(f"[{severity.label.upper()}] {category.label}: {message}")
 
         return error_event
 
     async def _check_alert_conditions(self, error_event: ErrorEvent):
         """Check if alert conditions are met"""
-        current_time = datetime.now()
-        window_start = current_time - timedelta(seconds=self.alert_window)
-
-        # Count recent errors of the same type
-        recent_errors = [
-            timestamp
-            for timestamp in self.error_patterns[error_event.error_type]
-            if timestamp >= window_start
-        ]
+        error_type = error_event.error_type
+        timestamps = self.error_patterns[error_type]
+
+        # Find the window start, then compact once half the list is stale
+        start = bisect_left(
+            timestamps,
+            time.monotonic() - self.alert_window,
+            self._pattern_starts[error_type],
+        )
+        if start > len(timestamps) // 2:
+            del timestamps[:start]
+            start = 0
+        self._pattern_starts[error_type] = start
 
-        if len(recent_errors) >= self.alert_threshold:
-            await self._trigger_alert(error_event, len(recent_errors))
+        recent_count = len(timestamps) - start
+        if recent_count >= self.alert_threshold:
+            await self._trigger_alert(error_event, recent_count)
 
     async def _trigger_alert(self, error_event: ErrorEvent, error_count: int):
         """Trigger alert for high error rate"""
@@ -269,33 +431,28 @@ class ErrorMonitor:
 
     def get_error_summary(self, hours: int = 24) -> Dict[str, Any]:
         """Get error summary for the specified time period"""
-        cutoff_time = datetime.now() - timedelta(hours=hours)
+        cutoff_ns = time.time_ns() - int(hours * 3600e9)
 
+        # Wall-clock timestamps can step backwards, so filter every event
         recent_errors = [
-            error for error in self.errors if error.timestamp >= cutoff_time
+            error for error in self.errors if error.timestamp_ns >= cutoff_ns
         ]
 
-        summary = {
+        by_type = Counter(error.error_type for error in recent_errors)
+
+        return {
             "total_errors": len(recent_errors),
-            "error_by_type": defaultdict(int),
-            "error_by_category": defaultdict(int),
-            "error_by_severity": defaultdict(int),
-            "top_errors": [],
+            "error_by_type": by_type,
+            "error_by_category": Counter(
+                error.category.label for error in recent_errors
+            ),
+            "error_by_severity": Counter(
+                error.severity.label for error in recent_errors
+            ),
+            "top_errors": heapq.nlargest(10, by_type.items(), key=itemgetter(1)),
             "error_rate": len(recent_errors) / hours if hours > 0 else 0,
         }
 
-        for error in recent_errors:
-            summary["error_by_type"][error.error_type] += 1
-            summary["error_by_category"][error.category.value] += 1
-            summary["error_by_severity"][error.severity.value] += 1
-
-        # Get top errors
-        summary["top_errors"] = sorted(
-            summary["error_by_type"].items(), key=lambda x: x[1], reverse=True
-        )[:10]
-
-        return summary
-
     async def execute_with_monitoring(
         self,
         func: Callable,
@@ -310,19 +467,20 @@ class ErrorMonitor:
         start_time = time.time()
 
         try:
+            key = category.label
             # Apply circuit breaker if requested
-            if use_circuit_breaker and category.value in self.circuit_breakers:
-                circuit_breaker = self.circuit_breakers[category.value]
+            if use_circuit_breaker and key in self.circuit_breakers:
+                circuit_breaker = self.circuit_breakers[key]
 
-                if use_retry and category.value in self.retry_policies:
-                    retry_policy = self.retry_policies[category.value]
+                if use_retry and key in self.retry_policies:
+                    retry_policy = self.retry_policies[key]
                     result = await circuit_breaker.call(
                         retry_policy.execute, func, *args, **kwargs
                     )
                 else:
                     result = await circuit_breaker.call(func, *args, **kwargs)
-            elif use_retry and category.value in self.retry_policies:
-                retry_policy = self.retry_policies[category.value]
+            elif use_retry and key in self.retry_policies:
+                retry_policy = self.retry_policies[key]
                 result = await retry_policy.execute(func, *args, **kwargs)
             else:
                 result = await func(*args, **kwargs)
@@ -357,8 +515,9 @@ class ErrorMonitor:
 class HealthChecker:
     """System health monitoring"""
 
-    def __init__(self, check_interval: int = 30):
+    def __init__(self, check_interval: int = 30, max_concurrent_checks: int = 32):
         self.check_interval = check_interval
+        self.max_concurrent_checks = max_concurrent_checks
         self.health_checks: Dict[str, Callable] = {}
         self.health_status: Dict[str, Dict[str, Any]] = {}
         self._running = False
@@ -371,7 +530,9 @@ class HealthChecker:
     async def start_monitoring(self):
         """Start health monitoring"""
         self._running = True
-        self._health_task = asyncio.create_task(self._health_check_loop())
+        self._health_task = asyncio.create_task(
+            self._health_check_loop(), name="pocketoption.health_check"
+        )
 
     async def stop_monitoring(self):
         """Stop health monitoring"""
@@ -387,26 +548,16 @@ class HealthChecker:
         """Main health check loop"""
         while self._running:
             try:
-                for name, check_func in self.health_checks.items():
-                    try:
-                        start_time = time.time()
-                        result = await check_func()
-                        duration = time.time() - start_time
-
-                        self.health_status[name] = {
-                            "status": "healthy" if result else "unhealthy",
-                            "last_check": datetime.now(),
-                            "response_time": duration,
-                            "details": result if isinstance(result, dict) else {},
-                        }
-
-                    except Exception as e:
-                        self.health_status[name] = {
-                            "status": "error",
-                            "last_check": datetime.now(),
-                            "error": str(e),
-                            "response_time": None,
-                        }
+                # Run all checks concurrently so a cycle takes as long as the
+                # slowest check rather than the sum of them
+                semaphore = asyncio.Semaphore(self.max_concurrent_checks)
+                results = await asyncio.gather(
+                    *(
+                        self._run_check(name, check_func, semaphore)
+                        for name, check_func in list(self.health_checks.items())
+                    )
+                )
+                self.health_status.update(results)
 
                 await asyncio.sleep(self.check_interval)
 
@@ -416,6 +567,31 @@ class HealthChecker:
                 logger.error(f"Health check loop error: {e}")
                 await asyncio.sleep(self.check_interval)
 
+    async def _run_check(
+        self, name: str, check_func: Callable, semaphore: asyncio.Semaphore
+    ) -> Tuple[str, Dict[str, Any]]:
+        """Run one health check and return its (name, status) pair"""
+        async with semaphore:
+            try:
+                start_time = time.time()
+                result = await check_func()
+                duration = time.time() - start_time
+
+                return name, {
+                    "status": "healthy" if result else "unhealthy",
+                    "last_check": datetime.now(),
+                    "response_time": duration,
+                    "details": result if isinstance(result, dict) else {},
+                }
+
+            except Exception as e:
+                return name, {
+                    "status": "error",
+                    "last_check": datetime.now(),
+                    "error": str(e),
+                    "response_time": None,
+                }
+
     def get_health_report(self) -> Dict[str, Any]:
         """Get comprehensive health report"""
         overall_status = "healthy"
@@ -15,9 +15,38 @@ from websockets.legacy.client import WebSocketClientProtocol
 from loguru import logger
 
 from .models import ConnectionInfo, ConnectionStatus, ServerTime
-from .constants import CONNECTION_SETTINGS, DEFAULT_HEADERS
+from .constants import CONNECTION_SETTINGS, DEFAULT_HEADERS, REGIONS
 from .exceptions import WebSocketError, ConnectionError
 
+_ssl_context: Optional[ssl.SSLContext] = None
+
+
+def _get_ssl_context() -> ssl.SSLContext:
+    """Get the process-wide SSL context shared by all client connections"""
+    global _ssl_context
+    if _ssl_context is None:
+        _ssl_context = ssl.SSLContext(ssl.PROTOCOL_TLS_CLIENT)
+        _ssl_context.check_hostname = False
+        _ssl_context.verify_mode = ssl.CERT_NONE
+    return _ssl_context
+
+
+# Payloads at least this large (e.g. candle histories) are decoded in a worker
+# thread so the event loop keeps serving pings and other messages meanwhile
+_THREADED_JSON_SIZE = 64 * 1024
+
+
+# Most queued messages written per writer wakeup, so one burst of requests
+# cannot hold the writer (and its buffer) indefinitely
+_WRITER_BATCH_SIZE = 64
+
+
+async def _json_loads(payload):
+    """Decode a JSON payload, off the event loop when it is large"""
+    if len(payload) >= _THREADED_JSON_SIZE:
+        return await asyncio.to_thread(json.loads, payload)
+    return json.loads(payload)
+
 
 class MessageBatcher:
     """Batch messages to improve performance"""
@@ -123,9 +152,17 @@ class AsyncWebSocketClient:
         self.connection_info: Optional[ConnectionInfo] = None
         self.server_time: Optional[ServerTime] = None
         self._ping_task: Optional[asyncio.Task] = None
+        self._pong_task: Optional[asyncio.Task] = None
+        self._writer_task: Optional[asyncio.Task] = None
+        self._receive_task: Optional[asyncio.Task] = None
         self._message_queue: asyncio.Queue = asyncio.Queue()
+        # Outgoing (message, future) pairs written by _writer_loop; the
+        # optional future is failed if its message cannot be sent
+        self._send_queue: asyncio.Queue = asyncio.Queue()
         self._event_handlers: Dict[str, List[Callable]] = {}
         self._running = False
+        # time.monotonic() of the last received message, used for idle pings
+        self.last_recv_ts = 0.0
         self._reconnect_attempts = 0
         self._max_reconnect_attempts = CONNECTION_SETTINGS["max_reconnect_attempts"]
 
@@ -148,37 +185,33 @@ class AsyncWebSocketClient:
 
     async def connect(self, urls: List[str], ssid: str) -> bool:
         """
-        Connect to PocketOption WebSocket with fallback URLs
+        Connect to PocketOption WebSocket, racing the given URLs
 
         Args:
-            urls: List of WebSocket URLs to try
+            urls: WebSocket URLs to race; the first to complete the
+                engine.io handshake wins
             ssid: Session ID for authentication
 
         Returns:
             bool: True if connected successfully
         """
-        for url in urls:
+        # Drop whatever the previous connection left running or queued
+        await self._stop_background_tasks()
+
+        # Race the endpoints' open and engine.io handshake; only the winner
+        # is sent the session credentials
+        connected = await self._connect_first(urls)
+        if connected is not None:
+            url, ws, namespace_open = connected
             try:
-                logger.info(f"Attempting to connect to {url}")
-
-                # SSL context setup
-                ssl_context = ssl.SSLContext(ssl.PROTOCOL_TLS_CLIENT)
-                ssl_context.check_hostname = False
-                ssl_context.verify_mode = ssl.CERT_NONE
-
-                # Connect with timeout
-                ws = await asyncio.wait_for(
-                    websockets.connect(
-                        url,
-                        ssl=ssl_context,
-                        extra_headers=DEFAULT_HEADERS,
-                        ping_interval=CONNECTION_SETTINGS["ping_interval"],
-                        ping_timeout=CONNECTION_SETTINGS["ping_timeout"],
-                        close_timeout=CONNECTION_SETTINGS["close_timeout"],
-                    ),
-                    timeout=10.0,
-                )
+                if namespace_open:
+                    # Send SSID authentication (like old API)
+                    await ws.send(ssid)
+                    logger.debug("Sent SSID authentication")
+                logger.debug("Handshake sequence completed")
+
                 self.websocket = ws  # type: ignore
+                self.last_recv_ts = time.monotonic()
                 # Update connection info
                 region = self._extract_region_from_url(url)
                 self.connection_info = ConnectionInfo(
@@ -193,9 +226,6 @@ class AsyncWebSocketClient:
                 # Start message handling
                 self._running = True
 
-                # Send initial handshake and wait for completion
-                await self._send_handshake(ssid)
-
                 # Start background tasks after handshake is complete
                 await self._start_background_tasks()
 
@@ -204,13 +234,80 @@ class AsyncWebSocketClient:
 
             except Exception as e:
                 logger.warning(f"Failed to connect to {url}: {e}")
-                if self.websocket:
-                    await self.websocket.close()
-                    self.websocket = None
-                continue
+                self.websocket = None
+                await ws.close()
 
         raise ConnectionError("Failed to connect to any WebSocket endpoint")
 
+    async def _open(self, url: str):
+        """Open a WebSocket to url, returning (url, websocket)"""
+        logger.info(f"Attempting to connect to {url}")
+        ws = await asyncio.wait_for(
+            websockets.connect(
+                url,
+                ssl=_get_ssl_context(),
+                extra_headers=DEFAULT_HEADERS,
+                # Heartbeats are sent as unsolicited pongs by _pong_loop
+                ping_interval=None,
+                close_timeout=CONNECTION_SETTINGS["close_timeout"],
+                max_size=CONNECTION_SETTINGS["max_message_size"],
+            ),
+            timeout=10.0,
+        )
+        return url, ws
+
+    async def _try_one_region(self, url: str):
+        """Open a WebSocket to url and run the engine.io handshake on it"""
+        url, ws = await self._open(url)
+        try:
+            namespace_open = await self._engine_handshake(ws)
+        except BaseException:
+            # Includes cancellation when another region won the race
+            await ws.close()
+            raise
+        return url, ws, namespace_open
+
+    async def _connect_first(self, urls: List[str]):
+        """
+        Connect to all urls concurrently and keep the first whose handshake succeeds
+
+        Returns:
+            (url, websocket, namespace_open) of the winner, or None if every
+            attempt failed
+        """
+        tasks = {
+            asyncio.create_task(
+                self._try_one_region(url), name=f"pocketoption.ws.open:{url}"
+            ): url
+            for url in urls
+        }
+        pending = set(tasks)
+        winner = None
+        try:
+            while pending and winner is None:
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    if task.exception() is not None:
+                        logger.warning(
+                            f"Failed to connect to {tasks[task]}: {task.exception()}"
+                        )
+                    elif winner is None:
+                        winner = task.result()
+                    else:
+                        # Another endpoint connected in the same round
+                        await task.result()[1].close()
+        finally:
+            # Cancel the losers; any that opened anyway are closed
+            for task in pending:
+                task.cancel()
+            for result in await asyncio.gather(*pending, return_exceptions=True):
+                if isinstance(result, tuple):
+                    await result[1].close()
+
+        return winner
+
     async def _handle_payout_message(self, message: str) -> None:
         """
         Handles messages related to asset payout information.
@@ -266,7 +363,7 @@ class AsyncWebSocketClient:
                             "type": asset_type,
                             "payout": payout_percentage,
                         }
-                        logger.debug(f"Parsed payout info: {payout_info}")
+                        logger.debug("Parsed payout info: {}", payout_info)
                         # Emit an event with the parsed payout data
                         await self._emit_event("payout_update", payout_info)
                     except IndexError:
@@ -298,12 +395,7 @@ class AsyncWebSocketClient:
         self._running = False
 
         # Cancel background tasks
-        if self._ping_task and not self._ping_task.done():
-            self._ping_task.cancel()
-            try:
-                await self._ping_task
-            except asyncio.CancelledError:
-                pass
+        await self._stop_background_tasks()
 
         # Close WebSocket connection
         if self.websocket:
@@ -332,11 +424,30 @@ class AsyncWebSocketClient:
 
         try:
             await self.websocket.send(message)
-            logger.debug(f"Sent message: {message}")
+            logger.debug("Sent message: {}", message)
         except Exception as e:
             logger.error(f"Failed to send message: {e}")
             raise WebSocketError(f"Failed to send message: {e}")
 
+    def queue_message(
+        self, message: str, future: Optional[asyncio.Future] = None
+    ) -> None:
+        """
+        Queue a message for the writer task without waiting for the socket
+
+        Messages queued together are written back to back in one writer
+        wakeup, in order. Each stays its own frame, since every socket.io
+        packet must be a separate WebSocket message.
+
+        Args:
+            message: Message to send
+            future: Optional future waiting on the reply to this message; it
+                is failed with WebSocketError if the message cannot be sent
+        """
+        if not self.websocket or self.websocket.closed:
+            raise WebSocketError("WebSocket is not connected")
+        self._send_queue.put_nowait((message, future))
+
     async def send_message_optimized(self, message: str) -> None:
         """
         Send message with batching optimization
@@ -358,7 +469,7 @@ class AsyncWebSocketClient:
                 if batch:
                     for msg in batch:
                         await self.websocket.send(msg)
-                        logger.debug(f"Sent batched message: {msg}")
+                        logger.debug("Sent batched message: {}", msg)
 
                 # Update connection stats
                 response_time = time.time() - start_time
@@ -386,6 +497,7 @@ class AsyncWebSocketClient:
                         self.websocket.recv(),
                         timeout=CONNECTION_SETTINGS["message_timeout"],
                     )
+                    self.last_recv_ts = time.monotonic()
                     await self._process_message(message)
 
                 except asyncio.TimeoutError:
@@ -426,17 +538,20 @@ class AsyncWebSocketClient:
             except ValueError:
                 pass
 
-    async def _send_handshake(self, ssid: str) -> None:
-        """Send initial handshake messages (following old API pattern exactly)"""
+    async def _engine_handshake(self, ws) -> bool:
+        """
+        Answer the server's engine.io open ("0") and wait for the namespace ("40")
+
+        Returns:
+            bool: True if the namespace was opened and the SSID can be sent
+        """
         try:
             # Wait for initial connection message with "0" and "sid" (like old API)
             logger.debug("Waiting for initial handshake message...")
-            if not self.websocket:
+            if not ws:
                 raise WebSocketError("WebSocket is not connected during handshake")
-            initial_message = await asyncio.wait_for(
-                self.websocket.recv(), timeout=10.0
-            )
-            logger.debug(f"Received initial: {initial_message}")
+            initial_message = await asyncio.wait_for(ws.recv(), timeout=10.0)
+            logger.debug("Received initial: {}", initial_message)
 
             # Ensure initial_message is a string
             if isinstance(initial_message, memoryview):
@@ -447,14 +562,12 @@ class AsyncWebSocketClient:
             # Check if it's the expected initial message format
             if initial_message.startswith("0") and "sid" in initial_message:
                 # Send "40" response (like old API)
-                await self.send_message("40")
+                await ws.send("40")
                 logger.debug("Sent '40' response")
 
                 # Wait for connection establishment message with "40" and "sid"
-                conn_message = await asyncio.wait_for(
-                    self.websocket.recv(), timeout=10.0
-                )
-                logger.debug(f"Received connection: {conn_message}")
+                conn_message = await asyncio.wait_for(ws.recv(), timeout=10.0)
+                logger.debug("Received connection: {}", conn_message)
 
                 # Ensure conn_message is a string
                 if isinstance(conn_message, memoryview):
@@ -464,17 +577,12 @@ class AsyncWebSocketClient:
                 else:
                     conn_message_str = conn_message
                 if conn_message_str.startswith("40") and "sid" in conn_message_str:
-                    # Send SSID authentication (like old API)
-                    await self.send_message(ssid)
-                    logger.debug("Sent SSID authentication")
-                else:
-                    logger.warning(
-                        f"Unexpected connection message format: {conn_message}"
-                    )
+                    return True
+                logger.warning(f"Unexpected connection message format: {conn_message}")
             else:
                 logger.warning(f"Unexpected initial message format: {initial_message}")
 
-            logger.debug("Handshake sequence completed")
+            return False
 
         except asyncio.TimeoutError:
             logger.error("Handshake timeout - server didn't respond as expected")
@@ -486,19 +594,80 @@ class AsyncWebSocketClient:
     async def _start_background_tasks(self) -> None:
         """Start background tasks"""
         # Start ping task
-        self._ping_task = asyncio.create_task(self._ping_loop())
+        self._ping_task = asyncio.create_task(
+            self._ping_loop(), name="pocketoption.ws.ping"
+        )
+
+        # Start websocket-level heartbeat task
+        self._pong_task = asyncio.create_task(
+            self._pong_loop(CONNECTION_SETTINGS["ping_interval"]),
+            name="pocketoption.ws.heartbeat",
+        )
+
+        # Start writer for queued messages
+        self._writer_task = asyncio.create_task(
+            self._writer_loop(), name="pocketoption.ws.writer"
+        )
 
         # Start message receiving task (only start it once here)
-        asyncio.create_task(self.receive_messages())
+        self._receive_task = asyncio.create_task(
+            self.receive_messages(), name="pocketoption.ws.receive"
+        )
+
+    async def _stop_background_tasks(self) -> None:
+        """Cancel the connection's background tasks and drop queued messages"""
+        current = asyncio.current_task()
+        tasks = [
+            task
+            for task in (
+                self._ping_task,
+                self._pong_task,
+                self._writer_task,
+                self._receive_task,
+            )
+            if task and task is not current and not task.done()
+        ]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+        # Queued messages belong to the old socket; fail their waiters so
+        # callers can retry on the next connection
+        queue = self._send_queue
+        unsent = []
+        while not queue.empty():
+            unsent.append(queue.get_nowait())
+        self._fail_unsent(unsent, WebSocketError("WebSocket is not connected"))
+
+    @staticmethod
+    def _fail_unsent(items: List[tuple], error: Exception) -> None:
+        """Fail the futures waiting on unsent (message, future) pairs"""
+        for _, future in items:
+            if future is not None and not future.done():
+                future.set_exception(error)
 
     async def _ping_loop(self) -> None:
-        """Send periodic ping messages"""
+        """
+        Send keep-alive pings while the connection is idle
+
+        A ping is only sent once nothing has been received for a full ping
+        interval, and the loop wakes up when that interval would run out.
+        """
+        interval = CONNECTION_SETTINGS["ping_interval"]
+        info = self.connection_info
+        ping_message = REGIONS.get_ping_message(info.url if info else "")
+        idle = 0.0
         while self._running and self.websocket:
             try:
-                await asyncio.sleep(CONNECTION_SETTINGS["ping_interval"])
+                await asyncio.sleep(max(1.0, interval - idle))
+
+                idle = time.monotonic() - self.last_recv_ts
+                if idle < interval:
+                    continue
 
                 if self.websocket and not self.websocket.closed:
-                    await self.send_message('42["ps"]')
+                    await self.send_message(ping_message)
+                    idle = 0.0
 
                     # Update last ping time
                     if self.connection_info:
@@ -515,6 +684,76 @@ class AsyncWebSocketClient:
                 logger.error(f"Ping failed: {e}")
                 break
 
+    async def _writer_loop(self) -> None:
+        """Write queued messages, draining everything ready in one pass"""
+        queue = self._send_queue
+        while self._running and self.websocket:
+            batch = [await queue.get()]
+            while len(batch) < _WRITER_BATCH_SIZE and not queue.empty():
+                batch.append(queue.get_nowait())
+
+            sent = 0
+            try:
+                for message, _ in batch:
+                    await self.websocket.send(message)
+                    sent += 1
+                logger.debug("Sent {} queued message(s)", sent)
+            except ConnectionClosed:
+                self._fail_unsent(
+                    batch[sent:], WebSocketError("WebSocket is not connected")
+                )
+                break
+            except asyncio.CancelledError:
+                self._fail_unsent(
+                    batch[sent:], WebSocketError("WebSocket is not connected")
+                )
+                raise
+            except Exception as e:
+                logger.error(f"Failed to send queued messages: {e}")
+                self._fail_unsent(
+                    batch[sent:], WebSocketError(f"Failed to send message: {e}")
+                )
+
+    async def _pong_loop(self, interval: float) -> None:
+        """
+        Send unsolicited pong frames as a one-way heartbeat
+
+        Unlike a ping, a pong expects no reply, so the heartbeat never waits on
+        the same connection that the receive loop is reading from. Since pongs
+        cannot detect a dead peer, a connection that has received nothing for
+        two intervals is treated as lost.
+        """
+        idle_deadline = 2 * interval
+        while self._running and self.websocket:
+            try:
+                await asyncio.sleep(interval)
+
+                ws = self.websocket
+                if ws is None or ws.closed:
+                    break
+
+                if time.monotonic() - self.last_recv_ts > idle_deadline:
+                    logger.warning(
+                        "Nothing received for {:.0f}s, dropping connection",
+                        idle_deadline,
+                    )
+                    # The receive task is cancelled by _handle_disconnect
+                    # before the close runs, so the drop is reported once
+                    close_task = asyncio.create_task(
+                        ws.close(), name="pocketoption.ws.close_idle"
+                    )
+                    await self._handle_disconnect()
+                    await close_task
+                    break
+
+                await ws.pong()
+
+            except ConnectionClosed:
+                break
+            except Exception as e:
+                logger.error(f"Heartbeat failed: {e}")
+                break
+
     async def _process_message(self, message) -> None:
         """
         Process incoming WebSocket message (following old API pattern exactly)
@@ -525,11 +764,10 @@ class AsyncWebSocketClient:
         try:
             # Handle bytes messages first (like old API) - these contain balance data
             if isinstance(message, bytes):
-                decoded_message = message.decode("utf-8")
                 try:
                     # Try to parse as JSON (like old API)
-                    json_data = json.loads(decoded_message)
-                    logger.debug(f"Received JSON bytes message: {json_data}")
+                    json_data = await _json_loads(message)
+                    logger.debug("Received JSON bytes message: {}", json_data)
 
                     # Handle balance data (like old API)
                     if "balance" in json_data:
@@ -552,9 +790,9 @@ class AsyncWebSocketClient:
                     else:
                         await self._emit_event("json_data", json_data)
 
-                except json.JSONDecodeError:
+                except (json.JSONDecodeError, UnicodeDecodeError):
                     # If not JSON, treat as regular bytes message
-                    logger.debug(f"Non-JSON bytes message: {decoded_message[:100]}...")
+                    logger.debug("Non-JSON bytes message: {}...", message[:100])
 
                 return
 
@@ -562,7 +800,7 @@ class AsyncWebSocketClient:
             if isinstance(message, bytes):
                 message = message.decode("utf-8")
 
-            logger.debug(f"Received message: {message}")
+            logger.debug("Received message: {}", message)
 
             # Handle different message types
             if message.startswith("0") and "sid" in message:
@@ -576,9 +814,8 @@ class AsyncWebSocketClient:
                 await self._emit_event("connected", {})
 
             elif message.startswith("451-["):
-                # Parse JSON message
-                json_part = message.split("-", 1)[1]
-                data = json.loads(json_part)
+                # Parse JSON message after the "451-" prefix
+                data = await _json_loads(message[4:])
                 await self._handle_json_message(data)
 
             elif message.startswith("42") and "NotAuthorized" in message:
@@ -626,7 +863,7 @@ class AsyncWebSocketClient:
             if isinstance(message, bytes):
                 message = message.decode("utf-8")
 
-            logger.debug(f"Received message: {message}")
+            logger.debug("Received message: {}", message)
 
             # Check cache first
             message_hash = hash(message)
@@ -718,6 +955,8 @@ class AsyncWebSocketClient:
 
     async def _handle_disconnect(self) -> None:
         """Handle WebSocket disconnection"""
+        await self._stop_background_tasks()
+
         if self.connection_info:
             self.connection_info = ConnectionInfo(
                 url=self.connection_info.url,